@@ -153,29 +153,80 @@ d = { 'settings': { 'branch': 'master',
             'numerblox.model': { 'numerblox.model.AwesomeDirectoryModel': ('model.html#awesomedirectorymodel', 'numerblox/model.py'),
                                  'numerblox.model.AwesomeDirectoryModel.__init__': ( 'model.html#awesomedirectorymodel.__init__',
                                                                                      'numerblox/model.py'),
-                                 'numerblox.model.AwesomeDirectoryModel.load_models': ( 'model.html#awesomedirectorymodel.load_models',
-                                                                                        'numerblox/model.py'),
+                                 'numerblox.model.AwesomeDirectoryModel.load_model': ( 'model.html#awesomedirectorymodel.load_model',
+                                                                                       'numerblox/model.py'),
                                  'numerblox.model.AwesomeModel': ('model.html#awesomemodel', 'numerblox/model.py'),
                                  'numerblox.model.AwesomeModel.__init__': ('model.html#awesomemodel.__init__', 'numerblox/model.py'),
                                  'numerblox.model.AwesomeModel.predict': ('model.html#awesomemodel.predict', 'numerblox/model.py'),
                                  'numerblox.model.BaseModel': ('model.html#basemodel', 'numerblox/model.py'),
                                  'numerblox.model.BaseModel.__call__': ('model.html#basemodel.__call__', 'numerblox/model.py'),
                                  'numerblox.model.BaseModel.__init__': ('model.html#basemodel.__init__', 'numerblox/model.py'),
+                                 'numerblox.model.BaseModel._cached_load': ('model.html#basemodel._cached_load', 'numerblox/model.py'),
+                                 'numerblox.model.BaseModel._get_features': ('model.html#basemodel._get_features', 'numerblox/model.py'),
+                                 'numerblox.model.BaseModel._predict_all_rows': ( 'model.html#basemodel._predict_all_rows',
+                                                                                  'numerblox/model.py'),
+                                 'numerblox.model.BaseModel._predict_selected_rows': ( 'model.html#basemodel._predict_selected_rows',
+                                                                                       'numerblox/model.py'),
+                                 'numerblox.model.BaseModel.artifact_paths': ('model.html#basemodel.artifact_paths', 'numerblox/model.py'),
                                  'numerblox.model.BaseModel.get_prediction_col_names': ( 'model.html#basemodel.get_prediction_col_names',
                                                                                          'numerblox/model.py'),
                                  'numerblox.model.BaseModel.predict': ('model.html#basemodel.predict', 'numerblox/model.py'),
+                                 'numerblox.model.BaseModel.used_features': ('model.html#basemodel.used_features', 'numerblox/model.py'),
+                                 'numerblox.model.BundleModel': ('model.html#bundlemodel', 'numerblox/model.py'),
+                                 'numerblox.model.BundleModel.__getstate__': ('model.html#bundlemodel.__getstate__', 'numerblox/model.py'),
+                                 'numerblox.model.BundleModel.__init__': ('model.html#bundlemodel.__init__', 'numerblox/model.py'),
+                                 'numerblox.model.BundleModel._cached_load': ('model.html#bundlemodel._cached_load', 'numerblox/model.py'),
+                                 'numerblox.model.BundleModel._member_view': ('model.html#bundlemodel._member_view', 'numerblox/model.py'),
+                                 'numerblox.model.BundleModel._predict_model': ( 'model.html#bundlemodel._predict_model',
+                                                                                 'numerblox/model.py'),
+                                 'numerblox.model.BundleModel.artifact_paths': ( 'model.html#bundlemodel.artifact_paths',
+                                                                                 'numerblox/model.py'),
+                                 'numerblox.model.BundleModel.load_model': ('model.html#bundlemodel.load_model', 'numerblox/model.py'),
+                                 'numerblox.model.BundleModel.used_features': ( 'model.html#bundlemodel.used_features',
+                                                                                'numerblox/model.py'),
                                  'numerblox.model.CatBoostModel': ('model.html#catboostmodel', 'numerblox/model.py'),
                                  'numerblox.model.CatBoostModel.__init__': ('model.html#catboostmodel.__init__', 'numerblox/model.py'),
-                                 'numerblox.model.CatBoostModel.load_models': ( 'model.html#catboostmodel.load_models',
-                                                                                'numerblox/model.py'),
+                                 'numerblox.model.CatBoostModel._predict_model': ( 'model.html#catboostmodel._predict_model',
+                                                                                   'numerblox/model.py'),
+                                 'numerblox.model.CatBoostModel.load_model': ('model.html#catboostmodel.load_model', 'numerblox/model.py'),
                                  'numerblox.model.ConstantModel': ('model.html#constantmodel', 'numerblox/model.py'),
                                  'numerblox.model.ConstantModel.__init__': ('model.html#constantmodel.__init__', 'numerblox/model.py'),
                                  'numerblox.model.ConstantModel.predict': ('model.html#constantmodel.predict', 'numerblox/model.py'),
+                                 'numerblox.model.ConstantModel.used_features': ( 'model.html#constantmodel.used_features',
+                                                                                  'numerblox/model.py'),
                                  'numerblox.model.DirectoryModel': ('model.html#directorymodel', 'numerblox/model.py'),
                                  'numerblox.model.DirectoryModel.__init__': ('model.html#directorymodel.__init__', 'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel.__init_subclass__': ( 'model.html#directorymodel.__init_subclass__',
+                                                                                       'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel._get_model': ( 'model.html#directorymodel._get_model',
+                                                                                'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel._iter_predictions': ( 'model.html#directorymodel._iter_predictions',
+                                                                                       'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel._load_model_from_load_models': ( 'model.html#directorymodel._load_model_from_load_models',
+                                                                                                  'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel._load_onnx_model': ( 'model.html#directorymodel._load_onnx_model',
+                                                                                      'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel._predict_model': ( 'model.html#directorymodel._predict_model',
+                                                                                    'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel._predict_rows': ( 'model.html#directorymodel._predict_rows',
+                                                                                   'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel._process_predictions': ( 'model.html#directorymodel._process_predictions',
+                                                                                          'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel.artifact_paths': ( 'model.html#directorymodel.artifact_paths',
+                                                                                    'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel.check_onnx': ( 'model.html#directorymodel.check_onnx',
+                                                                                'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel.iter_models': ( 'model.html#directorymodel.iter_models',
+                                                                                 'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel.load_model': ( 'model.html#directorymodel.load_model',
+                                                                                'numerblox/model.py'),
                                  'numerblox.model.DirectoryModel.load_models': ( 'model.html#directorymodel.load_models',
                                                                                  'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel.loader_name': ( 'model.html#directorymodel.loader_name',
+                                                                                 'numerblox/model.py'),
                                  'numerblox.model.DirectoryModel.predict': ('model.html#directorymodel.predict', 'numerblox/model.py'),
+                                 'numerblox.model.DirectoryModel.used_features': ( 'model.html#directorymodel.used_features',
+                                                                                   'numerblox/model.py'),
                                  'numerblox.model.ExamplePredictionsModel': ('model.html#examplepredictionsmodel', 'numerblox/model.py'),
                                  'numerblox.model.ExamplePredictionsModel.__init__': ( 'model.html#examplepredictionsmodel.__init__',
                                                                                        'numerblox/model.py'),
@@ -185,34 +236,135 @@ d = { 'settings': { 'branch': 'master',
                                                                                                   'numerblox/model.py'),
                                  'numerblox.model.ExamplePredictionsModel.predict': ( 'model.html#examplepredictionsmodel.predict',
                                                                                       'numerblox/model.py'),
+                                 'numerblox.model.ExamplePredictionsModel.used_features': ( 'model.html#examplepredictionsmodel.used_features',
+                                                                                            'numerblox/model.py'),
                                  'numerblox.model.ExternalCSVs': ('model.html#externalcsvs', 'numerblox/model.py'),
                                  'numerblox.model.ExternalCSVs.__init__': ('model.html#externalcsvs.__init__', 'numerblox/model.py'),
                                  'numerblox.model.ExternalCSVs._get_preds': ('model.html#externalcsvs._get_preds', 'numerblox/model.py'),
                                  'numerblox.model.ExternalCSVs.predict': ('model.html#externalcsvs.predict', 'numerblox/model.py'),
+                                 'numerblox.model.ExternalCSVs.used_features': ( 'model.html#externalcsvs.used_features',
+                                                                                 'numerblox/model.py'),
                                  'numerblox.model.JoblibModel': ('model.html#joblibmodel', 'numerblox/model.py'),
                                  'numerblox.model.JoblibModel.__init__': ('model.html#joblibmodel.__init__', 'numerblox/model.py'),
-                                 'numerblox.model.JoblibModel.load_models': ('model.html#joblibmodel.load_models', 'numerblox/model.py'),
+                                 'numerblox.model.JoblibModel.load_model': ('model.html#joblibmodel.load_model', 'numerblox/model.py'),
                                  'numerblox.model.LGBMModel': ('model.html#lgbmmodel', 'numerblox/model.py'),
                                  'numerblox.model.LGBMModel.__init__': ('model.html#lgbmmodel.__init__', 'numerblox/model.py'),
-                                 'numerblox.model.LGBMModel.load_models': ('model.html#lgbmmodel.load_models', 'numerblox/model.py'),
+                                 'numerblox.model.LGBMModel._get_features': ('model.html#lgbmmodel._get_features', 'numerblox/model.py'),
+                                 'numerblox.model.LGBMModel._predict_model': ('model.html#lgbmmodel._predict_model', 'numerblox/model.py'),
+                                 'numerblox.model.LGBMModel.load_model': ('model.html#lgbmmodel.load_model', 'numerblox/model.py'),
+                                 'numerblox.model.LGBMModel.loader_name': ('model.html#lgbmmodel.loader_name', 'numerblox/model.py'),
+                                 'numerblox.model.LGBMTreeEnsemble': ('model.html#lgbmtreeensemble', 'numerblox/model.py'),
+                                 'numerblox.model.LGBMTreeEnsemble.__init__': ( 'model.html#lgbmtreeensemble.__init__',
+                                                                                'numerblox/model.py'),
+                                 'numerblox.model.LGBMTreeEnsemble._compile': ( 'model.html#lgbmtreeensemble._compile',
+                                                                                'numerblox/model.py'),
+                                 'numerblox.model.LGBMTreeEnsemble._convert_output': ( 'model.html#lgbmtreeensemble._convert_output',
+                                                                                       'numerblox/model.py'),
+                                 'numerblox.model.LGBMTreeEnsemble._go_left': ( 'model.html#lgbmtreeensemble._go_left',
+                                                                                'numerblox/model.py'),
+                                 'numerblox.model.LGBMTreeEnsemble._level_table': ( 'model.html#lgbmtreeensemble._level_table',
+                                                                                    'numerblox/model.py'),
+                                 'numerblox.model.LGBMTreeEnsemble._raw_predict': ( 'model.html#lgbmtreeensemble._raw_predict',
+                                                                                    'numerblox/model.py'),
+                                 'numerblox.model.LGBMTreeEnsemble.predict': ('model.html#lgbmtreeensemble.predict', 'numerblox/model.py'),
+                                 'numerblox.model.LGBMTreeEnsemble.split_features': ( 'model.html#lgbmtreeensemble.split_features',
+                                                                                      'numerblox/model.py'),
+                                 'numerblox.model.ModelCache': ('model.html#modelcache', 'numerblox/model.py'),
+                                 'numerblox.model.ModelCache.__init__': ('model.html#modelcache.__init__', 'numerblox/model.py'),
+                                 'numerblox.model.ModelCache._evict': ('model.html#modelcache._evict', 'numerblox/model.py'),
+                                 'numerblox.model.ModelCache.clear': ('model.html#modelcache.clear', 'numerblox/model.py'),
+                                 'numerblox.model.ModelCache.load': ('model.html#modelcache.load', 'numerblox/model.py'),
+                                 'numerblox.model.ModelCache.stats': ('model.html#modelcache.stats', 'numerblox/model.py'),
+                                 'numerblox.model.ModelServer': ('model.html#modelserver', 'numerblox/model.py'),
+                                 'numerblox.model.ModelServer.__init__': ('model.html#modelserver.__init__', 'numerblox/model.py'),
+                                 'numerblox.model.ModelServer._answer': ('model.html#modelserver._answer', 'numerblox/model.py'),
+                                 'numerblox.model.ModelServer._handle': ('model.html#modelserver._handle', 'numerblox/model.py'),
+                                 'numerblox.model.ModelServer._predict': ('model.html#modelserver._predict', 'numerblox/model.py'),
+                                 'numerblox.model.ModelServer.close': ('model.html#modelserver.close', 'numerblox/model.py'),
+                                 'numerblox.model.ModelServer.serve': ('model.html#modelserver.serve', 'numerblox/model.py'),
+                                 'numerblox.model.ModelServer.start': ('model.html#modelserver.start', 'numerblox/model.py'),
+                                 'numerblox.model.ModelServer.warm': ('model.html#modelserver.warm', 'numerblox/model.py'),
                                  'numerblox.model.NumerBayCSVs': ('model.html#numerbaycsvs', 'numerblox/model.py'),
                                  'numerblox.model.NumerBayCSVs.__init__': ('model.html#numerbaycsvs.__init__', 'numerblox/model.py'),
                                  'numerblox.model.NumerBayCSVs._get_preds': ('model.html#numerbaycsvs._get_preds', 'numerblox/model.py'),
                                  'numerblox.model.NumerBayCSVs.api': ('model.html#numerbaycsvs.api', 'numerblox/model.py'),
                                  'numerblox.model.NumerBayCSVs.predict': ('model.html#numerbaycsvs.predict', 'numerblox/model.py'),
+                                 'numerblox.model.NumerBayCSVs.used_features': ( 'model.html#numerbaycsvs.used_features',
+                                                                                 'numerblox/model.py'),
+                                 'numerblox.model.OnnxModel': ('model.html#onnxmodel', 'numerblox/model.py'),
+                                 'numerblox.model.OnnxModel.__getstate__': ('model.html#onnxmodel.__getstate__', 'numerblox/model.py'),
+                                 'numerblox.model.OnnxModel.__init__': ('model.html#onnxmodel.__init__', 'numerblox/model.py'),
+                                 'numerblox.model.OnnxModel.__setstate__': ('model.html#onnxmodel.__setstate__', 'numerblox/model.py'),
+                                 'numerblox.model.OnnxModel._start_session': ('model.html#onnxmodel._start_session', 'numerblox/model.py'),
+                                 'numerblox.model.OnnxModel.predict': ('model.html#onnxmodel.predict', 'numerblox/model.py'),
+                                 'numerblox.model.PredictionCache': ('model.html#predictioncache', 'numerblox/model.py'),
+                                 'numerblox.model.PredictionCache.__call__': ('model.html#predictioncache.__call__', 'numerblox/model.py'),
+                                 'numerblox.model.PredictionCache.__init__': ('model.html#predictioncache.__init__', 'numerblox/model.py'),
+                                 'numerblox.model.PredictionCache._evict': ('model.html#predictioncache._evict', 'numerblox/model.py'),
+                                 'numerblox.model.PredictionCache._load': ('model.html#predictioncache._load', 'numerblox/model.py'),
+                                 'numerblox.model.PredictionCache._size': ('model.html#predictioncache._size', 'numerblox/model.py'),
+                                 'numerblox.model.PredictionCache._store': ('model.html#predictioncache._store', 'numerblox/model.py'),
+                                 'numerblox.model.PredictionCache.artifact_hash': ( 'model.html#predictioncache.artifact_hash',
+                                                                                    'numerblox/model.py'),
+                                 'numerblox.model.PredictionCache.cache_key': ( 'model.html#predictioncache.cache_key',
+                                                                                'numerblox/model.py'),
+                                 'numerblox.model.PredictionCache.clear': ('model.html#predictioncache.clear', 'numerblox/model.py'),
+                                 'numerblox.model.PredictionCache.input_fingerprint': ( 'model.html#predictioncache.input_fingerprint',
+                                                                                        'numerblox/model.py'),
+                                 'numerblox.model.PredictionCache.stats': ('model.html#predictioncache.stats', 'numerblox/model.py'),
                                  'numerblox.model.RandomModel': ('model.html#randommodel', 'numerblox/model.py'),
                                  'numerblox.model.RandomModel.__init__': ('model.html#randommodel.__init__', 'numerblox/model.py'),
                                  'numerblox.model.RandomModel.predict': ('model.html#randommodel.predict', 'numerblox/model.py'),
+                                 'numerblox.model.RandomModel.used_features': ( 'model.html#randommodel.used_features',
+                                                                                'numerblox/model.py'),
+                                 'numerblox.model.RemoteModel': ('model.html#remotemodel', 'numerblox/model.py'),
+                                 'numerblox.model.RemoteModel.__init__': ('model.html#remotemodel.__init__', 'numerblox/model.py'),
+                                 'numerblox.model.RemoteModel._request': ('model.html#remotemodel._request', 'numerblox/model.py'),
+                                 'numerblox.model.RemoteModel.info': ('model.html#remotemodel.info', 'numerblox/model.py'),
+                                 'numerblox.model.RemoteModel.predict': ('model.html#remotemodel.predict', 'numerblox/model.py'),
                                  'numerblox.model.SingleModel': ('model.html#singlemodel', 'numerblox/model.py'),
                                  'numerblox.model.SingleModel.__check_valid_suffix': ( 'model.html#singlemodel.__check_valid_suffix',
                                                                                        'numerblox/model.py'),
+                                 'numerblox.model.SingleModel.__getstate__': ('model.html#singlemodel.__getstate__', 'numerblox/model.py'),
                                  'numerblox.model.SingleModel.__init__': ('model.html#singlemodel.__init__', 'numerblox/model.py'),
+                                 'numerblox.model.SingleModel._drop_keras_forward': ( 'model.html#singlemodel._drop_keras_forward',
+                                                                                      'numerblox/model.py'),
+                                 'numerblox.model.SingleModel._keras_predictions': ( 'model.html#singlemodel._keras_predictions',
+                                                                                     'numerblox/model.py'),
                                  'numerblox.model.SingleModel._load_model': ('model.html#singlemodel._load_model', 'numerblox/model.py'),
+                                 'numerblox.model.SingleModel._load_native_model': ( 'model.html#singlemodel._load_native_model',
+                                                                                     'numerblox/model.py'),
+                                 'numerblox.model.SingleModel._load_onnx_model': ( 'model.html#singlemodel._load_onnx_model',
+                                                                                   'numerblox/model.py'),
+                                 'numerblox.model.SingleModel._model_predictions': ( 'model.html#singlemodel._model_predictions',
+                                                                                     'numerblox/model.py'),
+                                 'numerblox.model.SingleModel.artifact_paths': ( 'model.html#singlemodel.artifact_paths',
+                                                                                 'numerblox/model.py'),
+                                 'numerblox.model.SingleModel.check_onnx': ('model.html#singlemodel.check_onnx', 'numerblox/model.py'),
                                  'numerblox.model.SingleModel.predict': ('model.html#singlemodel.predict', 'numerblox/model.py'),
+                                 'numerblox.model.SingleModel.used_features': ( 'model.html#singlemodel.used_features',
+                                                                                'numerblox/model.py'),
                                  'numerblox.model.WandbKerasModel': ('model.html#wandbkerasmodel', 'numerblox/model.py'),
                                  'numerblox.model.WandbKerasModel.__init__': ('model.html#wandbkerasmodel.__init__', 'numerblox/model.py'),
                                  'numerblox.model.WandbKerasModel._download_model': ( 'model.html#wandbkerasmodel._download_model',
-                                                                                      'numerblox/model.py')},
+                                                                                      'numerblox/model.py'),
+                                 'numerblox.model._BundleMember': ('model.html#_bundlemember', 'numerblox/model.py'),
+                                 'numerblox.model._BundleMember.__init__': ('model.html#_bundlemember.__init__', 'numerblox/model.py'),
+                                 'numerblox.model._BundleMember.predict': ('model.html#_bundlemember.predict', 'numerblox/model.py'),
+                                 'numerblox.model._catboost_split_features': ('model.html#_catboost_split_features', 'numerblox/model.py'),
+                                 'numerblox.model._directory_model_predict': ('model.html#_directory_model_predict', 'numerblox/model.py'),
+                                 'numerblox.model._init_directory_model_worker': ( 'model.html#_init_directory_model_worker',
+                                                                                   'numerblox/model.py'),
+                                 'numerblox.model._load_catboost': ('model.html#_load_catboost', 'numerblox/model.py'),
+                                 'numerblox.model._load_keras': ('model.html#_load_keras', 'numerblox/model.py'),
+                                 'numerblox.model._serialize_bundle_member': ('model.html#_serialize_bundle_member', 'numerblox/model.py'),
+                                 'numerblox.model._server_key_path': ('model.html#_server_key_path', 'numerblox/model.py'),
+                                 'numerblox.model._set_receive_timeout': ('model.html#_set_receive_timeout', 'numerblox/model.py'),
+                                 'numerblox.model._write_aligned': ('model.html#_write_aligned', 'numerblox/model.py'),
+                                 'numerblox.model.export_onnx': ('model.html#export_onnx', 'numerblox/model.py'),
+                                 'numerblox.model.load_bundle_manifest': ('model.html#load_bundle_manifest', 'numerblox/model.py'),
+                                 'numerblox.model.model_used_features': ('model.html#model_used_features', 'numerblox/model.py'),
+                                 'numerblox.model.save_model_bundle': ('model.html#save_model_bundle', 'numerblox/model.py')},
             'numerblox.model_pipeline': { 'numerblox.model_pipeline.ModelPipeline': ( 'modelpipeline.html#modelpipeline',
                                                                                       'numerblox/model_pipeline.py'),
                                           'numerblox.model_pipeline.ModelPipeline.__call__': ( 'modelpipeline.html#modelpipeline.__call__',
@@ -227,6 +379,10 @@ d = { 'settings': { 'branch': 'master',
                                                                                                  'numerblox/model_pipeline.py'),
                                           'numerblox.model_pipeline.ModelPipeline.process_models': ( 'modelpipeline.html#modelpipeline.process_models',
                                                                                                      'numerblox/model_pipeline.py'),
+                                          'numerblox.model_pipeline.ModelPipeline.prune_features': ( 'modelpipeline.html#modelpipeline.prune_features',
+                                                                                                     'numerblox/model_pipeline.py'),
+                                          'numerblox.model_pipeline.ModelPipeline.used_features': ( 'modelpipeline.html#modelpipeline.used_features',
+                                                                                                    'numerblox/model_pipeline.py'),
                                           'numerblox.model_pipeline.ModelPipelineCollection': ( 'modelpipeline.html#modelpipelinecollection',
                                                                                                 'numerblox/model_pipeline.py'),
                                           'numerblox.model_pipeline.ModelPipelineCollection.__call__': ( 'modelpipeline.html#modelpipelinecollection.__call__',
@@ -246,8 +402,18 @@ d = { 'settings': { 'branch': 'master',
                                                                                              'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame.__set_era_col': ( 'numerframe.html#numerframe.__set_era_col',
                                                                                          'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.__setitem__': ( 'numerframe.html#numerframe.__setitem__',
+                                                                                       'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame._clear_item_cache': ( 'numerframe.html#numerframe._clear_item_cache',
+                                                                                             'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame._constructor': ( 'numerframe.html#numerframe._constructor',
                                                                                         'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.add_columns': ( 'numerframe.html#numerframe.add_columns',
+                                                                                       'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.clear_feature_matrices': ( 'numerframe.html#numerframe.clear_feature_matrices',
+                                                                                                  'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.feature_matrix_keys': ( 'numerframe.html#numerframe.feature_matrix_keys',
+                                                                                               'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame.get_aux_data': ( 'numerframe.html#numerframe.get_aux_data',
                                                                                         'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame.get_column_selection': ( 'numerframe.html#numerframe.get_column_selection',
@@ -256,6 +422,8 @@ d = { 'settings': { 'branch': 'master',
                                                                                          'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame.get_feature_data': ( 'numerframe.html#numerframe.get_feature_data',
                                                                                             'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.get_feature_matrix': ( 'numerframe.html#numerframe.get_feature_matrix',
+                                                                                              'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame.get_feature_target_pair': ( 'numerframe.html#numerframe.get_feature_target_pair',
                                                                                                    'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame.get_pattern_data': ( 'numerframe.html#numerframe.get_pattern_data',
@@ -264,10 +432,43 @@ d = { 'settings': { 'branch': 'master',
                                                                                                    'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame.get_prediction_data': ( 'numerframe.html#numerframe.get_prediction_data',
                                                                                                'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerFrame.get_row_mask': ( 'numerframe.html#numerframe.get_row_mask',
+                                                                                        'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame.get_single_target_data': ( 'numerframe.html#numerframe.get_single_target_data',
                                                                                                   'numerblox/numerframe.py'),
                                       'numerblox.numerframe.NumerFrame.get_target_data': ( 'numerframe.html#numerframe.get_target_data',
                                                                                            'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel': ('numerframe.html#numerpanel', 'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel.__getitem__': ( 'numerframe.html#numerpanel.__getitem__',
+                                                                                       'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel.__init__': ( 'numerframe.html#numerpanel.__init__',
+                                                                                    'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel._new': ( 'numerframe.html#numerpanel._new',
+                                                                                'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel._rolling_sum': ( 'numerframe.html#numerpanel._rolling_sum',
+                                                                                        'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel.add_suffix': ( 'numerframe.html#numerpanel.add_suffix',
+                                                                                      'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel.bin': ('numerframe.html#numerpanel.bin', 'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel.concat': ( 'numerframe.html#numerpanel.concat',
+                                                                                  'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel.ewm': ('numerframe.html#numerpanel.ewm', 'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel.ffill': ( 'numerframe.html#numerpanel.ffill',
+                                                                                 'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel.from_numerframe': ( 'numerframe.html#numerpanel.from_numerframe',
+                                                                                           'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel.pct_change': ( 'numerframe.html#numerpanel.pct_change',
+                                                                                      'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel.rank': ( 'numerframe.html#numerpanel.rank',
+                                                                                'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel.rolling': ( 'numerframe.html#numerpanel.rolling',
+                                                                                   'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel.shape': ( 'numerframe.html#numerpanel.shape',
+                                                                                 'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel.shift': ( 'numerframe.html#numerpanel.shift',
+                                                                                 'numerblox/numerframe.py'),
+                                      'numerblox.numerframe.NumerPanel.to_numerframe': ( 'numerframe.html#numerpanel.to_numerframe',
+                                                                                         'numerblox/numerframe.py'),
                                       'numerblox.numerframe.create_numerframe': ( 'numerframe.html#create_numerframe',
                                                                                   'numerblox/numerframe.py')},
             'numerblox.postprocessing': { 'numerblox.postprocessing.AwesomePostProcessor': ( 'postprocessing.html#awesomepostprocessor',
@@ -372,12 +573,38 @@ d = { 'settings': { 'branch': 'master',
                                                                                                 'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.CopyPreProcessor.transform': ( 'preprocessing.html#copypreprocessor.transform',
                                                                                                  'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.CorrelationFeatureSelector': ( 'preprocessing.html#correlationfeatureselector',
+                                                                                                 'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.CorrelationFeatureSelector.__init__': ( 'preprocessing.html#correlationfeatureselector.__init__',
+                                                                                                          'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.CorrelationFeatureSelector._candidate_features': ( 'preprocessing.html#correlationfeatureselector._candidate_features',
+                                                                                                                     'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.CorrelationFeatureSelector._correlations': ( 'preprocessing.html#correlationfeatureselector._correlations',
+                                                                                                               'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.CorrelationFeatureSelector.correlation_matrix': ( 'preprocessing.html#correlationfeatureselector.correlation_matrix',
+                                                                                                                    'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.CorrelationFeatureSelector.select': ( 'preprocessing.html#correlationfeatureselector.select',
+                                                                                                        'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.CorrelationFeatureSelector.transform': ( 'preprocessing.html#correlationfeatureselector.transform',
+                                                                                                           'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.DifferencePreProcessor': ( 'preprocessing.html#differencepreprocessor',
                                                                                              'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.DifferencePreProcessor.__init__': ( 'preprocessing.html#differencepreprocessor.__init__',
                                                                                                       'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.DifferencePreProcessor._lag_column_map': ( 'preprocessing.html#differencepreprocessor._lag_column_map',
+                                                                                                             'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.DifferencePreProcessor.transform': ( 'preprocessing.html#differencepreprocessor.transform',
                                                                                                        'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.EraNormalizationProcessor': ( 'preprocessing.html#eranormalizationprocessor',
+                                                                                                'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.EraNormalizationProcessor.__init__': ( 'preprocessing.html#eranormalizationprocessor.__init__',
+                                                                                                         'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.EraNormalizationProcessor._average_ranks': ( 'preprocessing.html#eranormalizationprocessor._average_ranks',
+                                                                                                               'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.EraNormalizationProcessor._normalize': ( 'preprocessing.html#eranormalizationprocessor._normalize',
+                                                                                                           'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.EraNormalizationProcessor.transform': ( 'preprocessing.html#eranormalizationprocessor.transform',
+                                                                                                          'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.EraQuantileProcessor': ( 'preprocessing.html#eraquantileprocessor',
                                                                                            'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.EraQuantileProcessor.__init__': ( 'preprocessing.html#eraquantileprocessor.__init__',
@@ -392,6 +619,16 @@ d = { 'settings': { 'branch': 'master',
                                                                                                             'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.FeatureSelectionPreProcessor.transform': ( 'preprocessing.html#featureselectionpreprocessor.transform',
                                                                                                              'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.FridayResamplePreProcessor': ( 'preprocessing.html#fridayresamplepreprocessor',
+                                                                                                 'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.FridayResamplePreProcessor.__init__': ( 'preprocessing.html#fridayresamplepreprocessor.__init__',
+                                                                                                          'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.FridayResamplePreProcessor._segment_reduce': ( 'preprocessing.html#fridayresamplepreprocessor._segment_reduce',
+                                                                                                                 'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.FridayResamplePreProcessor._yyyymmdd': ( 'preprocessing.html#fridayresamplepreprocessor._yyyymmdd',
+                                                                                                           'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.FridayResamplePreProcessor.transform': ( 'preprocessing.html#fridayresamplepreprocessor.transform',
+                                                                                                           'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.GroupStatsPreProcessor': ( 'preprocessing.html#groupstatspreprocessor',
                                                                                              'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.GroupStatsPreProcessor.__init__': ( 'preprocessing.html#groupstatspreprocessor.__init__',
@@ -426,12 +663,46 @@ d = { 'settings': { 'branch': 'master',
                                                                                                'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.PandasTaFeatureGenerator.__init__': ( 'preprocessing.html#pandastafeaturegenerator.__init__',
                                                                                                         'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.PandasTaFeatureGenerator._add_features': ( 'preprocessing.html#pandastafeaturegenerator._add_features',
+                                                                                                             'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.PandasTaFeatureGenerator._append': ( 'preprocessing.html#pandastafeaturegenerator._append',
+                                                                                                       'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.PandasTaFeatureGenerator._batch_bounds': ( 'preprocessing.html#pandastafeaturegenerator._batch_bounds',
+                                                                                                             'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.PandasTaFeatureGenerator._compact_parts': ( 'preprocessing.html#pandastafeaturegenerator._compact_parts',
+                                                                                                              'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.PandasTaFeatureGenerator._dates': ( 'preprocessing.html#pandastafeaturegenerator._dates',
+                                                                                                      'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.PandasTaFeatureGenerator._generate_features': ( 'preprocessing.html#pandastafeaturegenerator._generate_features',
                                                                                                                   'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.PandasTaFeatureGenerator.add_features': ( 'preprocessing.html#pandastafeaturegenerator.add_features',
                                                                                                             'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.PandasTaFeatureGenerator.load_features': ( 'preprocessing.html#pandastafeaturegenerator.load_features',
+                                                                                                             'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.PandasTaFeatureGenerator.transform': ( 'preprocessing.html#pandastafeaturegenerator.transform',
                                                                                                          'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ProcessorCache': ( 'preprocessing.html#processorcache',
+                                                                                     'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ProcessorCache.__call__': ( 'preprocessing.html#processorcache.__call__',
+                                                                                              'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ProcessorCache.__init__': ( 'preprocessing.html#processorcache.__init__',
+                                                                                              'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ProcessorCache._evict': ( 'preprocessing.html#processorcache._evict',
+                                                                                            'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ProcessorCache._load': ( 'preprocessing.html#processorcache._load',
+                                                                                           'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ProcessorCache._size': ( 'preprocessing.html#processorcache._size',
+                                                                                           'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ProcessorCache._store': ( 'preprocessing.html#processorcache._store',
+                                                                                            'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ProcessorCache.cache_key': ( 'preprocessing.html#processorcache.cache_key',
+                                                                                               'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ProcessorCache.clear': ( 'preprocessing.html#processorcache.clear',
+                                                                                           'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ProcessorCache.column_hashes': ( 'preprocessing.html#processorcache.column_hashes',
+                                                                                                   'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.ProcessorCache.stats': ( 'preprocessing.html#processorcache.stats',
+                                                                                           'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.ReduceMemoryProcessor': ( 'preprocessing.html#reducememoryprocessor',
                                                                                             'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.ReduceMemoryProcessor.__init__': ( 'preprocessing.html#reducememoryprocessor.__init__',
@@ -444,6 +715,12 @@ d = { 'settings': { 'branch': 'master',
                                                                                              'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.SignalsTargetProcessor.__init__': ( 'preprocessing.html#signalstargetprocessor.__init__',
                                                                                                       'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.SignalsTargetProcessor._bin_ranks': ( 'preprocessing.html#signalstargetprocessor._bin_ranks',
+                                                                                                        'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.SignalsTargetProcessor._era_ranks': ( 'preprocessing.html#signalstargetprocessor._era_ranks',
+                                                                                                        'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.SignalsTargetProcessor._forward_returns': ( 'preprocessing.html#signalstargetprocessor._forward_returns',
+                                                                                                              'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.SignalsTargetProcessor.transform': ( 'preprocessing.html#signalstargetprocessor.transform',
                                                                                                        'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.TargetSelectionPreProcessor': ( 'preprocessing.html#targetselectionpreprocessor',
@@ -456,8 +733,26 @@ d = { 'settings': { 'branch': 'master',
                                                                                    'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.TickerMapper.__init__': ( 'preprocessing.html#tickermapper.__init__',
                                                                                             'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.TickerMapper._cache_expired': ( 'preprocessing.html#tickermapper._cache_expired',
+                                                                                                  'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.TickerMapper._load_ticker_map': ( 'preprocessing.html#tickermapper._load_ticker_map',
+                                                                                                    'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.TickerMapper.cache_path': ( 'preprocessing.html#tickermapper.cache_path',
+                                                                                              'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.TickerMapper.mapping': ( 'preprocessing.html#tickermapper.mapping',
+                                                                                           'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing.TickerMapper.ticker_map': ( 'preprocessing.html#tickermapper.ticker_map',
+                                                                                              'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.TickerMapper.transform': ( 'preprocessing.html#tickermapper.transform',
                                                                                              'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._init_pandas_ta_worker': ( 'preprocessing.html#_init_pandas_ta_worker',
+                                                                                             'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._pandas_ta_batch': ( 'preprocessing.html#_pandas_ta_batch',
+                                                                                       'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._pandas_ta_tickers': ( 'preprocessing.html#_pandas_ta_tickers',
+                                                                                         'numerblox/preprocessing.py'),
+                                         'numerblox.preprocessing._resource_tracker_id': ( 'preprocessing.html#_resource_tracker_id',
+                                                                                           'numerblox/preprocessing.py'),
                                          'numerblox.preprocessing.display_processor_info': ( 'preprocessing.html#display_processor_info',
                                                                                              'numerblox/preprocessing.py')},
             'numerblox.submission': { 'numerblox.submission.BaseSubmitter': ('submission.html#basesubmitter', 'numerblox/submission.py'),
@@ -1,30 +1,46 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/04_model.ipynb.
 
 # %% auto 0
-__all__ = ['BaseModel', 'DirectoryModel', 'SingleModel', 'WandbKerasModel', 'ExternalCSVs', 'NumerBayCSVs', 'JoblibModel',
-           'CatBoostModel', 'LGBMModel', 'ConstantModel', 'RandomModel', 'ExamplePredictionsModel', 'AwesomeModel',
-           'AwesomeDirectoryModel']
+__all__ = ['BUNDLE_MAGIC', 'BaseModel', 'DirectoryModel', 'ModelCache', 'OnnxModel', 'export_onnx', 'PredictionCache',
+           'ModelServer', 'RemoteModel', 'model_used_features', 'SingleModel', 'WandbKerasModel', 'ExternalCSVs',
+           'NumerBayCSVs', 'JoblibModel', 'CatBoostModel', 'LGBMModel', 'LGBMTreeEnsemble', 'save_model_bundle',
+           'load_bundle_manifest', 'BundleModel', 'ConstantModel', 'RandomModel', 'ExamplePredictionsModel',
+           'AwesomeModel', 'AwesomeDirectoryModel']
 
 # %% ../nbs/04_model.ipynb 4
 import os
 import gc
+import json
+import mmap
+import struct
+import socket
 import uuid
 import joblib
 import pickle
+import tempfile
+import hashlib
+import threading
+import weakref
 import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Union
+from typing import Union, Callable
 from tqdm.auto import tqdm
+from collections import OrderedDict
 from functools import partial
 from numerbay import NumerBay
+from multiprocessing import resource_tracker
+from multiprocessing.connection import Listener, Client, AuthenticationError, answer_challenge, deliver_challenge
+from threadpoolctl import threadpool_limits
+from multiprocessing.shared_memory import SharedMemory
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from abc import ABC, abstractmethod
 from rich import print as rich_print
 from sklearn.dummy import DummyRegressor
 
 from .download import NumeraiClassicDownloader
 from .numerframe import NumerFrame, create_numerframe
-from .preprocessing import display_processor_info
+from .preprocessing import display_processor_info, _resource_tracker_id
 
 # %% ../nbs/04_model.ipynb 8
 class BaseModel(ABC):
@@ -34,6 +50,13 @@ class BaseModel(ABC):
     :param model_directory: Main directory from which to read in models. \n
     :param model_name: Name that will be used to create column names and for display purposes.
     """
+    # Opt-in process-wide cache of loaded models (ModelCache). Set for an instance or for all models on BaseModel.
+    model_cache = None
+    # Opt-in persistent cache of predictions (PredictionCache). Set for an instance or for all models on BaseModel.
+    prediction_cache = None
+    # Optional selection of rows to predict on (see NumerFrame.get_row_mask). All rows by default.
+    row_selector = None
+
     def __init__(self, model_directory: str,
                  model_name: str = None,
                  ):
@@ -56,7 +79,85 @@ class BaseModel(ABC):
                 prediction_cols = [f"{self.prediction_col_name}_{i}" for i in range(pred_shape[1])]
         return prediction_cols
 
-    def __call__(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
+    def _get_features(self, dataf: NumerFrame, feature_cols: list, dtype = None) -> pd.DataFrame:
+        """
+        Features as DataFrame backed by the cached model-ready matrix of dataf.
+        All models that use the same features share this matrix instead of copying dataf[feature_cols].
+        :param dataf: NumerFrame with features.
+        :param feature_cols: Features to select.
+        :param dtype: dtype of matrix. Smallest float dtype that holds all features exactly by default.
+        """
+        dataf_columns = set(dataf.columns)
+        missing_cols = [col for col in feature_cols if col not in dataf_columns]
+        if missing_cols:
+            # Features the model doesn't use may be left out of the data. They are passed as zero-filled placeholders.
+            used_cols = set(self.used_features(feature_cols))
+            missing_used_cols = [col for col in missing_cols if col in used_cols]
+            assert not missing_used_cols, f"{len(missing_used_cols)} features used by model '{self.model_name}' are missing. For example: {missing_used_cols[:5]}."
+        matrix = dataf.get_feature_matrix(feature_cols, dtype=dtype, fill_missing=bool(missing_cols))
+        return pd.DataFrame(matrix, columns=feature_cols, index=dataf.index, copy=False)
+
+    def used_features(self, feature_cols: list) -> list:
+        """
+        Features the model actually uses, in the order of feature_cols. All feature_cols by default.
+        Unused features don't have to be loaded.
+        :param feature_cols: Features the model predicts on.
+        """
+        return list(feature_cols)
+
+    def _cached_load(self, path: Union[str, Path], loader: Callable, loader_name: str):
+        """
+        Load model from path, through self.model_cache if it is set.
+        :param path: Model file path.
+        :param loader: Function that loads a model from path.
+        :param loader_name: Identifier of loader, used in the cache key.
+        """
+        if self.model_cache is None:
+            return loader(path)
+        return self.model_cache.load(path, loader, loader_name)
+
+    @property
+    def artifact_paths(self) -> list:
+        """ Model files that predictions depend on. Predictions are only cached for models with model files. """
+        return []
+
+    def __call__(self, dataf: Union[pd.DataFrame, NumerFrame], row_selector = None, keep_feature_matrices: bool = False) -> NumerFrame:
+        """
+        Predict, through self.prediction_cache if it is set.
+        :param dataf: Input data.
+        :param row_selector: Only predict on selected rows (see NumerFrame.get_row_mask). Other rows get NaN predictions.
+        Defaults to self.row_selector.
+        :param keep_feature_matrices: Keep feature matrices cached while predicting, so models that predict on the returned NumerFrame reuse them.
+        By default they are dropped from the input and returned NumerFrame after prediction, so they are freed.
+        """
+        cached_keys = dataf.feature_matrix_keys if isinstance(dataf, NumerFrame) else set()
+        row_selector = row_selector if row_selector is not None else self.row_selector
+        if row_selector is not None:
+            result = self._predict_selected_rows(dataf, row_selector)
+        else:
+            result = self._predict_all_rows(dataf)
+        if not keep_feature_matrices:
+            for frame in (dataf, result):
+                if isinstance(frame, NumerFrame):
+                    frame.clear_feature_matrices(keep=cached_keys)
+        return result
+
+    def _predict_selected_rows(self, dataf: Union[pd.DataFrame, NumerFrame], row_selector) -> NumerFrame:
+        """ Gather selected rows, predict on them and scatter predictions back. """
+        dataf = dataf if isinstance(dataf, NumerFrame) else NumerFrame(dataf)
+        mask = dataf.get_row_mask(row_selector)
+        if mask.all():
+            return self._predict_all_rows(dataf)
+        selected_dataf = NumerFrame(dataf[mask])
+        result = self._predict_all_rows(selected_dataf)
+        # Prediction columns of this model are also returned if they already existed in the input.
+        prediction_cols = [col for col in result.columns
+                           if col not in selected_dataf.columns or str(col).startswith(self.prediction_col_name)]
+        return dataf.add_columns(result[prediction_cols], rows=mask)
+
+    def _predict_all_rows(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
+        if self.prediction_cache is not None:
+            return self.prediction_cache(self, dataf)
         return self.predict(dataf=dataf)
 
 # %% ../nbs/04_model.ipynb 11
@@ -69,12 +170,29 @@ class DirectoryModel(BaseModel):
     :param model_name: Name that will be used to create column names and for display purposes. \n
     :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default. \n
     :param combine_preds: Whether to average predictions along column axis. Only relevant for multi target models. \n
-    Convenient when you want to predict the main target by averaging a multi-target model.
+    Convenient when you want to predict the main target by averaging a multi-target model. \n
+    :param executor: How to run models concurrently. None (default) predicts with one model after another. \n
+    "thread" uses a thread pool (for GIL-releasing models like LightGBM and CatBoost). \n
+    "process" uses a process pool with features in shared memory (for GIL-bound models like most scikit-learn models). \n
+    :param num_workers: Number of models to run concurrently. Defaults to the number of available cores. \n
+    :param threads_per_model: Maximum number of threads every model may use internally.
+    Defaults to available cores divided by num_workers when an executor is set. \n
+    :param streaming: Load models one at a time and release them after prediction instead of loading all models up front. \n
+    :param prefetch: Load the next model in a background thread while the current model predicts. Only used when streaming. \n
+    :param chunk_size: Optional maximum number of rows every model predicts on at once. Predicts on all rows at once by default. \n
+    :param backend: "native" (default) predicts with the loaded models. "onnx" exports models to ONNX once and predicts with ONNX Runtime. Requires the onnx extra (pip install numerblox[onnx]).
     """
     def __init__(self, model_directory: str, file_suffix: str,
                  model_name: str = None,
                  feature_cols: list = None,
                  combine_preds = True,
+                 executor: str = None,
+                 num_workers: int = None,
+                 threads_per_model: int = None,
+                 streaming: bool = False,
+                 prefetch: bool = False,
+                 chunk_size: int = None,
+                 backend: str = "native",
                  ):
         super().__init__(model_directory=model_directory,
                          model_name=model_name,
@@ -86,6 +204,22 @@ class DirectoryModel(BaseModel):
         self.total_models = len(self.model_paths)
         self.feature_cols = feature_cols
         self.combine_preds = combine_preds
+        assert executor in (None, "thread", "process"), f"executor should be None, 'thread' or 'process'. Got '{executor}'."
+        self.executor = executor
+        self.num_workers = num_workers if num_workers else os.cpu_count()
+        if threads_per_model is None and self.executor:
+            threads_per_model = max(1, os.cpu_count() // self.num_workers)
+        self.threads_per_model = threads_per_model
+        self.streaming = streaming
+        self.prefetch = prefetch
+        assert chunk_size is None or chunk_size > 0, f"chunk_size should be a positive integer. Got '{chunk_size}'."
+        self.chunk_size = chunk_size
+        assert backend in ("native", "onnx"), f"backend should be 'native' or 'onnx'. Got '{backend}'."
+        self.backend = backend
+        # ONNX Runtime sessions are reused across predict calls.
+        self._onnx_models = {}
+        # Used features per feature_cols. Computed once, since all models are inspected.
+        self._used_features = {}
 
     @display_processor_info
     def predict(self, dataf: NumerFrame, *args, **kwargs) -> NumerFrame:
@@ -95,25 +229,821 @@ class DirectoryModel(BaseModel):
         *args, **kwargs will be parsed into the model.predict method.
         :return: A new dataset with prediction column added.
         """
-        dataf.loc[:, self.prediction_col_name] = np.zeros(len(dataf))
-        models = self.load_models()
+        dataf = dataf if isinstance(dataf, NumerFrame) else NumerFrame(dataf)
         feature_cols = self.feature_cols if self.feature_cols else dataf.feature_cols
-        for model in tqdm(models, desc=self.description, position=1):
-            predictions = model.predict(dataf[feature_cols], *args, **kwargs)
+        ensemble_predictions, n_models = None, 0
+        for predictions in tqdm(self._iter_predictions(self._get_features(dataf, feature_cols), *args, **kwargs),
+                                desc=self.description, total=self.total_models, position=1):
+            predictions = predictions.reshape(len(dataf), -1)
+            # Preallocate once the number of outputs is known and sum all models in place.
+            if ensemble_predictions is None:
+                ensemble_predictions = np.zeros(predictions.shape, dtype=np.float32)
+            np.add(ensemble_predictions, predictions, out=ensemble_predictions, casting="unsafe")
+            n_models += 1
+        ensemble_predictions /= n_models
+        prediction_cols = self.get_prediction_col_names(ensemble_predictions.shape)
+        prediction_cols = [prediction_cols] if isinstance(prediction_cols, str) else prediction_cols
+        return dataf.add_columns(ensemble_predictions, names=prediction_cols)
+
+    def _iter_predictions(self, features: pd.DataFrame, *args, **kwargs):
+        """
+        Yield predictions (as arrays) for every model in the order models finish.
+        :param features: DataFrame with feature columns used for prediction.
+        *args, **kwargs will be parsed into the model.predict method.
+        """
+        if self.executor == "process":
+            yield from self._process_predictions(features, *args, **kwargs)
+            return
+        models = self.iter_models() if self.streaming else self.load_models()
+        if self.executor == "thread":
+            # Limits native thread pools (BLAS/OpenMP) that are not capped per model call.
+            with threadpool_limits(limits=self.threads_per_model), ThreadPoolExecutor(self.num_workers) as pool:
+                # Keep at most num_workers models in flight so streamed models are released as they finish.
+                pending = set()
+                for model in models:
+                    pending.add(pool.submit(self._predict_rows, model, features, *args, **kwargs))
+                    del model
+                    if len(pending) >= self.num_workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+                del models
+                for future in as_completed(pending):
+                    yield future.result()
+        else:
+            for model in models:
+                predictions = self._predict_rows(model, features, *args, **kwargs)
+                del model
+                yield predictions
+            del models
+        gc.collect()
+
+    def _process_predictions(self, features: pd.DataFrame, *args, **kwargs):
+        """
+        Place features in shared memory once and let every worker process load and predict with its models.
+        :param features: DataFrame with feature columns used for prediction.
+        *args, **kwargs will be parsed into the model.predict method.
+        """
+        values = features.to_numpy()
+        shm = SharedMemory(create=True, size=max(values.nbytes, 1))
+        try:
+            shared_values = np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)
+            shared_values[:] = values
+            del values
+            init_args = (self, shm.name, shared_values.shape, shared_values.dtype, features.columns.tolist(), _resource_tracker_id())
+            with ProcessPoolExecutor(self.num_workers, initializer=_init_directory_model_worker, initargs=init_args) as pool:
+                futures = [pool.submit(_directory_model_predict, path, *args, **kwargs) for path in self.model_paths]
+                for future in as_completed(futures):
+                    yield future.result()
+            del shared_values
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def _predict_rows(self, model, features: pd.DataFrame, *args, **kwargs) -> np.ndarray:
+        """
+        Predict with a single model on blocks of at most self.chunk_size rows.
+        :param model: Loaded model.
+        :param features: DataFrame with feature columns used for prediction.
+        *args, **kwargs will be parsed into the model.predict method.
+        :return: Array of predictions. Averaged over targets if self.combine_preds.
+        """
+        chunk_size = self.chunk_size if self.chunk_size else max(len(features), 1)
+        chunks = []
+        for start in range(0, len(features), chunk_size):
+            if isinstance(model, OnnxModel):
+                predictions = model.predict(features.iloc[start:start + chunk_size])
+            else:
+                predictions = self._predict_model(model, features.iloc[start:start + chunk_size], *args, **kwargs)
             # Check for if model output is a Pandas DataFrame
-            predictions = predictions.values if isinstance(predictions, pd.DataFrame) else predictions
+            predictions = predictions.values if isinstance(predictions, pd.DataFrame) else np.asarray(predictions)
             predictions = predictions.mean(axis=1) if self.combine_preds and len(predictions.shape) > 1 else predictions
-            prediction_cols = self.get_prediction_col_names(predictions.shape)
-            dataf.loc[:, prediction_cols] = dataf.loc[:, prediction_cols] + (predictions / self.total_models)
-        del models; gc.collect()
-        return NumerFrame(dataf)
+            chunks.append(predictions)
+        return chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+
+    def _predict_model(self, model, features: pd.DataFrame, *args, **kwargs):
+        """
+        Predict with a single model. Override to cap library specific thread counts with self.threads_per_model.
+        :param model: Loaded model.
+        :param features: DataFrame with feature columns used for prediction.
+        *args, **kwargs will be parsed into the model.predict method.
+        """
+        return model.predict(features, *args, **kwargs)
 
-    @abstractmethod
     def load_models(self) -> list:
         """ Instantiate all models detected in self.model_paths. """
+        return [self._get_model(path) for path in self.model_paths]
+
+    def iter_models(self):
+        """
+        Lazily instantiate models detected in self.model_paths, one at a time.
+        With self.prefetch the next model is loaded in a background thread while the current one is used.
+        """
+        if not self.prefetch:
+            for path in self.model_paths:
+                yield self._get_model(path)
+            return
+        with ThreadPoolExecutor(1) as loader:
+            next_model = loader.submit(self._get_model, self.model_paths[0]) if self.model_paths else None
+            for i in range(len(self.model_paths)):
+                model = next_model.result()
+                next_model = loader.submit(self._get_model, self.model_paths[i + 1]) if i + 1 < len(self.model_paths) else None
+                yield model
+                del model
+
+    def _get_model(self, path: Path):
+        """ Load model from path with self.load_model (or as ONNX model). Served from self.model_cache if it is set. """
+        if self.backend == "onnx":
+            if path not in self._onnx_models:
+                self._onnx_models[path] = self._cached_load(path, self._load_onnx_model, f"{self.loader_name}:onnx")
+            return self._onnx_models[path]
+        return self._cached_load(path, self.load_model, self.loader_name)
+
+    def _load_onnx_model(self, path: Path) -> "OnnxModel":
+        """ Load ONNX export of model. Exports the model first if no up to date export exists. """
+        onnx_path = Path(f"{path}.onnx")
+        if not onnx_path.exists() or onnx_path.stat().st_mtime_ns < Path(path).stat().st_mtime_ns:
+            export_onnx(self.load_model(path), onnx_path)
+        return OnnxModel(onnx_path, num_threads=self.threads_per_model)
+
+    def check_onnx(self, dataf: NumerFrame, n_rows: int = 1000, rtol: float = 1e-3, atol: float = 1e-5) -> dict:
+        """
+        Verify that ONNX models give the same predictions as the native models.
+        :param dataf: NumerFrame with features. \n
+        :param n_rows: Number of rows to compare predictions on. \n
+        :param rtol: Relative tolerance. ONNX Runtime predicts in float32. \n
+        :param atol: Absolute tolerance. \n
+        :return: Maximum absolute difference for every model file.
+        """
+        dataf = NumerFrame(dataf.iloc[:n_rows])
+        feature_cols = self.feature_cols if self.feature_cols else dataf.feature_cols
+        features = self._get_features(dataf, feature_cols)
+        differences = {}
+        for path in self.model_paths:
+            native_predictions = self._predict_rows(self.load_model(path), features).reshape(len(dataf), -1)
+            onnx_model = self._onnx_models.get(path) or self._load_onnx_model(path)
+            onnx_predictions = self._predict_rows(onnx_model, features).reshape(len(dataf), -1)
+            assert np.allclose(onnx_predictions, native_predictions, rtol=rtol, atol=atol), \
+                f"ONNX predictions for '{path.name}' differ from native predictions. Max difference: {np.abs(onnx_predictions - native_predictions).max()}"
+            differences[path.name] = float(np.abs(onnx_predictions - native_predictions).max())
+        return differences
+
+    def used_features(self, feature_cols: list) -> list:
+        """
+        Union of features that models in self.model_paths use (see model_used_features), in the order of feature_cols.
+        :param feature_cols: Features the models predict on. self.feature_cols if set.
+        """
+        feature_cols = list(self.feature_cols) if self.feature_cols else list(feature_cols)
+        key = tuple(feature_cols)
+        if key not in self._used_features:
+            used_cols = set()
+            for path in self.model_paths:
+                model_cols = model_used_features(self._cached_load(path, self.load_model, self.loader_name), feature_cols)
+                if model_cols is None:
+                    used_cols = set(feature_cols)
+                    break
+                used_cols.update(model_cols)
+            self._used_features[key] = [col for col in feature_cols if col in used_cols]
+        return self._used_features[key]
+
+    @property
+    def artifact_paths(self) -> list:
+        return self.model_paths
+
+    @property
+    def loader_name(self) -> str:
+        """ Identifier of self.load_model for model caching. Override if loading depends on settings. """
+        return f"{self.__class__.__module__}.{self.__class__.__qualname__}.load_model"
+
+    @abstractmethod
+    def load_model(self, path: Path):
+        """ Instantiate a single model from path. """
         ...
 
-# %% ../nbs/04_model.ipynb 16
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses that only implement load_models (all models at once) load single models through it.
+        if "load_models" in cls.__dict__ and getattr(cls.load_model, "__isabstractmethod__", False):
+            cls.load_model = DirectoryModel._load_model_from_load_models
+
+    def _load_model_from_load_models(self, path: Path):
+        """ Single model from a load_models implementation. All models are loaded once, in the order of self.model_paths. """
+        if getattr(self, "_all_models", None) is None:
+            self._all_models = dict(zip(self.model_paths, self.load_models()))
+        return self._all_models[Path(path)]
+
+
+# State of a DirectoryModel worker process, set once by the ProcessPoolExecutor initializer.
+_DIRECTORY_MODEL_WORKER = {}
+
+
+def _init_directory_model_worker(directory_model: DirectoryModel, shm_name: str, shape: tuple, dtype: np.dtype,
+                                 feature_cols: list, tracker_id: int = None):
+    """ Set up a DirectoryModel worker and cap its native thread pools. Shared features are attached for every model. """
+    if directory_model.threads_per_model:
+        threadpool_limits(limits=directory_model.threads_per_model)
+    _DIRECTORY_MODEL_WORKER.update(
+        directory_model=directory_model, shm_name=shm_name, shape=shape, dtype=dtype, feature_cols=feature_cols,
+        own_tracker=_resource_tracker_id() != tracker_id,
+    )
+
+
+def _directory_model_predict(path: Path, *args, **kwargs) -> np.ndarray:
+    """ Load model from path and predict on the shared features. """
+    directory_model = _DIRECTORY_MODEL_WORKER["directory_model"]
+    model = directory_model._get_model(path)
+    shm = SharedMemory(name=_DIRECTORY_MODEL_WORKER["shm_name"])
+    if _DIRECTORY_MODEL_WORKER["own_tracker"]:
+        # The parent process owns the shared memory. Don't let the resource tracker of this worker remove it.
+        resource_tracker.unregister(shm._name, "shared_memory")
+    features = pd.DataFrame(np.ndarray(_DIRECTORY_MODEL_WORKER["shape"], dtype=_DIRECTORY_MODEL_WORKER["dtype"], buffer=shm.buf),
+                            columns=_DIRECTORY_MODEL_WORKER["feature_cols"], copy=False)
+    try:
+        return directory_model._predict_rows(model, features, *args, **kwargs)
+    finally:
+        del features
+        shm.close()
+
+# %% ../nbs/04_model.ipynb 14
+class ModelCache:
+    """
+    Process-wide in-memory LRU cache of loaded models.
+
+    :param max_size_gb: Memory budget in GB. Model size is estimated by the size of its file on disk.
+    Least recently used models are evicted first. \n
+    """
+    def __init__(self, max_size_gb: float = 4.0):
+        self.max_size_gb = max_size_gb
+        self._models = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def load(self, path: Union[str, Path], loader: Callable, loader_name: str, size: int = None):
+        """
+        Return cached model or load it with loader and store it.
+        :param path: Model file path.
+        :param loader: Function that loads a model from path.
+        :param loader_name: Identifier of loader, used in the cache key.
+        :param size: Estimated size of model in bytes. Size of file at path by default.
+        """
+        path = Path(path)
+        stat = path.stat()
+        size = stat.st_size if size is None else size
+        key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns, loader_name)
+        with self._lock:
+            if key in self._models:
+                self.hits += 1
+                self._models.move_to_end(key)
+                return self._models[key][0]
+            self.misses += 1
+        # Load outside of the lock so threads can load different models concurrently.
+        model = loader(path)
+        with self._lock:
+            if key not in self._models:
+                self._models[key] = (model, size)
+                self._size += size
+                self._evict()
+        return model
+
+    @property
+    def stats(self) -> dict:
+        """ Hit/miss counts, hit rate, evictions and size of the cache. """
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / total if total else 0.,
+                "evictions": self.evictions, "entries": len(self._models), "size_gb": self._size / 1024 ** 3}
+
+    def clear(self):
+        """ Remove all cached models and reset stats. """
+        with self._lock:
+            self._models.clear()
+            self._size = 0
+            self.hits, self.misses, self.evictions = 0, 0, 0
+
+    def _evict(self):
+        """ Remove least recently used models until the cache is within its memory budget. """
+        while self._models and self._size > self.max_size_gb * 1024 ** 3:
+            _, (_, size) = self._models.popitem(last=False)
+            self._size -= size
+            self.evictions += 1
+
+# %% ../nbs/04_model.ipynb 17
+class OnnxModel:
+    """
+    ONNX Runtime inference session for a model exported with export_onnx.
+
+    :param model_path: Path to .onnx file. \n
+    :param num_threads: Maximum number of threads for the session. ONNX Runtime default by default.
+    """
+    def __init__(self, model_path: Union[str, Path], num_threads: int = None):
+        self.model_path = Path(model_path)
+        self.num_threads = num_threads
+        self._start_session()
+
+    def _start_session(self):
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            raise ImportError("ONNX Runtime not installed. Install the ONNX dependencies with 'pip install numerblox[onnx]'.")
+        options = ort.SessionOptions()
+        options.log_severity_level = 3
+        if self.num_threads:
+            options.intra_op_num_threads = self.num_threads
+            options.inter_op_num_threads = 1
+        self.session = ort.InferenceSession(str(self.model_path), sess_options=options, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+
+    def predict(self, X: Union[np.ndarray, pd.DataFrame]) -> Union[np.ndarray, list]:
+        """
+        Predict on float32 input.
+        :param X: 2D array (rows x features).
+        :return: Array of predictions. List of arrays for models with multiple outputs.
+        """
+        X = np.ascontiguousarray(X.to_numpy() if isinstance(X, pd.DataFrame) else X, dtype=np.float32)
+        outputs = self.session.run(None, {self.input_name: X})
+        outputs = [output.reshape(len(X)) if output.ndim == 2 and output.shape[1] == 1 else output for output in outputs]
+        return outputs[0] if len(outputs) == 1 else outputs
+
+    def __getstate__(self) -> dict:
+        # Sessions can't be pickled (for example for process workers), so they are started again after unpickling.
+        return {"model_path": self.model_path, "num_threads": self.num_threads}
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._start_session()
+
+# %% ../nbs/04_model.ipynb 18
+def export_onnx(model, onnx_path: Union[str, Path], n_features: int = None) -> Path:
+    """
+    Export LightGBM, CatBoost, scikit-learn or Keras model to ONNX.
+
+    :param model: Loaded model. \n
+    :param onnx_path: Destination .onnx file. \n
+    :param n_features: Number of input features. Inferred from the model by default.
+    :return: Path to .onnx file.
+    """
+    onnx_path = Path(onnx_path)
+    if n_features is None:
+        if hasattr(model, "num_feature"):
+            n_features = model.num_feature()
+        elif hasattr(model, "n_features_in_"):
+            n_features = model.n_features_in_
+        elif hasattr(model, "input_shape"):
+            n_features = model.input_shape[-1]
+    library = type(model).__module__.split(".")[0]
+    # Write to a temporary file first so an interrupted export never leaves a broken .onnx file.
+    tmp_path = onnx_path.with_name(f".{onnx_path.name}.tmp")
+    if library == "catboost":
+        model.save_model(str(tmp_path), format="onnx")
+    elif library in ("keras", "tensorflow", "tf_keras"):
+        import tensorflow as tf
+        try:
+            import tf2onnx
+        except ImportError:
+            raise ImportError("tf2onnx not installed. Install the ONNX dependencies with 'pip install numerblox[onnx]'.")
+        tf2onnx.convert.from_keras(model, input_signature=[tf.TensorSpec([None, n_features], tf.float32, name="input")],
+                                   output_path=str(tmp_path))
+    else:
+        assert n_features, f"Could not infer number of features for model of type '{type(model).__name__}'. Provide n_features."
+        try:
+            from onnxmltools.convert.common.data_types import FloatTensorType
+        except ImportError:
+            raise ImportError("onnxmltools not installed. Install the ONNX dependencies with 'pip install numerblox[onnx]'.")
+        initial_types = [("input", FloatTensorType([None, n_features]))]
+        if library == "lightgbm":
+            import onnxmltools
+            onnx_model = onnxmltools.convert_lightgbm(model, initial_types=initial_types)
+        else:
+            from skl2onnx import to_onnx
+            onnx_model = to_onnx(model, initial_types=initial_types)
+        tmp_path.write_bytes(onnx_model.SerializeToString())
+    os.replace(tmp_path, onnx_path)
+    return onnx_path
+
+# %% ../nbs/04_model.ipynb 21
+class PredictionCache:
+    """
+    Persistent cache of model predictions.
+
+    :param cache_dir: Directory to store cached predictions. \n
+    :param max_size_gb: Maximum size of the cache in GB. Least recently used entries are evicted first.
+    """
+    # Naming attributes are not part of the cache key. Without a model_name they are a new random name for every instance.
+    NAME_ATTRIBUTES = ("model_name", "prediction_col_name", "description")
+    # Prediction columns are stored under this name and renamed to the prediction_col_name of the model on load.
+    PREDICTION_COL = "__prediction__"
+
+    def __init__(self, cache_dir: str = "~/.numerblox/prediction_cache", max_size_gb: float = 5.0):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_gb = max_size_gb
+        self.hits = 0
+        self.misses = 0
+        # Model file hashes by (path, size, mtime), so unchanged model files are only read once.
+        self._artifact_hashes = {}
+
+    def __call__(self, model: BaseModel, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
+        """
+        Load predictions from cache or run predict and store the prediction columns.
+        :param model: Model to predict with.
+        :param dataf: Input data.
+        """
+        dataf = dataf if isinstance(dataf, NumerFrame) else NumerFrame(dataf)
+        key = self.cache_key(model, dataf)
+        if key is not None and (self.cache_dir / f"{key}.arrow").exists():
+            self.hits += 1
+            return self._load(key, dataf, model)
+        self.misses += 1
+        input_index, input_columns = dataf.index, dataf.columns
+        result = model.predict(dataf)
+        if key is not None and result.index.equals(input_index):
+            self._store(key, result, input_columns, model)
+        return result
+
+    @property
+    def stats(self) -> dict:
+        """ Hit/miss counts, hit rate and size of the cache. """
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / total if total else 0.,
+                "entries": len(list(self.cache_dir.glob("*.arrow"))), "size_gb": self._size() / 1024 ** 3}
+
+    def clear(self):
+        """ Remove all cached predictions and reset stats and model file hashes. """
+        for path in self.cache_dir.glob("*.arrow"):
+            path.unlink()
+        self.hits, self.misses = 0, 0
+        self._artifact_hashes = {}
+
+    def cache_key(self, model: BaseModel, dataf: NumerFrame) -> Union[str, None]:
+        """
+        Key from model file hashes, model class and parameters, feature columns and input fingerprint.
+        Model names are not part of the key, so renamed and unnamed models share cached predictions.
+        :return: Cache key or None if the model has no model files or cannot be fingerprinted.
+        """
+        if not model.artifact_paths:
+            return None
+        try:
+            feature_cols = list(getattr(model, "feature_cols", None) or dataf.feature_cols)
+            params = {name: value for name, value in vars(model).items()
+                      if not name.startswith("_") and name not in self.NAME_ATTRIBUTES
+                      and isinstance(value, (str, int, float, bool, type(None), Path))}
+            artifact_hashes = sorted(self.artifact_hash(path) for path in model.artifact_paths)
+            return joblib.hash((type(model).__module__, type(model).__qualname__, params, artifact_hashes,
+                                feature_cols, self.input_fingerprint(dataf, feature_cols)))
+        except (TypeError, KeyError, OSError, pickle.PicklingError):
+            return None
+
+    def artifact_hash(self, path: Union[str, Path]) -> str:
+        """ Content hash of model file. """
+        path = Path(path).resolve()
+        stat = path.stat()
+        key = (str(path), stat.st_size, stat.st_mtime_ns)
+        if key not in self._artifact_hashes:
+            digest = hashlib.blake2b(digest_size=16)
+            with open(path, "rb") as file:
+                for block in iter(lambda: file.read(2 ** 20), b""):
+                    digest.update(block)
+            self._artifact_hashes[key] = digest.hexdigest()
+        return self._artifact_hashes[key]
+
+    @staticmethod
+    def input_fingerprint(dataf: NumerFrame, feature_cols: list) -> str:
+        """
+        Hash of index and feature values. Numeric columns are hashed from their raw bytes.
+        :param dataf: Input data.
+        :param feature_cols: Features the model predicts on.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(pd.util.hash_pandas_object(dataf.index).to_numpy().tobytes())
+        for col in feature_cols:
+            values = dataf[col]
+            array = values.to_numpy()
+            if array.dtype.kind not in "biufcmM":
+                array = pd.util.hash_pandas_object(values, index=False).to_numpy()
+            digest.update(f"{col}:{array.dtype}".encode())
+            digest.update(np.ascontiguousarray(array).view(np.uint8))
+        return digest.hexdigest()
+
+    def _load(self, key: str, dataf: NumerFrame, model: BaseModel) -> NumerFrame:
+        """ Attach stored prediction columns to input data. """
+        arrow_path = self.cache_dir / f"{key}.arrow"
+        # Touch entry so it is most recently used.
+        os.utime(arrow_path)
+        stored = pd.read_feather(arrow_path)
+        stored.index = dataf.index
+        stored.columns = [model.prediction_col_name + col[len(self.PREDICTION_COL):] if col.startswith(self.PREDICTION_COL) else col
+                          for col in stored.columns]
+        result = dataf.add_columns(stored)
+        rich_print(f":floppy_disk: Loaded predictions of [bold]{model.description}[/bold] from cache. Output shape={result.shape}. :floppy_disk:")
+        return result
+
+    def _store(self, key: str, result: NumerFrame, input_columns: pd.Index, model: BaseModel):
+        """ Store prediction columns and evict old entries. """
+        # Prediction columns of this model are also stored if they already existed in the input.
+        stored_columns = [col for col in result.columns
+                          if col not in input_columns or str(col).startswith(model.prediction_col_name)]
+        if not stored_columns or not all(isinstance(col, str) for col in stored_columns):
+            return
+        stored = result[stored_columns].reset_index(drop=True)
+        stored.columns = [self.PREDICTION_COL + col[len(model.prediction_col_name):] if col.startswith(model.prediction_col_name) else col
+                          for col in stored_columns]
+        stored.to_feather(self.cache_dir / f"{key}.arrow", compression="uncompressed")
+        self._evict()
+
+    def _size(self) -> int:
+        """ Total size of cached predictions in bytes. """
+        return sum(path.stat().st_size for path in self.cache_dir.glob("*.arrow"))
+
+    def _evict(self):
+        """ Remove least recently used entries until the cache fits in max_size_gb. """
+        paths = sorted(self.cache_dir.glob("*.arrow"), key=lambda path: path.stat().st_mtime)
+        size = self._size()
+        while paths and size > self.max_size_gb * 1024 ** 3:
+            path = paths.pop(0)
+            size -= path.stat().st_size
+            path.unlink()
+
+# %% ../nbs/04_model.ipynb 24
+class ModelServer:
+    """
+    Local prediction server that keeps models loaded between pipeline runs.
+
+    :param models: Models to serve. Clients request a model by its model_name. \n
+    :param socket_path: Unix socket to listen on. \n
+    :param max_size_gb: Memory budget in GB of the ModelCache that keeps models loaded. \n
+    :param authkey: Key that clients need to connect. By default a random key is generated when serving starts
+    and written to a key file next to the socket ('<socket_path>.key') that only the current user can read. \n
+    :param handshake_timeout: Seconds a client gets to authenticate and send its request before it is disconnected. \n
+    :param max_connections: Maximum number of clients that are handled at once. Other clients wait until a handler is free.
+    """
+    def __init__(self, models: list, socket_path: str = "~/.numerblox/model_server.sock",
+                 max_size_gb: float = 16.0, authkey: bytes = None, handshake_timeout: float = 10.0,
+                 max_connections: int = 8):
+        self.models = {model.model_name: model for model in models}
+        assert len(self.models) == len(models), "Model names of served models must be unique."
+        assert handshake_timeout > 0, f"handshake_timeout should be positive. Got {handshake_timeout}."
+        assert max_connections >= 1, f"max_connections should be at least 1. Got {max_connections}."
+        self.socket_path = Path(socket_path).expanduser()
+        self.key_path = _server_key_path(self.socket_path)
+        self.authkey = authkey
+        self.handshake_timeout = handshake_timeout
+        self.max_connections = max_connections
+        self.model_cache = ModelCache(max_size_gb=max_size_gb)
+        for model in self.models.values():
+            model.model_cache = self.model_cache
+        # One request at a time per model, while different models can predict concurrently.
+        self._model_locks = {name: threading.Lock() for name in self.models}
+        self._listener = None
+        self._thread = None
+        self._closing = False
+        self._connection_slots = threading.BoundedSemaphore(max_connections)
+        self._serve_authkey = None
+
+    def warm(self):
+        """ Load all models into the model cache. """
+        for model in self.models.values():
+            if isinstance(model, DirectoryModel):
+                model.load_models()
+            elif isinstance(model, SingleModel):
+                model._load_model()
+
+    def serve(self):
+        """ Load models and handle requests until close is called. """
+        self.warm()
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Remove socket file left behind by a server that did not shut down cleanly.
+        self.socket_path.unlink(missing_ok=True)
+        self._closing = False
+        self._serve_authkey = self.authkey
+        if self._serve_authkey is None:
+            self._serve_authkey = os.urandom(32)
+            # Create key file with owner-only permissions, so the key is never readable by other users.
+            self.key_path.unlink(missing_ok=True)
+            key_fd = os.open(self.key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(key_fd, "wb") as key_file:
+                key_file.write(self._serve_authkey)
+        # Clients are authenticated in their own thread, so a failing or stalled handshake does not block other clients.
+        self._listener = Listener(str(self.socket_path), family="AF_UNIX")
+        os.chmod(self.socket_path, 0o600)
+        rich_print(f":rocket: Serving {list(self.models)} on '{self.socket_path}'. :rocket:")
+        try:
+            while True:
+                # Wait for a free handler before accepting, so waiting clients queue in the socket backlog instead of holding threads.
+                self._connection_slots.acquire()
+                try:
+                    connection = self._listener.accept()
+                except (AuthenticationError, OSError, EOFError):
+                    self._connection_slots.release()
+                    if self._closing:
+                        break
+                    continue
+                if self._closing:
+                    connection.close()
+                    self._connection_slots.release()
+                    break
+                threading.Thread(target=self._handle, args=(connection,), daemon=True).start()
+        finally:
+            self._listener.close()
+            self._listener = None
+            self.socket_path.unlink(missing_ok=True)
+            if self.authkey is None:
+                self.key_path.unlink(missing_ok=True)
+
+    def start(self) -> "ModelServer":
+        """ Serve in a background thread. Returns when models are loaded and the server accepts requests. """
+        self._thread = threading.Thread(target=self.serve, daemon=True)
+        self._thread.start()
+        while self._listener is None and self._thread.is_alive():
+            self._thread.join(0.01)
+        return self
+
+    def close(self):
+        """ Stop accepting requests and remove the socket file. """
+        if self._listener is not None:
+            self._closing = True
+            # Closing the listener does not interrupt a blocking accept, so wake it up with a last connection.
+            Client(str(self.socket_path), family="AF_UNIX").close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _handle(self, connection):
+        """ Authenticate client and answer a single request. Errors are sent back to the client. """
+        try:
+            with connection:
+                _set_receive_timeout(connection, self.handshake_timeout)
+                try:
+                    deliver_challenge(connection, self._serve_authkey)
+                    answer_challenge(connection, self._serve_authkey)
+                    request = connection.recv()
+                except (AuthenticationError, OSError, EOFError):
+                    # Wrong key, disconnected or too slow to authenticate and send request (the timed out read raises OSError).
+                    return
+                self._answer(connection, request)
+        finally:
+            self._connection_slots.release()
+
+    def _answer(self, connection, request: dict):
+        """ Handle request of authenticated client. """
+        try:
+            if request["command"] == "predict":
+                response = self._predict(**request["arguments"])
+            elif request["command"] == "info":
+                response = {"models": list(self.models), "model_cache": self.model_cache.stats}
+            else:
+                raise ValueError(f"Unknown command '{request['command']}'.")
+        except Exception as e:
+            response = {"error": f"{type(e).__name__}: {e}"}
+        connection.send(response)
+
+    def _predict(self, model_name: str, shm_name: str, shape: tuple, dtype: str, feature_cols: list, pid: int) -> dict:
+        """ Predict with model on features in shared memory of client. """
+        assert model_name in self.models, f"Model '{model_name}' is not served. Available models are {list(self.models)}."
+        model = self.models[model_name]
+        shm = SharedMemory(name=shm_name)
+        if pid != os.getpid():
+            # The client owns the shared memory. Don't let the resource tracker of the server remove it.
+            resource_tracker.unregister(shm._name, "shared_memory")
+        try:
+            values = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+            dataf = NumerFrame(pd.DataFrame(values, columns=feature_cols, copy=False))
+            with self._model_locks[model_name]:
+                result = model(dataf)
+            prediction_cols = [col for col in result.columns if col not in dataf.columns]
+            # Predictions keep the dtype of the model, so they equal local predictions.
+            predictions = result[prediction_cols].to_numpy(copy=True)
+            del values, dataf, result
+        finally:
+            shm.close()
+        return {"columns": prediction_cols, "predictions": predictions}
+
+
+def _server_key_path(socket_path: Path) -> Path:
+    """ Key file that a ModelServer without authkey writes next to its socket. """
+    return socket_path.with_name(f"{socket_path.name}.key")
+
+
+def _set_receive_timeout(connection, timeout: float):
+    """ Let blocking reads on connection fail with OSError after timeout seconds. """
+    sock = socket.socket(fileno=connection.fileno())
+    try:
+        seconds, microseconds = int(timeout), int(round(timeout % 1 * 1e6))
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, struct.pack("ll", seconds, microseconds))
+    finally:
+        # The connection keeps ownership of the file descriptor.
+        sock.detach()
+
+
+class RemoteModel(BaseModel):
+    """
+    Predict with a model loaded in a ModelServer.
+
+    :param model_name: Name of model on the server. Also used for prediction column names. \n
+    :param socket_path: Unix socket of the server. \n
+    :param feature_cols: optional list of features to send to the server. Sends all feature columns (i.e. column names with prefix 'feature') by default. \n
+    :param authkey: Key of the server, if it was started with an authkey. By default the key is read from the key file of the server.
+    """
+    def __init__(self, model_name: str, socket_path: str = "~/.numerblox/model_server.sock",
+                 feature_cols: list = None, authkey: bytes = None):
+        super().__init__(model_directory="",
+                         model_name=model_name,
+                         )
+        self.socket_path = Path(socket_path).expanduser()
+        self.feature_cols = feature_cols
+        self.authkey = authkey
+
+    @display_processor_info
+    def predict(self, dataf: NumerFrame) -> NumerFrame:
+        """ Place features in shared memory and let the server predict. """
+        dataf = dataf if isinstance(dataf, NumerFrame) else NumerFrame(dataf)
+        feature_cols = self.feature_cols if self.feature_cols else dataf.feature_cols
+        features = dataf.get_feature_matrix(feature_cols)
+        shm = SharedMemory(create=True, size=max(features.nbytes, 1))
+        try:
+            shared_values = np.ndarray(features.shape, dtype=features.dtype, buffer=shm.buf)
+            shared_values[:] = features
+            del shared_values
+            response = self._request("predict", model_name=self.model_name, shm_name=shm.name, shape=features.shape,
+                                     dtype=features.dtype.str, feature_cols=list(feature_cols), pid=os.getpid())
+        finally:
+            shm.close()
+            shm.unlink()
+        return dataf.add_columns(response["predictions"], names=response["columns"])
+
+    def info(self) -> dict:
+        """ Served models and model cache stats of the server. """
+        return self._request("info")
+
+    def _request(self, command: str, **arguments) -> dict:
+        authkey = self.authkey
+        if authkey is None:
+            # Read at every request, because the server generates a new key when it restarts.
+            key_path = _server_key_path(self.socket_path)
+            assert key_path.is_file(), f"No key file '{key_path}'. Start a ModelServer on '{self.socket_path}' or provide its authkey."
+            authkey = key_path.read_bytes()
+        with Client(str(self.socket_path), family="AF_UNIX", authkey=authkey) as connection:
+            connection.send({"command": command, "arguments": arguments})
+            response = connection.recv()
+        if "error" in response:
+            raise RuntimeError(f"Model server could not handle '{command}' request. {response['error']}")
+        return response
+
+# %% ../nbs/04_model.ipynb 27
+def model_used_features(model, feature_cols: list) -> Union[list, None]:
+    """
+    Features a loaded model uses, in the order of feature_cols.
+
+    :param model: Loaded model. LightGBM, CatBoost, LGBMTreeEnsemble or scikit-learn model with feature_names_in_. \n
+    :param feature_cols: Features in the order the model expects them.
+    :return: List of used features. None if usage is unknown.
+    """
+    feature_cols = list(feature_cols)
+    library = type(model).__module__.split(".")[0]
+    if isinstance(model, LGBMTreeEnsemble):
+        n_features, used_idxs = model.num_features, model.split_features
+    elif library == "lightgbm":
+        booster = model.booster_ if hasattr(model, "booster_") else model
+        n_features, used_idxs = booster.num_feature(), np.flatnonzero(booster.feature_importance(importance_type="split"))
+    elif library == "catboost":
+        n_features, used_idxs = _catboost_split_features(model)
+    elif hasattr(model, "feature_names_in_"):
+        model_features = set(model.feature_names_in_)
+        return [col for col in feature_cols if col in model_features]
+    else:
+        return None
+    # Trees refer to features by position, so positions can only be mapped if the number of features matches.
+    if used_idxs is None or n_features != len(feature_cols):
+        return None
+    used_idxs = set(int(idx) for idx in used_idxs)
+    return [col for i, col in enumerate(feature_cols) if i in used_idxs]
+
+
+def _catboost_split_features(model) -> tuple:
+    """ Number of features and positions of features used in splits from JSON export of CatBoost model. """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model.save_model(f"{tmp_dir}/model.json", format="json")
+        dump = json.loads(Path(f"{tmp_dir}/model.json").read_text())
+    features_info = dump["features_info"]
+    float_features = features_info.get("float_features", [])
+    # Categorical features are also used through combinations (CTRs), which are not mapped here.
+    if features_info.get("categorical_features"):
+        return len(float_features), None
+    flat_idxs = {feature["feature_index"]: feature["flat_feature_index"] for feature in float_features}
+    used_idxs = set()
+    nodes = [dump.get("oblivious_trees", dump.get("trees", []))]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, dict):
+            if "float_feature_index" in node:
+                used_idxs.add(flat_idxs[node["float_feature_index"]])
+            nodes.extend(node.values())
+        elif isinstance(node, list):
+            nodes.extend(node)
+    return len(float_features), used_idxs
+
+# %% ../nbs/04_model.ipynb 32
 class SingleModel(BaseModel):
     """
     Load single model from file and perform prediction logic.
@@ -126,14 +1056,18 @@ class SingleModel(BaseModel):
     Will take the 3rd of tuple output in this case. Only relevant for NN models.
     More info on autoencoders:
     https://forum.numer.ai/t/autoencoder-and-multitask-mlp-on-new-dataset-from-kaggle-jane-street/4338 \n
-    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default.
+    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default. \n
+    :param backend: "native" (default) predicts with the loaded model. "onnx" exports the model to ONNX once and predicts with ONNX Runtime. \n
+    :param batch_size: Number of rows per forward pass for Keras models. \n
+    :param threads: Maximum number of threads for ONNX Runtime (backend "onnx"). ONNX Runtime default by default.
     """
     def __init__(self, model_file_path: str, model_name: str = None,
                  combine_preds = False, autoencoder_mlp = False,
-                 feature_cols: list = None
+                 feature_cols: list = None,
+                 backend: str = "native",
+                 batch_size: int = 8192,
+                 threads: int = None,
                  ):
-        import tensorflow as tf
-        from catboost import CatBoost
         self.model_file_path = Path(model_file_path)
         assert self.model_file_path.exists(), f"File path '{self.model_file_path}' does not exist."
         assert self.model_file_path.is_file(), f"File path must point to file. Not valid for '{self.model_file_path}'."
@@ -141,33 +1075,151 @@ class SingleModel(BaseModel):
                          model_name=model_name,
                          )
         self.model_suffix = self.model_file_path.suffix
+        # Heavy libraries are only imported when a model is loaded.
         self.suffix_to_model_mapping = {".joblib": joblib.load,
-                                        ".cbm": CatBoost().load_model,
+                                        ".cbm": _load_catboost,
                                         ".pkl": pickle.load,
                                         ".pickle": pickle.load,
-                                        ".h5": partial(tf.keras.models.load_model, compile=False)
+                                        ".h5": partial(_load_keras, compile=False)
                                         }
         self.__check_valid_suffix()
         self.combine_preds = combine_preds
         self.autoencoder_mlp = autoencoder_mlp
         self.feature_cols = feature_cols
+        assert backend in ("native", "onnx"), f"backend should be 'native' or 'onnx'. Got '{backend}'."
+        self.backend = backend
+        self.threads = threads
+        # ONNX Runtime session is reused across predict calls.
+        self._onnx_model = None
+        assert batch_size > 0, f"batch_size should be a positive integer. Got '{batch_size}'."
+        self.batch_size = batch_size
+        # Compiled forward pass of Keras model. Reused while the same model is loaded and dropped when it is evicted.
+        self._keras_forward = None
 
     def predict(self, dataf: NumerFrame, *args, **kwargs) -> NumerFrame:
         model = self._load_model(*args, **kwargs)
+        dataf = dataf if isinstance(dataf, NumerFrame) else NumerFrame(dataf)
         feature_cols = self.feature_cols if self.feature_cols else dataf.feature_cols
-        predictions = model.predict(dataf[feature_cols])
-        # Check for if model output is a Pandas DataFrame
-        predictions = predictions.values if isinstance(predictions, pd.DataFrame) else predictions
-        predictions = predictions[2] if self.autoencoder_mlp else predictions
-        predictions = predictions.mean(axis=1) if self.combine_preds else predictions
+        predictions = self._model_predictions(model, self._get_features(dataf, feature_cols))
         prediction_cols = self.get_prediction_col_names(predictions.shape)
-        dataf.loc[:, prediction_cols] = predictions
+        prediction_cols = [prediction_cols] if isinstance(prediction_cols, str) else prediction_cols
         del model; gc.collect()
-        return NumerFrame(dataf)
+        return dataf.add_columns(np.asarray(predictions).reshape(len(dataf), -1), names=prediction_cols)
+
+    @property
+    def artifact_paths(self) -> list:
+        return [self.model_file_path]
+
+    def used_features(self, feature_cols: list) -> list:
+        """
+        Features the model uses (see model_used_features), in the order of feature_cols.
+        :param feature_cols: Features the model predicts on. self.feature_cols if set.
+        """
+        feature_cols = list(self.feature_cols) if self.feature_cols else list(feature_cols)
+        # Keras models use all inputs, so they are not loaded for inspection.
+        if self.model_suffix == ".h5":
+            return feature_cols
+        if not hasattr(self, "_used_features"):
+            self._used_features = {}
+        key = tuple(feature_cols)
+        if key not in self._used_features:
+            used_cols = model_used_features(self._load_native_model(), feature_cols)
+            self._used_features[key] = feature_cols if used_cols is None else used_cols
+        return self._used_features[key]
+
+    def _model_predictions(self, model, features: pd.DataFrame) -> np.ndarray:
+        """ Predict and select model output. """
+        if type(model).__module__.split(".")[0] in ("keras", "tensorflow", "tf_keras"):
+            predictions = self._keras_predictions(model, features)
+        else:
+            predictions = model.predict(features)
+            # Check for if model output is a Pandas DataFrame
+            predictions = predictions.values if isinstance(predictions, pd.DataFrame) else predictions
+            predictions = predictions[2] if self.autoencoder_mlp else predictions
+        predictions = predictions.mean(axis=1) if self.combine_preds else predictions
+        return np.asarray(predictions)
+
+    def _keras_predictions(self, model, features: pd.DataFrame) -> np.ndarray:
+        """
+        Predict with Keras model in a compiled forward pass (tf.function) on float32 chunks of self.batch_size rows.
+        For autoencoder_mlp models only the MLP head (3rd output) is computed.
+        :param model: Loaded Keras model.
+        :param features: Features (rows x features).
+        """
+        import tensorflow as tf
+        n_features = features.shape[1]
+        forward = self._keras_forward
+        if forward is None or forward["model"]() is not model or forward["n_features"] != n_features:
+            head = tf.keras.Model(model.inputs, model.outputs[2]) if self.autoencoder_mlp else model
+            if len(head.outputs) > 1:
+                # Multi-output models are predicted with Keras itself, which returns a list of outputs.
+                return np.asarray(model.predict(features.to_numpy(dtype=np.float32), batch_size=self.batch_size, verbose=0))
+            # Only a weak reference to the model is kept, so it can be freed when the model cache evicts it.
+            model_ref = weakref.ref(model, self._drop_keras_forward)
+            head_ref = model_ref if head is model else (lambda mlp_head=head: mlp_head)
+            forward = {"model": model_ref, "n_features": n_features, "output_shape": tuple(head.outputs[0].shape[1:]),
+                       "function": tf.function(lambda batch: head_ref()(batch, training=False),
+                                               input_signature=[tf.TensorSpec([None, n_features], tf.float32)])}
+            self._keras_forward = forward
+        predictions = np.empty((len(features), *forward["output_shape"]), dtype=np.float32)
+        for start in range(0, len(features), self.batch_size):
+            # Only one batch of features is converted to float32 at a time.
+            batch = features.iloc[start:start + self.batch_size].to_numpy(dtype=np.float32)
+            predictions[start:start + len(batch)] = forward["function"](tf.constant(batch)).numpy()
+        return predictions
+
+    def _drop_keras_forward(self, model_ref: weakref.ref):
+        """ Drop compiled forward pass (and the model weights it captures) when its model is freed. """
+        if self._keras_forward is not None and self._keras_forward["model"] is model_ref:
+            self._keras_forward = None
+
+    def __getstate__(self) -> dict:
+        # Compiled forward passes can't be pickled (for example for process workers), so they are compiled again when needed.
+        state = self.__dict__.copy()
+        state["_keras_forward"] = None
+        return state
+
+    def check_onnx(self, dataf: NumerFrame, n_rows: int = 1000, rtol: float = 1e-3, atol: float = 1e-5) -> float:
+        """
+        Verify that the ONNX model gives the same predictions as the native model.
+        :param dataf: NumerFrame with features. \n
+        :param n_rows: Number of rows to compare predictions on. \n
+        :param rtol: Relative tolerance. ONNX Runtime predicts in float32. \n
+        :param atol: Absolute tolerance. \n
+        :return: Maximum absolute difference.
+        """
+        dataf = NumerFrame(dataf.iloc[:n_rows])
+        feature_cols = self.feature_cols if self.feature_cols else dataf.feature_cols
+        features = self._get_features(dataf, feature_cols)
+        native_predictions = self._model_predictions(self._load_native_model(), features).reshape(len(dataf), -1)
+        onnx_model = self._onnx_model or self._load_onnx_model(self.model_file_path)
+        onnx_predictions = self._model_predictions(onnx_model, features).reshape(len(dataf), -1)
+        difference = float(np.abs(onnx_predictions - native_predictions).max())
+        assert np.allclose(onnx_predictions, native_predictions, rtol=rtol, atol=atol), \
+            f"ONNX predictions for '{self.model_file_path.name}' differ from native predictions. Max difference: {difference}"
+        return difference
 
     def _load_model(self, *args, **kwargs):
-        """ Load arbitrary model from path using suffix to model mapping. """
-        return self.suffix_to_model_mapping[self.model_suffix](str(self.model_file_path), *args, **kwargs)
+        """ Load model (or ONNX model if backend is 'onnx'). Served from self.model_cache if it is set. """
+        if self.backend == "onnx":
+            if self._onnx_model is None:
+                self._onnx_model = self._cached_load(self.model_file_path, self._load_onnx_model, f"SingleModel{self.model_suffix}:onnx")
+            return self._onnx_model
+        return self._load_native_model(*args, **kwargs)
+
+    def _load_onnx_model(self, path: Path) -> OnnxModel:
+        """ Load ONNX export of model. Exports the model first if no up to date export exists. """
+        onnx_path = Path(f"{path}.onnx")
+        if not onnx_path.exists() or onnx_path.stat().st_mtime_ns < Path(path).stat().st_mtime_ns:
+            export_onnx(self.suffix_to_model_mapping[self.model_suffix](str(path)), onnx_path)
+        return OnnxModel(onnx_path, num_threads=self.threads)
+
+    def _load_native_model(self, *args, **kwargs):
+        """ Load arbitrary model from path using suffix to model mapping. Served from self.model_cache if it is set. """
+        loader = self.suffix_to_model_mapping[self.model_suffix]
+        if args or kwargs:
+            return loader(str(self.model_file_path), *args, **kwargs)
+        return self._cached_load(self.model_file_path, lambda path: loader(str(path)), f"SingleModel{self.model_suffix}")
 
     def __check_valid_suffix(self):
         """ Detailed message if model is not supported in this class. """
@@ -178,7 +1230,17 @@ class SingleModel(BaseModel):
                 f"Format '{self.model_suffix}' is not available. Available versions are {list(self.suffix_to_model_mapping.keys())}"
             )
 
-# %% ../nbs/04_model.ipynb 21
+
+def _load_catboost(path: str, *args, **kwargs):
+    from catboost import CatBoost
+    return CatBoost().load_model(path, *args, **kwargs)
+
+
+def _load_keras(path: str, *args, **kwargs):
+    import tensorflow as tf
+    return tf.keras.models.load_model(path, *args, **kwargs)
+
+# %% ../nbs/04_model.ipynb 39
 class WandbKerasModel(SingleModel):
     """
     Download best .h5 model from Weights & Biases (W&B) run in local directory and make predictions.
@@ -196,7 +1258,8 @@ class WandbKerasModel(SingleModel):
     More info on autoencoders:
     https://forum.numer.ai/t/autoencoder-and-multitask-mlp-on-new-dataset-from-kaggle-jane-street/4338 \n
     :param replace: Replace any model files saved under the same file name with downloaded W&B run model. WARNING: Setting to True may overwrite models in your local environment. \n
-    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default.
+    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default. \n
+    :param batch_size: Number of rows per forward pass.
     """
     def __init__(self,
                  run_path: str,
@@ -204,7 +1267,8 @@ class WandbKerasModel(SingleModel):
                  combine_preds = False,
                  autoencoder_mlp = False,
                  replace = False,
-                 feature_cols: list = None
+                 feature_cols: list = None,
+                 batch_size: int = 8192
                  ):
         self.run_path = run_path
         self.file_name = file_name
@@ -215,7 +1279,8 @@ class WandbKerasModel(SingleModel):
                          model_name=self.run_path,
                          combine_preds=combine_preds,
                          autoencoder_mlp=autoencoder_mlp,
-                         feature_cols=feature_cols
+                         feature_cols=feature_cols,
+                         batch_size=batch_size
                          )
 
     def _download_model(self):
@@ -234,7 +1299,7 @@ class WandbKerasModel(SingleModel):
         run.file(name=self.file_name).download(replace=self.replace)
         os.rename(self.file_name, f"{self.run_path.split('/')[-1]}_{self.file_name}")
 
-# %% ../nbs/04_model.ipynb 24
+# %% ../nbs/04_model.ipynb 42
 class ExternalCSVs(BaseModel):
     """
     Load external submissions and add to NumerFrame. \n
@@ -249,11 +1314,15 @@ class ExternalCSVs(BaseModel):
         if not self.paths:
             rich_print(f":warning: WARNING: No csvs found in directory '{self.data_directory}'. :warning:")
 
+    def used_features(self, feature_cols: list) -> list:
+        """ Predictions don't depend on features. """
+        return []
+
     def predict(self, dataf: NumerFrame) -> NumerFrame:
         """ Return NumerFrame with added external predictions. """
-        for path in tqdm(self.paths, desc="External submissions"):
-            dataf.loc[:, f"prediction_{path.name}"] = self._get_preds(path)
-        return NumerFrame(dataf)
+        external_predictions = {f"prediction_{path.name}": self._get_preds(path)
+                                for path in tqdm(self.paths, desc="External submissions")}
+        return NumerFrame(dataf).add_columns(external_predictions)
 
     def _get_preds(self, path: Path) -> pd.Series:
         pred_col = pd.read_csv(path, index_col=0, header=0)['prediction']
@@ -261,7 +1330,7 @@ class ExternalCSVs(BaseModel):
             raise ValueError(f"Prediction values must be between 0 and 1. Does not hold for '{path.name}'.")
         return pred_col
 
-# %% ../nbs/04_model.ipynb 31
+# %% ../nbs/04_model.ipynb 49
 class NumerBayCSVs(BaseModel):
     """
     Load NumerBay submissions and add to NumerFrame. \n
@@ -290,6 +1359,10 @@ class NumerBayCSVs(BaseModel):
         self.classic_number = 8
         self.signals_number = 11
 
+    def used_features(self, feature_cols: list) -> list:
+        """ Predictions don't depend on features. """
+        return []
+
     def predict(self, dataf: NumerFrame) -> NumerFrame:
         """ Return NumerFrame with added NumerBay predictions. """
         for numerbay_product_full_name in tqdm(self.numerbay_product_full_names, desc="NumerBay submissions"):
@@ -349,7 +1422,7 @@ class NumerBayCSVs(BaseModel):
             raise ValueError(f"Prediction values must be between 0 and 1. Does not hold for '{path.name}'.")
         return pred_col
 
-# %% ../nbs/04_model.ipynb 37
+# %% ../nbs/04_model.ipynb 55
 class JoblibModel(DirectoryModel):
     """
     Load and predict for arbitrary models in directory saved as .joblib.
@@ -358,74 +1431,530 @@ class JoblibModel(DirectoryModel):
 
     :param model_directory: Main directory from which to read in models. \n
     :param model_name: Name that will be used to create column names and for display purposes. \n
-    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default.
+    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default. \n
+    :param executor: None (default), "thread" or "process" to run models concurrently. See DirectoryModel. \n
+    :param num_workers: Number of models to run concurrently. \n
+    :param threads_per_model: Maximum number of threads every model may use internally. \n
+    :param streaming: Load models one at a time instead of all up front. See DirectoryModel. \n
+    :param prefetch: Load the next model in a background thread while streaming. \n
+    :param chunk_size: Optional maximum number of rows every model predicts on at once. \n
+    :param backend: "native" (default) or "onnx" to predict with ONNX Runtime. See DirectoryModel.
     """
     def __init__(self,
                  model_directory: str,
                  model_name: str = None,
-                 feature_cols: list = None
+                 feature_cols: list = None,
+                 executor: str = None,
+                 num_workers: int = None,
+                 threads_per_model: int = None,
+                 streaming: bool = False,
+                 prefetch: bool = False,
+                 chunk_size: int = None,
+                 backend: str = "native",
                  ):
         file_suffix = 'joblib'
         super().__init__(model_directory=model_directory,
                          file_suffix=file_suffix,
                          model_name=model_name,
-                         feature_cols=feature_cols
+                         feature_cols=feature_cols,
+                         executor=executor,
+                         num_workers=num_workers,
+                         threads_per_model=threads_per_model,
+                         streaming=streaming,
+                         prefetch=prefetch,
+                         chunk_size=chunk_size,
+                         backend=backend,
                          )
 
-    def load_models(self) -> list:
-        return [joblib.load(path) for path in self.model_paths]
+    def load_model(self, path: Path):
+        return joblib.load(path)
 
-# %% ../nbs/04_model.ipynb 41
+# %% ../nbs/04_model.ipynb 67
 class CatBoostModel(DirectoryModel):
     """
     Load and predict with all .cbm models (CatBoostRegressor) in directory.
 
     :param model_directory: Main directory from which to read in models. \n
     :param model_name: Name that will be used to define column names and for display purposes. \n
-    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default.
+    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default. \n
+    :param executor: None (default), "thread" or "process" to run models concurrently. See DirectoryModel. \n
+    :param num_workers: Number of models to run concurrently. \n
+    :param threads_per_model: Maximum number of threads every model may use internally. \n
+    :param streaming: Load models one at a time instead of all up front. See DirectoryModel. \n
+    :param prefetch: Load the next model in a background thread while streaming. \n
+    :param chunk_size: Optional maximum number of rows every model predicts on at once. \n
+    :param backend: "native" (default) or "onnx" to predict with ONNX Runtime. See DirectoryModel.
     """
     def __init__(self,
                  model_directory: str,
                  model_name: str = None,
-                 feature_cols: list = None
+                 feature_cols: list = None,
+                 executor: str = None,
+                 num_workers: int = None,
+                 threads_per_model: int = None,
+                 streaming: bool = False,
+                 prefetch: bool = False,
+                 chunk_size: int = None,
+                 backend: str = "native",
                  ):
         from catboost import CatBoost
         file_suffix = 'cbm'
         super().__init__(model_directory=model_directory,
                          file_suffix=file_suffix,
                          model_name=model_name,
-                         feature_cols=feature_cols
+                         feature_cols=feature_cols,
+                         executor=executor,
+                         num_workers=num_workers,
+                         threads_per_model=threads_per_model,
+                         streaming=streaming,
+                         prefetch=prefetch,
+                         chunk_size=chunk_size,
+                         backend=backend,
                          )
 
-    def load_models(self) -> list:
-        return [CatBoost().load_model(path) for path in self.model_paths]
+    def load_model(self, path: Path):
+        from catboost import CatBoost
+        return CatBoost().load_model(str(path))
 
-# %% ../nbs/04_model.ipynb 45
+    def _predict_model(self, model, features: pd.DataFrame, *args, **kwargs):
+        if self.threads_per_model:
+            kwargs.setdefault("thread_count", self.threads_per_model)
+        return model.predict(features, *args, **kwargs)
+
+# %% ../nbs/04_model.ipynb 71
 class LGBMModel(DirectoryModel):
     """
     Load and predict with all .lgb models (LightGBM) in directory.
 
     :param model_directory: Main directory from which to read in models. \n
     :param model_name: Name that will be used to define column names and for display purposes. \n
-    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default.
+    :param feature_cols: optional list of features to use for prediction. Selects all feature columns (i.e. column names with prefix 'feature') by default. \n
+    :param executor: None (default), "thread" or "process" to run models concurrently. See DirectoryModel. \n
+    :param num_workers: Number of models to run concurrently. \n
+    :param threads_per_model: Maximum number of threads every model may use internally. \n
+    :param streaming: Load models one at a time instead of all up front. See DirectoryModel. \n
+    :param prefetch: Load the next model in a background thread while streaming. \n
+    :param chunk_size: Optional maximum number of rows every model predicts on at once. \n
+    :param engine: "lightgbm" (default) predicts with lgb.Booster. "numpy" compiles every model to an LGBMTreeEnsemble. \n
+    :param backend: "native" (default) or "onnx" to predict with ONNX Runtime. See DirectoryModel.
     """
     def __init__(self,
                  model_directory: str,
                  model_name: str = None,
-                 feature_cols: list = None
+                 feature_cols: list = None,
+                 executor: str = None,
+                 num_workers: int = None,
+                 threads_per_model: int = None,
+                 streaming: bool = False,
+                 prefetch: bool = False,
+                 chunk_size: int = None,
+                 engine: str = "lightgbm",
+                 backend: str = "native",
                  ):
+        assert engine in ("lightgbm", "numpy"), f"engine should be 'lightgbm' or 'numpy'. Got '{engine}'."
+        assert engine == "lightgbm" or backend == "native", "The numpy engine can't be combined with the onnx backend."
+        self.engine = engine
         file_suffix = 'lgb'
         super().__init__(model_directory=model_directory,
                          file_suffix=file_suffix,
                          model_name=model_name,
-                         feature_cols=feature_cols
+                         feature_cols=feature_cols,
+                         executor=executor,
+                         num_workers=num_workers,
+                         threads_per_model=threads_per_model,
+                         streaming=streaming,
+                         prefetch=prefetch,
+                         chunk_size=chunk_size,
+                         backend=backend,
                          )
 
-    def load_models(self) -> list:
+    def load_model(self, path: Path):
         import lightgbm as lgb
-        return [lgb.Booster(model_file=str(path)) for path in self.model_paths]
+        booster = lgb.Booster(model_file=str(path))
+        return LGBMTreeEnsemble(booster) if self.engine == "numpy" else booster
+
+    @property
+    def loader_name(self) -> str:
+        return f"{super().loader_name}:{self.engine}"
+
+    def _get_features(self, dataf: NumerFrame, feature_cols: list, dtype = None) -> pd.DataFrame:
+        # The numpy engine compares integer features directly, so keep them as integers.
+        feature_dtypes = dataf.dtypes[[col for col in feature_cols if col in dataf.columns]]
+        if dtype is None and self.engine == "numpy" and all(np.issubdtype(t, np.integer) for t in feature_dtypes):
+            dtype = np.result_type(*feature_dtypes)
+        return super()._get_features(dataf, feature_cols, dtype=dtype)
+
+    def _predict_model(self, model, features: pd.DataFrame, *args, **kwargs):
+        if self.engine == "numpy":
+            return model.predict(features.to_numpy())
+        if self.threads_per_model:
+            kwargs.setdefault("num_threads", self.threads_per_model)
+        return model.predict(features, *args, **kwargs)
+
+# %% ../nbs/04_model.ipynb 75
+class LGBMTreeEnsemble:
+    """
+    LightGBM model compiled to flat node arrays for NumPy inference.
+
+    :param booster: lgb.Booster or path to a LightGBM model file (.lgb). \n
+    :param max_block_size: Maximum number of (row, tree) pairs to evaluate at once. Bounds memory usage.
+    """
+    # Threshold LightGBM uses to treat values as zero for missing_type 'Zero'.
+    ZERO_THRESHOLD = 1e-35
+    IDENTITY_OBJECTIVES = ("regression", "regression_l1", "huber", "fair", "quantile", "mape", "cross_entropy_lambda")
+    EXP_OBJECTIVES = ("poisson", "gamma", "tweedie")
+    # Integer input with more levels than this is evaluated like float input, which bounds the size of the level table.
+    MAX_LEVELS = 256
+
+    def __init__(self, booster, max_block_size: int = 262_144):
+        import lightgbm as lgb
+        booster = booster if isinstance(booster, lgb.Booster) else lgb.Booster(model_file=str(booster))
+        dump = booster.dump_model()
+        if dump["num_tree_per_iteration"] != 1:
+            raise NotImplementedError("Only LightGBM models with a single output are supported.")
+        self.objective = dump["objective"]
+        self.average_output = dump["average_output"]
+        self.num_features = dump["max_feature_idx"] + 1
+        self.max_block_size = max_block_size
+        self._compile([tree["tree_structure"] for tree in dump["tree_info"]])
+
+    def _compile(self, trees: list):
+        """
+        Flatten trees into node arrays. Internal nodes come first, followed by one node per leaf.
+        Leaves point to themselves, so every row can take the same number of steps through a tree.
+        :param trees: Tree structures from lgb.Booster.dump_model.
+        """
+        feature, threshold, default_left, missing_type, left, right, leaf_value = [], [], [], [], [], [], []
+        missing_types = {"None": 0, "Zero": 1, "NaN": 2}
+        max_depth = 0
+
+        def add(node: dict, depth: int) -> int:
+            # Returns node index (>= 0) or -(leaf index + 1).
+            nonlocal max_depth
+            max_depth = max(max_depth, depth)
+            if "leaf_value" in node:
+                leaf_value.append(node["leaf_value"])
+                return -len(leaf_value)
+            if node["decision_type"] != "<=":
+                raise NotImplementedError("Categorical splits are not supported.")
+            index = len(feature)
+            feature.append(node["split_feature"])
+            threshold.append(node["threshold"])
+            default_left.append(node["default_left"])
+            missing_type.append(missing_types[node["missing_type"]])
+            left.append(0)
+            right.append(0)
+            left[index] = add(node["left_child"], depth + 1)
+            right[index] = add(node["right_child"], depth + 1)
+            return index
+
+        roots = np.array([add(tree, 0) for tree in trees], dtype=np.int64)
+        n_internal, n_leaves = len(feature), len(leaf_value)
+        leaf_nodes = np.arange(n_internal, n_internal + n_leaves)
+
+        def to_node(codes: np.ndarray) -> np.ndarray:
+            codes = np.asarray(codes, dtype=np.int64)
+            return np.where(codes >= 0, codes, n_internal - codes - 1)
+
+        self.num_trees = len(roots)
+        self.max_depth = max_depth
+        self.roots = to_node(roots).astype(np.int32)
+        self.feature = np.concatenate([np.array(feature, dtype=np.int32), np.zeros(n_leaves, dtype=np.int32)])
+        self.threshold = np.concatenate([np.array(threshold, dtype=np.float64), np.full(n_leaves, np.inf)])
+        self.default_left = np.concatenate([np.array(default_left, dtype=bool), np.ones(n_leaves, dtype=bool)])
+        self.missing_type = np.concatenate([np.array(missing_type, dtype=np.int8), np.zeros(n_leaves, dtype=np.int8)])
+        self.left = np.concatenate([to_node(left), leaf_nodes]).astype(np.int32)
+        self.right = np.concatenate([to_node(right), leaf_nodes]).astype(np.int32)
+        self.leaf_value = np.concatenate([np.zeros(n_internal), np.array(leaf_value, dtype=np.float64)])
+
+    @property
+    def split_features(self) -> np.ndarray:
+        """ Indices of features that are used in splits. """
+        # Leaves point to themselves.
+        internal = self.left != np.arange(len(self.left))
+        return np.unique(self.feature[internal])
+
+    def predict(self, X: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
+        """
+        Predict for all rows.
+        :param X: 2D array (rows x features) with features in the same order as during training.
+        Integer arrays (like int8) with at most MAX_LEVELS distinct levels are evaluated with a lookup table per node and feature level.
+        :return: 1D array of predictions.
+        """
+        X = np.ascontiguousarray(X.to_numpy() if isinstance(X, pd.DataFrame) else X)
+        assert X.ndim == 2 and X.shape[1] >= self.num_features, f"Expected 2D input with {self.num_features} features. Got shape {X.shape}."
+        next_node, lowest_level, n_levels = None, 0, 0
+        if np.issubdtype(X.dtype, np.integer):
+            lowest_level, highest_level = (int(X.min()), int(X.max())) if X.size else (0, 0)
+            n_levels = highest_level - lowest_level + 1
+            if n_levels <= self.MAX_LEVELS:
+                next_node = self._level_table(lowest_level, highest_level)
+        predictions = np.empty(len(X), dtype=np.float64)
+        block_rows = max(1, self.max_block_size // max(self.num_trees, 1))
+        for start in range(0, len(X), block_rows):
+            block = X[start:start + block_rows]
+            # Float input and wide integer ranges are converted one block at a time.
+            block = block if next_node is not None else block.astype(np.float64, copy=False)
+            predictions[start:start + block_rows] = self._raw_predict(block, next_node, lowest_level, n_levels)
+        return self._convert_output(predictions)
+
+    def _level_table(self, lowest_level: int, highest_level: int) -> np.ndarray:
+        """
+        Next node for every (node, feature level) for integer input.
+        x <= threshold equals x <= floor(threshold) for integer x, so each split only depends on the level.
+        :param lowest_level: Lowest value in input. \n
+        :param highest_level: Highest value in input.
+        :return: Flattened (nodes x levels) table.
+        """
+        levels = np.arange(lowest_level, highest_level + 1)
+        go_left = levels[None, :] <= np.floor(self.threshold)[:, None]
+        # Zero is a missing value for missing_type 'Zero'.
+        if lowest_level <= 0 <= highest_level:
+            zero_missing = self.missing_type == 1
+            go_left[zero_missing, -lowest_level] = self.default_left[zero_missing]
+        next_node = np.where(go_left, self.left[:, None], self.right[:, None]).astype(np.int32)
+        return next_node.ravel()
+
+    def _raw_predict(self, X: np.ndarray, next_node: np.ndarray, lowest_level: int, n_levels: int) -> np.ndarray:
+        """ Sum of leaf values over all trees for a block of rows. """
+        n_rows, n_features = X.shape
+        nodes = np.tile(self.roots, (n_rows, 1))
+        # Offset of every row in the flattened input, so feature values are gathered with one index per (row, tree).
+        row_offsets = (np.arange(n_rows, dtype=np.intp) * n_features)[:, None]
+        flat_X = X.ravel()
+        for _ in range(self.max_depth):
+            values = flat_X[row_offsets + self.feature[nodes]]
+            if next_node is not None:
+                # Levels are computed in intp, so narrow integer input does not wrap around.
+                nodes = next_node[nodes * n_levels + (values.astype(np.intp) - lowest_level)]
+            else:
+                nodes = np.where(self._go_left(values, nodes), self.left[nodes], self.right[nodes])
+        # Cumulative sum adds trees one after another, in the same order as LightGBM.
+        return np.cumsum(self.leaf_value[nodes], axis=1)[:, -1] if self.num_trees else np.zeros(n_rows)
+
+    def _go_left(self, values: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+        """ Decision for float input, including LightGBM's handling of missing values. """
+        missing_type = self.missing_type[nodes]
+        is_nan = np.isnan(values)
+        values = np.where(is_nan & (missing_type != 2), 0., values)
+        is_missing = ((missing_type == 1) & (np.abs(values) <= self.ZERO_THRESHOLD)) | ((missing_type == 2) & is_nan)
+        return np.where(is_missing, self.default_left[nodes], values <= self.threshold[nodes])
+
+    def _convert_output(self, raw: np.ndarray) -> np.ndarray:
+        """ Apply averaging (random forest mode) and the objective's output transformation. """
+        if self.average_output:
+            raw /= self.num_trees
+        objective, *params = self.objective.split(" ")
+        if objective in self.IDENTITY_OBJECTIVES:
+            return raw
+        if objective == "binary":
+            sigmoid = float(dict(param.split(":") for param in params).get("sigmoid", 1.))
+            return 1. / (1. + np.exp(-sigmoid * raw))
+        if objective in self.EXP_OBJECTIVES:
+            return np.exp(raw)
+        raise NotImplementedError(f"Objective '{self.objective}' is not supported.")
+
+# %% ../nbs/04_model.ipynb 88
+BUNDLE_MAGIC = b"NUMERBLOX_BUNDLE"
+# Member data is aligned so NumPy arrays can be used directly from the memory-mapped bundle.
+_BUNDLE_ALIGNMENT = 64
+
+
+def save_model_bundle(model_paths: list, bundle_path: Union[str, Path],
+                      feature_cols: Union[list, dict] = None, weights: dict = None) -> Path:
+    """
+    Write model files into a single bundle file with a manifest.
+
+    :param model_paths: Model files (.lgb, .cbm, .joblib, .pkl or .pickle). \n
+    :param bundle_path: Destination file. \n
+    :param feature_cols: Features of all models (list) or mapping of model file name to features. All feature columns by default. \n
+    :param weights: Mapping of model file name to weight in the ensemble. Equal weights by default.
+    :return: Path to bundle.
+    """
+    bundle_path = Path(bundle_path)
+    model_paths = [Path(path) for path in model_paths]
+    weights = weights if weights else {}
+    members = []
+    tmp_path = bundle_path.with_name(f".{bundle_path.name}.tmp")
+    with open(tmp_path, "wb") as file:
+        # Header with placeholders for position and length of manifest, which is written last.
+        file.write(BUNDLE_MAGIC + struct.pack("<QQ", 0, 0))
+        for path in model_paths:
+            model_format, data, buffers = _serialize_bundle_member(path)
+            member = {"name": path.name, "format": model_format,
+                      "feature_cols": feature_cols.get(path.name) if isinstance(feature_cols, dict) else feature_cols,
+                      "weight": float(weights.get(path.name, 1.))}
+            member["offset"], member["size"] = _write_aligned(file, data)
+            member["buffers"] = [_write_aligned(file, buffer) for buffer in buffers]
+            members.append(member)
+        manifest = json.dumps({"format_version": 1, "members": members}).encode()
+        manifest_offset = file.tell()
+        file.write(manifest)
+        file.seek(len(BUNDLE_MAGIC))
+        file.write(struct.pack("<QQ", manifest_offset, len(manifest)))
+    os.replace(tmp_path, bundle_path)
+    return bundle_path
+
+
+def load_bundle_manifest(bundle_path: Union[str, Path]) -> dict:
+    """ Read manifest of model bundle. """
+    with open(bundle_path, "rb") as file:
+        magic = file.read(len(BUNDLE_MAGIC))
+        assert magic == BUNDLE_MAGIC, f"'{bundle_path}' is not a model bundle."
+        manifest_offset, manifest_size = struct.unpack("<QQ", file.read(16))
+        file.seek(manifest_offset)
+        return json.loads(file.read(manifest_size))
+
+
+def _serialize_bundle_member(path: Path) -> tuple:
+    """ Format, main data and out-of-band buffers of model file. """
+    suffix = path.suffix
+    if suffix in (".lgb", ".cbm"):
+        return suffix[1:], path.read_bytes(), []
+    assert suffix in (".joblib", ".pkl", ".pickle"), f"Format '{suffix}' can't be bundled."
+    model = joblib.load(path) if suffix == ".joblib" else pickle.loads(path.read_bytes())
+    if type(model).__module__.startswith("lightgbm") and hasattr(model, "model_to_string"):
+        return "lgb", model.model_to_string().encode(), []
+    buffers = []
+    data = pickle.dumps(model, protocol=5, buffer_callback=buffers.append)
+    return "pickle", data, [buffer.raw() for buffer in buffers]
+
+
+def _write_aligned(file, data) -> list:
+    """ Write data at next aligned position. Returns offset and size. """
+    file.write(b"\0" * (-file.tell() % _BUNDLE_ALIGNMENT))
+    offset = file.tell()
+    file.write(data)
+    return [offset, len(data)]
+
+
+class _BundleMember:
+    """ Model from a bundle that predicts on its own features and is scaled by its weight in the ensemble. """
+    def __init__(self, model, model_format: str, feature_cols: list, scale: float):
+        self.model = model
+        self.model_format = model_format
+        self.feature_cols = feature_cols
+        self.scale = scale
 
-# %% ../nbs/04_model.ipynb 51
+    def predict(self, features: pd.DataFrame, *args, **kwargs) -> np.ndarray:
+        if self.feature_cols and self.feature_cols != features.columns.tolist():
+            features = features[self.feature_cols]
+        predictions = self.model.predict(features, *args, **kwargs)
+        predictions = predictions.values if isinstance(predictions, pd.DataFrame) else np.asarray(predictions)
+        return predictions * self.scale if self.scale != 1. else predictions
+
+# %% ../nbs/04_model.ipynb 89
+class BundleModel(DirectoryModel):
+    """
+    Predict with the weighted average of all models in a bundle (see save_model_bundle).
+    The bundle is opened once and memory-mapped. Models are loaded when they are used.
+
+    :param bundle_path: Path to bundle file. \n
+    :param model_name: Name that will be used to create column names and for display purposes. \n
+    :param feature_cols: optional list of features to use for prediction. Union of features in the manifest by default
+    (or all feature columns if the manifest has no features). \n
+    :param executor: None, "thread" or "process" to run models concurrently. See DirectoryModel. \n
+    :param num_workers: Number of models to run concurrently. \n
+    :param threads_per_model: Maximum number of threads every model may use internally. \n
+    :param streaming: Load models one at a time and release them after prediction. \n
+    :param prefetch: Load the next model in a background thread while the current model predicts. Only used when streaming. \n
+    :param chunk_size: Optional maximum number of rows every model predicts on at once.
+    """
+    def __init__(self,
+                 bundle_path: str,
+                 model_name: str = None,
+                 feature_cols: list = None,
+                 executor: str = None,
+                 num_workers: int = None,
+                 threads_per_model: int = None,
+                 streaming: bool = False,
+                 prefetch: bool = False,
+                 chunk_size: int = None,
+                 ):
+        self.bundle_path = Path(bundle_path)
+        assert self.bundle_path.is_file(), f"Bundle '{self.bundle_path}' does not exist."
+        self.manifest = load_bundle_manifest(self.bundle_path)
+        self.members = {member["name"]: member for member in self.manifest["members"]}
+        member_features = [member["feature_cols"] for member in self.members.values()]
+        if feature_cols is None and all(member_features):
+            feature_cols = list(dict.fromkeys(col for cols in member_features for col in cols))
+        super().__init__(model_directory=str(self.bundle_path.parent),
+                         file_suffix="",
+                         model_name=model_name,
+                         feature_cols=feature_cols,
+                         executor=executor,
+                         num_workers=num_workers,
+                         threads_per_model=threads_per_model,
+                         streaming=streaming,
+                         prefetch=prefetch,
+                         chunk_size=chunk_size,
+                         )
+        # Members are addressed as paths inside the bundle.
+        self.model_paths = [self.bundle_path / name for name in self.members]
+        self.total_models = len(self.model_paths)
+        total_weight = sum(member["weight"] for member in self.members.values())
+        self._scales = {name: member["weight"] * self.total_models / total_weight for name, member in self.members.items()}
+        self._bundle = None
+
+    def load_model(self, path: Path) -> _BundleMember:
+        """ Load member from memory-mapped bundle. """
+        member = self.members[path.name]
+        data = self._member_view(member["offset"], member["size"])
+        if member["format"] == "lgb":
+            import lightgbm as lgb
+            model = lgb.Booster(model_str=bytes(data).decode())
+        elif member["format"] == "cbm":
+            from catboost import CatBoost
+            model = CatBoost().load_model(blob=bytes(data))
+        else:
+            # NumPy arrays are rebuilt as read-only views on the bundle without copying.
+            buffers = [self._member_view(offset, size) for offset, size in member["buffers"]]
+            model = pickle.loads(data, buffers=buffers)
+        return _BundleMember(model, member["format"], member["feature_cols"], self._scales[path.name])
+
+    def used_features(self, feature_cols: list) -> list:
+        feature_cols = list(self.feature_cols) if self.feature_cols else list(feature_cols)
+        key = tuple(feature_cols)
+        if key not in self._used_features:
+            used_cols = set()
+            for path in self.model_paths:
+                member = self._get_model(path)
+                member_cols = model_used_features(member.model, member.feature_cols or feature_cols)
+                used_cols.update(member.feature_cols or feature_cols if member_cols is None else member_cols)
+            self._used_features[key] = [col for col in feature_cols if col in used_cols]
+        return self._used_features[key]
+
+    def _predict_model(self, model: _BundleMember, features: pd.DataFrame, *args, **kwargs):
+        if self.threads_per_model and model.model_format == "lgb":
+            kwargs.setdefault("num_threads", self.threads_per_model)
+        elif self.threads_per_model and model.model_format == "cbm":
+            kwargs.setdefault("thread_count", self.threads_per_model)
+        return model.predict(features, *args, **kwargs)
+
+    def _member_view(self, offset: int, size: int) -> memoryview:
+        if self._bundle is None:
+            with open(self.bundle_path, "rb") as file:
+                self._bundle = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(self._bundle)[offset:offset + size]
+
+    def _cached_load(self, path: Union[str, Path], loader: Callable, loader_name: str):
+        if self.model_cache is None:
+            return loader(path)
+        # Members are cached by bundle file and member name.
+        return self.model_cache.load(self.bundle_path, lambda _: loader(path), f"{loader_name}:{Path(path).name}",
+                                     size=self.members[Path(path).name]["size"])
+
+    @property
+    def artifact_paths(self) -> list:
+        return [self.bundle_path]
+
+    def __getstate__(self) -> dict:
+        # Memory maps can't be pickled (for example for process workers), so the bundle is opened again when needed.
+        state = self.__dict__.copy()
+        state["_bundle"] = None
+        return state
+
+# %% ../nbs/04_model.ipynb 95
 class ConstantModel(BaseModel):
     """
     WARNING: Only use this Model for testing purposes. \n
@@ -442,11 +1971,15 @@ class ConstantModel(BaseModel):
                          )
         self.clf = DummyRegressor(strategy='constant', constant=constant).fit([0.], [0.])
 
+    def used_features(self, feature_cols: list) -> list:
+        """ Predictions don't depend on features. """
+        return []
+
     def predict(self, dataf: NumerFrame) -> NumerFrame:
         dataf.loc[:, self.prediction_col_name] = self.clf.predict(dataf.get_feature_data)
         return NumerFrame(dataf)
 
-# %% ../nbs/04_model.ipynb 55
+# %% ../nbs/04_model.ipynb 99
 class RandomModel(BaseModel):
     """
     WARNING: Only use this Model for testing purposes. \n
@@ -460,11 +1993,15 @@ class RandomModel(BaseModel):
                          model_name=model_name
                          )
 
+    def used_features(self, feature_cols: list) -> list:
+        """ Predictions don't depend on features. """
+        return []
+
     def predict(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
         dataf.loc[:, self.prediction_col_name] = np.random.uniform(size=len(dataf))
         return NumerFrame(dataf)
 
-# %% ../nbs/04_model.ipynb 59
+# %% ../nbs/04_model.ipynb 103
 class ExamplePredictionsModel(BaseModel):
     """
     Load example predictions and add to NumerFrame. \n
@@ -487,6 +2024,10 @@ class ExamplePredictionsModel(BaseModel):
         self.data_directory = data_directory
         self.round_num = round_num
 
+    def used_features(self, feature_cols: list) -> list:
+        """ Predictions don't depend on features. """
+        return []
+
     @display_processor_info
     def predict(self, dataf: NumerFrame) -> NumerFrame:
         """ Return NumerFrame with added example predictions. """
@@ -506,7 +2047,7 @@ class ExamplePredictionsModel(BaseModel):
     def _load_example_preds(self, *args, **kwargs):
         return pd.read_parquet(self.dest_path, *args, **kwargs)
 
-# %% ../nbs/04_model.ipynb 65
+# %% ../nbs/04_model.ipynb 109
 class AwesomeModel(BaseModel):
     """
     TEMPLATE - Predict with arbitrary prediction logic and model formats.
@@ -525,15 +2066,15 @@ class AwesomeModel(BaseModel):
     @display_processor_info
     def predict(self, dataf: NumerFrame) -> NumerFrame:
         """ Return NumerFrame with column(s) added for prediction(s). """
-        # Get all features
+        # Get all features (shared with other models that use the same features)
         feature_cols = self.feature_cols if self.feature_cols else dataf.feature_cols
-        feature_df = dataf[feature_cols]
+        feature_df = self._get_features(dataf, feature_cols)
         # Predict and add to new column
         ...
         # Parse all contents of NumerFrame to the next pipeline step
         return NumerFrame(dataf)
 
-# %% ../nbs/04_model.ipynb 68
+# %% ../nbs/04_model.ipynb 112
 class AwesomeDirectoryModel(DirectoryModel):
     """
     TEMPLATE - Load in all models of arbitrary file format and predict for all.
@@ -554,6 +2095,6 @@ class AwesomeDirectoryModel(DirectoryModel):
                          feature_cols=feature_cols
                          )
 
-    def load_models(self) -> list:
-        """ Instantiate all models and return as a list. (abstract method) """
+    def load_model(self, path: Path):
+        """ Instantiate a single model from path. (mandatory method) """
         ...
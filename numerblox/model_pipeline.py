@@ -25,7 +25,9 @@ class ModelPipeline:
     :param postprocessors: List of initialized Postprocessors. \n
     :param copy_first: Whether to copy the NumerFrame as a first preprocessing step. \n
     Highly recommended in order to avoid surprise behaviour by manipulating the original dataset. \n
-    :param pipeline_name: Unique name for pipeline. Only used for display purposes.
+    :param pipeline_name: Unique name for pipeline. Only used for display purposes. \n
+    :param row_selector: Optional selection of rows to predict on (see NumerFrame.get_row_mask). For example {"data_type": "live"}.
+    Models and postprocessing only run on the selected rows. Other rows get NaN predictions.
     """
     def __init__(self,
                  models: List[BaseModel],
@@ -33,13 +35,15 @@ class ModelPipeline:
                  postprocessors: List[BaseProcessor] = [],
                  copy_first = True,
                  standardize = True,
-                 pipeline_name: str = None):
+                 pipeline_name: str = None,
+                 row_selector = None):
         self.pipeline_name = pipeline_name if pipeline_name else uuid.uuid4().hex
         self.models = models
         self.copy_first = copy_first
         self.standardize = standardize
         self.preprocessors = preprocessors
         self.postprocessors = postprocessors
+        self.row_selector = row_selector
 
     def preprocess(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
         """ Run all preprocessing steps. Copies input by default. """
@@ -64,26 +68,67 @@ class ModelPipeline:
         return NumerFrame(dataf)
 
     def process_models(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
-        """ Run all models. """
-        for model in tqdm(self.models,
-                                  desc=f"{self.pipeline_name} Model prediction: ",
-                                  position=0):
-            rich_print(f":robot: Generating model predictions with '[bold]{model.__class__.__name__}[/bold]'. :robot:")
-            dataf = model(dataf)
+        """ Run all models. Models share cached feature matrices, which are freed once all models have predicted. """
+        cached_keys = dataf.feature_matrix_keys if isinstance(dataf, NumerFrame) else set()
+        datafs = [dataf]
+        try:
+            for model in tqdm(self.models,
+                                      desc=f"{self.pipeline_name} Model prediction: ",
+                                      position=0):
+                rich_print(f":robot: Generating model predictions with '[bold]{model.__class__.__name__}[/bold]'. :robot:")
+                dataf = model(dataf, keep_feature_matrices=True)
+                datafs.append(dataf)
+        finally:
+            for intermediate_dataf in datafs:
+                if isinstance(intermediate_dataf, NumerFrame):
+                    intermediate_dataf.clear_feature_matrices(keep=cached_keys)
         return NumerFrame(dataf)
 
+    def used_features(self, feature_cols: list) -> list:
+        """
+        Union of features that the models use (see BaseModel.used_features), in the order of feature_cols.
+        Preprocessors that derive new features from other features are not taken into account.
+        :param feature_cols: All features models predict on.
+        """
+        used_cols = set()
+        for model in self.models:
+            used_cols.update(model.used_features(feature_cols))
+        return [col for col in feature_cols if col in used_cols]
+
+    def prune_features(self, feature_cols: list) -> list:
+        """
+        Features to load for this pipeline. Models that select all feature columns by default are set to use feature_cols,
+        so they receive input in this order with zero-filled placeholders for features that are not loaded.
+        :param feature_cols: All features, in the order the models expect them.
+        :return: Features that at least one model uses.
+        """
+        for model in self.models:
+            if hasattr(model, "feature_cols") and not model.feature_cols:
+                model.feature_cols = list(feature_cols)
+        return self.used_features(feature_cols)
+
     def pipeline(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
         """ Process full pipeline and return resulting NumerFrame. """
         preprocessed_dataf = self.preprocess(dataf)
-        prediction_dataf = self.process_models(preprocessed_dataf)
-        processed_prediction_dataf = self.postprocess(prediction_dataf)
+        if self.row_selector is None:
+            prediction_dataf = self.process_models(preprocessed_dataf)
+            processed_prediction_dataf = self.postprocess(prediction_dataf)
+        else:
+            # Gather selected rows once, so models and postprocessors never see other rows.
+            mask = preprocessed_dataf.get_row_mask(self.row_selector)
+            selected_dataf = NumerFrame(preprocessed_dataf[mask])
+            processed_selected_dataf = self.postprocess(self.process_models(selected_dataf))
+            assert processed_selected_dataf.index.equals(selected_dataf.index), "Models and postprocessors should not change rows when using row_selector."
+            new_cols = [col for col in processed_selected_dataf.columns
+                        if col not in selected_dataf.columns or col in processed_selected_dataf.prediction_cols]
+            processed_prediction_dataf = preprocessed_dataf.add_columns(processed_selected_dataf[new_cols], rows=mask)
         rich_print(f":checkered_flag: [green]Finished pipeline:[green] [bold blue]'{self.pipeline_name}'[bold blue]! :checkered_flag:")
         return processed_prediction_dataf
 
     def __call__(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
         return self.pipeline(dataf)
 
-# %% ../nbs/06_modelpipeline.ipynb 15
+# %% ../nbs/06_modelpipeline.ipynb 21
 class ModelPipelineCollection:
     """
     Execute multiple initialized ModelPipelines in a sequence.
@@ -1,14 +1,16 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/02_numerframe.ipynb.
 
 # %% auto 0
-__all__ = ['NumerFrame', 'create_numerframe']
+__all__ = ['NumerFrame', 'create_numerframe', 'NumerPanel']
 
 # %% ../nbs/02_numerframe.ipynb 4
 import uuid
+import warnings
 import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Union, Tuple, Any, List
+from scipy.stats import rankdata
 
 from .misc import AttrDict
 
@@ -27,6 +29,18 @@ class NumerFrame(pd.DataFrame):
         self.meta = AttrDict()
         self.__set_era_col()
         self.__init_meta_attrs()
+        # Model-ready feature matrices. Not in _metadata, so slices and copies never share them.
+        self.__dict__["_feature_matrices"] = {}
+
+    def __setitem__(self, key, value):
+        # Columns set in place may change features, so cached feature matrices are dropped for this NumerFrame.
+        self.__dict__["_feature_matrices"] = {}
+        super().__setitem__(key, value)
+
+    def _clear_item_cache(self):
+        # Pandas calls this after values change in place (.loc, .iloc, .at, inplace methods), so cached feature matrices can't go stale.
+        self.__dict__["_feature_matrices"] = {}
+        super()._clear_item_cache()
         
     @property
     def _constructor(self):
@@ -96,6 +110,123 @@ class NumerFrame(pd.DataFrame):
         """
         return self.filter(like=pattern)
 
+    def add_columns(self, columns: Union[dict, np.ndarray, pd.DataFrame], names: list = None, rows: np.ndarray = None) -> "NumerFrame":
+        """
+        Add many columns at once. Columns are appended in a single block, which avoids fragmenting the DataFrame
+        with one insert per column. Existing columns with the same name are overwritten in place.
+        :param columns: Mapping of column name to values, a 2D array (rows x columns) or a DataFrame. \n
+        Arrays in column-major (Fortran) layout are stored without transposing. \n
+        :param names: Column names for a 2D array. \n
+        :param rows: Optional boolean mask (see .get_row_mask). Values are given for selected rows only and scattered back to them.
+        All other rows are NaN. \n
+        :return: New NumerFrame with columns added and column groups updated.
+        """
+        if rows is not None:
+            rows = np.asarray(rows, dtype=bool)
+            if isinstance(columns, pd.DataFrame):
+                names = columns.columns.tolist() if names is None else names
+                columns = columns.to_numpy()
+            elif isinstance(columns, dict):
+                names = list(columns)
+                columns = np.column_stack([np.asarray(values) for values in columns.values()])
+            columns = np.asarray(columns)
+            columns = columns.reshape(-1, 1) if columns.ndim == 1 else columns
+            assert len(columns) == rows.sum(), f"Got values for {len(columns)} rows, but {rows.sum()} rows are selected."
+            scattered = np.full((len(self), columns.shape[1]), np.nan, dtype=np.result_type(columns.dtype, np.float32))
+            scattered[rows] = columns
+            columns = scattered
+        if isinstance(columns, pd.DataFrame):
+            new_dataf = columns if names is None else columns.set_axis(names, axis=1)
+            if not new_dataf.index.equals(self.index):
+                new_dataf = new_dataf.reindex(self.index)
+        elif isinstance(columns, dict):
+            new_dataf = pd.DataFrame(columns, index=self.index)
+        else:
+            columns = np.asarray(columns)
+            columns = columns.reshape(-1, 1) if columns.ndim == 1 else columns
+            assert names is not None and len(names) == columns.shape[1], f"Provide one name for each of the {columns.shape[1]} columns."
+            new_dataf = pd.DataFrame(columns, columns=names, index=self.index, copy=False)
+        assert new_dataf.columns.is_unique, "Column names to add must be unique."
+
+        existing_cols = self.columns.intersection(new_dataf.columns)
+        dataf = self.drop(columns=existing_cols) if not existing_cols.empty else self
+        dataf = pd.concat([dataf, new_dataf], axis=1, copy=False)
+        if not existing_cols.empty:
+            # Keep overwritten columns at their original position.
+            dataf = dataf[self.columns.tolist() + [col for col in new_dataf.columns if col not in existing_cols]]
+        dataf = NumerFrame(dataf)
+        dataf.meta.update({key: value for key, value in self.meta.items() if value is not None})
+        # Untouched feature columns are shared, so their cached matrices stay valid for the new NumerFrame.
+        # The new NumerFrame gets its own cache, so clearing either NumerFrame doesn't affect the other.
+        dataf.__dict__["_feature_matrices"] = {key: matrix for key, matrix in self.__dict__.get("_feature_matrices", {}).items()
+                                               if existing_cols.intersection(key[0]).empty}
+        return dataf
+
+    def get_row_mask(self, row_selector) -> np.ndarray:
+        """
+        Boolean mask of selected rows.
+        :param row_selector: Boolean mask (array or Series), a mapping of column name to allowed value(s)
+        (for example {"data_type": "live"}) or a function that takes the NumerFrame and returns a boolean mask.
+        None selects all rows.
+        """
+        if row_selector is None:
+            return np.ones(len(self), dtype=bool)
+        if callable(row_selector):
+            row_selector = row_selector(self)
+        if isinstance(row_selector, dict):
+            mask = np.ones(len(self), dtype=bool)
+            for col, values in row_selector.items():
+                values = values if isinstance(values, (list, tuple, set)) else [values]
+                mask &= self[col].isin(values).to_numpy()
+            return mask
+        mask = np.asarray(row_selector)
+        assert mask.dtype == bool and mask.shape == (len(self),), f"Row mask should be a boolean array of length {len(self)}."
+        return mask
+
+    def get_feature_matrix(self, feature_cols: list = None, dtype = None, order: str = "C", fill_missing: bool = False) -> np.ndarray:
+        """
+        Model-ready 2D array (rows x features) of feature values.
+        Matrices are cached per (features, dtype, layout), so every model using the same features shares one matrix.
+        The cache is kept by .add_columns and dropped when values are changed through pandas (dataf[col] = ..., .loc, .iloc or inplace methods).
+        Call .clear_feature_matrices after writing to the underlying arrays directly (for example through .values).
+        The returned array is read-only. \n
+        :param feature_cols: Features to select. All feature columns by default. \n
+        :param dtype: dtype of matrix. By default the smallest float dtype (at least float32) that holds all features exactly. \n
+        :param order: Memory layout. "C" (row-major, used by LightGBM, CatBoost, scikit-learn and Keras) or "F" (column-major). \n
+        :param fill_missing: Zero-filled placeholder columns for features that are not in the NumerFrame (for example features that models don't use and were not loaded).
+        """
+        assert order in ("C", "F"), f"order should be 'C' or 'F'. Got '{order}'."
+        feature_cols = list(feature_cols) if feature_cols is not None else self.feature_cols
+        present_cols = [col for col in feature_cols if col in self.columns] if fill_missing else feature_cols
+        dtype = np.dtype(dtype) if dtype is not None else np.result_type(np.float32, *self.dtypes[present_cols])
+        key = (tuple(feature_cols), dtype.str, order)
+        feature_matrices = self.__dict__.setdefault("_feature_matrices", {})
+        if key not in feature_matrices:
+            if len(present_cols) < len(feature_cols):
+                matrix = np.zeros((len(self), len(feature_cols)), dtype=dtype, order=order)
+                present = set(present_cols)
+                matrix[:, [i for i, col in enumerate(feature_cols) if col in present]] = self[present_cols].to_numpy(dtype=dtype)
+            else:
+                # Column selection copies, so the matrix never shares memory with the NumerFrame.
+                matrix = np.asarray(self[feature_cols].to_numpy(dtype=dtype), order=order)
+            matrix.flags.writeable = False
+            feature_matrices[key] = matrix
+        return feature_matrices[key]
+
+    @property
+    def feature_matrix_keys(self) -> set:
+        """ Cache keys (features, dtype, layout) of cached feature matrices. """
+        return set(self.__dict__.get("_feature_matrices", {}))
+
+    def clear_feature_matrices(self, keep: set = None):
+        """
+        Drop cached model-ready feature matrices. \n
+        :param keep: Cache keys (see .feature_matrix_keys) of matrices to keep. Drops all matrices by default.
+        """
+        keep = keep if keep is not None else set()
+        self.__dict__["_feature_matrices"] = {key: matrix for key, matrix in self.__dict__.get("_feature_matrices", {}).items()
+                                              if key in keep}
+
     def get_feature_target_pair(self, multi_target=False) -> Tuple[Any, Any]:
         """
         Get split of feature and target columns.
@@ -169,3 +300,217 @@ def create_numerframe(file_path: str, columns: list = None, *args, **kwargs) ->
         raise NotImplementedError(f"Suffix '{suffix}' is not supported.")
     num_frame = NumerFrame(df)
     return num_frame
+
+# %% ../nbs/02_numerframe.ipynb 65
+class NumerPanel:
+    """
+    Dense date x ticker x field panel of Numerai Signals data.
+
+    :param values: 3D array with shape (dates, tickers, fields). \n
+    :param mask: Boolean array with shape (dates, tickers) denoting which ticker-date combinations are present. \n
+    :param dates: Dates (first axis). \n
+    :param tickers: Tickers (second axis). \n
+    :param fields: Field names (third axis). \n
+    :param date_col: Column name for dates when converting to NumerFrame. \n
+    :param ticker_col: Column name for tickers when converting to NumerFrame.
+    """
+    def __init__(self, values: np.ndarray, mask: np.ndarray, dates: pd.Index, tickers: pd.Index,
+                 fields: list, date_col: str = "date", ticker_col: str = "ticker"):
+        assert values.shape == (len(dates), len(tickers), len(fields)), f"values shape {values.shape} does not match dates, tickers and fields."
+        assert mask.shape == values.shape[:2], f"mask shape {mask.shape} does not match values shape {values.shape}."
+        self.values = values
+        self.mask = mask
+        self.dates = pd.Index(dates)
+        self.tickers = pd.Index(tickers)
+        self.fields = list(fields)
+        self.date_col = date_col
+        self.ticker_col = ticker_col
+
+    @classmethod
+    def from_numerframe(cls, dataf: Union[pd.DataFrame, NumerFrame], fields: list = None,
+                        date_col: str = None, ticker_col: str = "ticker", dtype=np.float64) -> "NumerPanel":
+        """
+        Create panel from long format data.
+        :param dataf: Data with one row per ticker and date. \n
+        :param fields: Columns to put in panel. All feature columns by default. \n
+        :param date_col: Column with dates. Era column of NumerFrame by default. \n
+        :param ticker_col: Column with tickers. \n
+        :param dtype: dtype of panel values.
+        """
+        dataf = NumerFrame(dataf) if not isinstance(dataf, NumerFrame) else dataf
+        date_col = date_col if date_col else dataf.meta.era_col
+        fields = fields if fields else dataf.feature_cols
+        date_codes, dates = pd.factorize(dataf[date_col], sort=True)
+        ticker_codes, tickers = pd.factorize(dataf[ticker_col], sort=True)
+        valid = (date_codes >= 0) & (ticker_codes >= 0)
+        date_codes, ticker_codes = date_codes[valid], ticker_codes[valid]
+        mask = np.zeros((len(dates), len(tickers)), dtype=bool)
+        mask[date_codes, ticker_codes] = True
+        assert mask.sum() == len(date_codes), f"Duplicate {ticker_col}-{date_col} combinations found."
+        values = np.full((len(dates), len(tickers), len(fields)), np.nan, dtype=dtype)
+        values[date_codes, ticker_codes] = dataf[fields].to_numpy(dtype=dtype)[valid]
+        return cls(values, mask, dates, tickers, fields, date_col=date_col, ticker_col=ticker_col)
+
+    def to_numerframe(self, dataf: Union[pd.DataFrame, NumerFrame] = None) -> NumerFrame:
+        """
+        Convert panel to long format.
+        :param dataf: Data to add panel fields to (aligned on date and ticker columns). \n
+        By default, a new NumerFrame is created with all present ticker-date combinations.
+        """
+        if dataf is None:
+            date_idx, ticker_idx = np.nonzero(self.mask)
+            return NumerFrame(pd.DataFrame({self.date_col: self.dates[date_idx], self.ticker_col: self.tickers[ticker_idx]})
+                              .join(pd.DataFrame(self.values[date_idx, ticker_idx], columns=self.fields)))
+        date_idx = self.dates.get_indexer(dataf[self.date_col])
+        ticker_idx = self.tickers.get_indexer(dataf[self.ticker_col])
+        found = (date_idx >= 0) & (ticker_idx >= 0)
+        values = np.full((len(dataf), len(self.fields)), np.nan, dtype=self.values.dtype)
+        values[found] = self.values[date_idx[found], ticker_idx[found]]
+        return NumerFrame(dataf).add_columns(values, names=self.fields)
+
+    @property
+    def shape(self) -> tuple:
+        return self.values.shape
+
+    def __getitem__(self, fields: Union[str, list]) -> "NumerPanel":
+        """ Select fields. """
+        fields = fields if isinstance(fields, list) else [fields]
+        return self._new(self.values[:, :, [self.fields.index(field) for field in fields]], fields)
+
+    def add_suffix(self, suffix: str) -> "NumerPanel":
+        """ Add suffix to all field names. """
+        return self._new(self.values, [f"{field}{suffix}" for field in self.fields])
+
+    @staticmethod
+    def concat(panels: list) -> "NumerPanel":
+        """ Combine fields of panels with the same dates and tickers. """
+        first = panels[0]
+        for panel in panels[1:]:
+            assert panel.dates.equals(first.dates) and panel.tickers.equals(first.tickers), "Panels should have the same dates and tickers."
+        return first._new(np.concatenate([panel.values for panel in panels], axis=2),
+                          [field for panel in panels for field in panel.fields])
+
+    def shift(self, periods: int = 1) -> "NumerPanel":
+        """ Shift values along dates. """
+        shifted = np.full_like(self.values, np.nan)
+        if periods >= 0:
+            shifted[periods:] = self.values[:len(self.values) - periods]
+        else:
+            shifted[:periods] = self.values[-periods:]
+        return self._new(shifted)
+
+    def ffill(self) -> "NumerPanel":
+        """ Forward fill NaNs along dates. """
+        valid = ~np.isnan(self.values)
+        # Index of last valid date for every cell.
+        last_valid = np.where(valid, np.arange(len(self.dates))[:, None, None], 0)
+        np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+        filled = np.take_along_axis(self.values, last_valid, axis=0)
+        return self._new(filled)
+
+    def pct_change(self, periods: int = 1, fill_method: str = "pad") -> "NumerPanel":
+        """
+        Percentage change along dates.
+        :param periods: Number of dates to compare with. \n
+        :param fill_method: 'pad' to forward fill NaNs first (like pandas) or None.
+        """
+        panel = self.ffill() if fill_method == "pad" else self
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self._new(panel.values / panel.shift(periods).values - 1)
+
+    def rolling(self, window: int, func: str = "mean", min_periods: int = None) -> "NumerPanel":
+        """
+        Rolling window aggregation along dates. NaNs are ignored.
+        :param window: Number of dates in window. \n
+        :param func: 'mean', 'sum', 'std', 'min' or 'max'. \n
+        :param min_periods: Minimum number of valid values in window. Equal to window by default.
+        """
+        min_periods = window if min_periods is None else min_periods
+        valid = ~np.isnan(self.values)
+        counts = self._rolling_sum(valid.astype(np.float64), window)
+        if func in ("min", "max"):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                result = np.full_like(self.values, np.nan)
+                if window <= len(self.values):
+                    windows = np.lib.stride_tricks.sliding_window_view(self.values, window, axis=0)
+                    result[window - 1:] = np.nanmin(windows, axis=-1) if func == "min" else np.nanmax(windows, axis=-1)
+                # Windows at the start are shorter.
+                for end in range(min(window - 1, len(self.values))):
+                    result[end] = np.nanmin(self.values[:end + 1], axis=0) if func == "min" else np.nanmax(self.values[:end + 1], axis=0)
+        else:
+            filled = np.where(valid, self.values, 0.)
+            sums = self._rolling_sum(filled, window)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                if func == "sum":
+                    result = sums
+                elif func == "mean":
+                    result = sums / counts
+                elif func == "std":
+                    # Squared deviations from the mean of every window. Stays precise for large values with small variance.
+                    means = sums / counts
+                    squares = np.zeros_like(filled)
+                    n_dates = len(filled)
+                    for lag in range(min(window, n_dates)):
+                        deviations = np.where(valid[:n_dates - lag], filled[:n_dates - lag] - means[lag:], 0.)
+                        squares[lag:] += deviations ** 2
+                    result = np.sqrt(squares / (counts - 1))
+                else:
+                    raise NotImplementedError(f"Rolling function '{func}' is not supported.")
+        result[counts < max(min_periods, 1)] = np.nan
+        return self._new(result)
+
+    def ewm(self, span: float = None, alpha: float = None, min_periods: int = 0) -> "NumerPanel":
+        """
+        Exponentially weighted mean along dates (equal to pandas ewm with adjust=True).
+        :param span: Decay in terms of span. \n
+        :param alpha: Smoothing factor (alternative to span). \n
+        :param min_periods: Minimum number of valid values.
+        """
+        assert (span is None) != (alpha is None), "Define either span or alpha."
+        alpha = alpha if alpha is not None else 2 / (span + 1)
+        result = np.empty_like(self.values)
+        numerator = np.zeros(self.values.shape[1:])
+        denominator = np.zeros(self.values.shape[1:])
+        counts = np.zeros(self.values.shape[1:])
+        for i, values in enumerate(self.values):
+            valid = ~np.isnan(values)
+            numerator = (1 - alpha) * numerator + np.where(valid, values, 0.)
+            denominator = (1 - alpha) * denominator + valid
+            counts += valid
+            with np.errstate(divide="ignore", invalid="ignore"):
+                result[i] = np.where((counts >= max(min_periods, 1)) & (denominator > 0), numerator / denominator, np.nan)
+        return self._new(result)
+
+    def rank(self) -> "NumerPanel":
+        """ Cross-sectional percentile rank (average method) of tickers for every date. """
+        ranks = rankdata(self.values, axis=1, nan_policy="omit")
+        counts = (~np.isnan(self.values)).sum(axis=1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self._new(ranks / counts)
+
+    def bin(self, bins: list) -> "NumerPanel":
+        """
+        Bin values (like pd.cut with include_lowest=True). Bin numbers start at 0.
+        :param bins: Bin edges.
+        """
+        bins = np.asarray(bins)
+        binned = np.searchsorted(bins, self.values, side="left") - 1.
+        binned[self.values == bins[0]] = 0
+        binned[np.isnan(self.values) | (self.values < bins[0]) | (self.values > bins[-1])] = np.nan
+        return self._new(binned)
+
+    @staticmethod
+    def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+        """
+        Rolling sum along first axis. Every window is summed directly (one pass per lag),
+        so sums don't lose precision over long histories like differences of cumulative sums.
+        """
+        sums = values.copy()
+        for lag in range(1, min(window, len(values))):
+            sums[lag:] += values[:-lag]
+        return sums
+
+    def _new(self, values: np.ndarray, fields: list = None) -> "NumerPanel":
+        return NumerPanel(values, self.mask, self.dates, self.tickers, fields if fields else self.fields,
+                          date_col=self.date_col, ticker_col=self.ticker_col)
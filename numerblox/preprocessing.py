@@ -1,27 +1,36 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/03_preprocessing.ipynb.
 
 # %% auto 0
-__all__ = ['V4_2_FEATURE_GROUP_MAPPING', 'BaseProcessor', 'display_processor_info', 'CopyPreProcessor',
+__all__ = ['V4_2_FEATURE_GROUP_MAPPING', 'BaseProcessor', 'display_processor_info', 'ProcessorCache', 'CopyPreProcessor',
            'FeatureSelectionPreProcessor', 'TargetSelectionPreProcessor', 'ReduceMemoryProcessor',
-           'BayesianGMMTargetProcessor', 'GroupStatsPreProcessor', 'KatsuFeatureGenerator', 'EraQuantileProcessor',
-           'TickerMapper', 'SignalsTargetProcessor', 'LagPreProcessor', 'DifferencePreProcessor',
-           'PandasTaFeatureGenerator', 'AwesomePreProcessor']
+           'EraNormalizationProcessor', 'CorrelationFeatureSelector', 'BayesianGMMTargetProcessor',
+           'GroupStatsPreProcessor', 'KatsuFeatureGenerator', 'EraQuantileProcessor', 'TickerMapper',
+           'SignalsTargetProcessor', 'LagPreProcessor', 'DifferencePreProcessor', 'PandasTaFeatureGenerator',
+           'FridayResamplePreProcessor', 'AwesomePreProcessor']
 
 # %% ../nbs/03_preprocessing.ipynb 4
 import os
+import json
 import time
+import joblib
+import pickle
+import hashlib
 import warnings
 import numpy as np
 import pandas as pd
 import datetime as dt
 import pandas_ta as ta
+from pathlib import Path
 from tqdm.auto import tqdm
 from functools import wraps
+from scipy.special import ndtri
 from scipy.stats import rankdata
 from abc import ABC, abstractmethod
 from rich import print as rich_print
 from typing import Union, Tuple, List
-from multiprocessing.pool import Pool
+from multiprocessing import resource_tracker
+from multiprocessing.pool import Pool, ThreadPool
+from multiprocessing.shared_memory import SharedMemory
 from sklearn.linear_model import Ridge
 from sklearn.mixture import BayesianGaussianMixture
 from sklearn.preprocessing import QuantileTransformer, MinMaxScaler
@@ -31,6 +40,8 @@ from .numerframe import NumerFrame, create_numerframe
 # %% ../nbs/03_preprocessing.ipynb 9
 class BaseProcessor(ABC):
     """Common functionality for preprocessors and postprocessors."""
+    # Opt-in output cache (ProcessorCache). Set for an instance or for all processors on BaseProcessor.
+    cache = None
 
     def __init__(self):
         ...
@@ -44,6 +55,8 @@ class BaseProcessor(ABC):
     def __call__(
         self, dataf: Union[pd.DataFrame, NumerFrame], *args, **kwargs
     ) -> NumerFrame:
+        if self.cache is not None:
+            return self.cache(self, dataf, *args, **kwargs)
         return self.transform(dataf=dataf, *args, **kwargs)
 
 # %% ../nbs/03_preprocessing.ipynb 12
@@ -63,7 +76,129 @@ def display_processor_info(func):
 
     return wrapper
 
-# %% ../nbs/03_preprocessing.ipynb 19
+# %% ../nbs/03_preprocessing.ipynb 16
+class ProcessorCache:
+    """
+    Persistent cache of processor outputs (local feature store).
+
+    :param cache_dir: Directory to store cached outputs. \n
+    :param max_size_gb: Maximum size of the cache in GB. Least recently used entries are evicted first. \n
+    """
+    def __init__(self, cache_dir: str = "~/.numerblox/processor_cache", max_size_gb: float = 5.0):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_gb = max_size_gb
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, processor: BaseProcessor, dataf: Union[pd.DataFrame, NumerFrame], *args, **kwargs) -> NumerFrame:
+        """
+        Load processor output from cache or run transform and store the added columns.
+        :param processor: Processor to run.
+        :param dataf: Input data.
+        """
+        column_hashes = self.column_hashes(dataf)
+        key = self.cache_key(processor, dataf, column_hashes, *args, **kwargs)
+        if key is not None and (self.cache_dir / f"{key}.arrow").exists():
+            self.hits += 1
+            return self._load(key, dataf, processor)
+        self.misses += 1
+        # Keep input references since processors may add columns to dataf in place.
+        input_index, input_columns = dataf.index, dataf.columns
+        result = processor.transform(dataf=dataf, *args, **kwargs)
+        if key is not None and result.index.equals(input_index):
+            self._store(key, result, input_columns, column_hashes)
+        return result
+
+    @property
+    def stats(self) -> dict:
+        """ Hit/miss counts, hit rate and size of the cache. """
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / total if total else 0.,
+                "entries": len(list(self.cache_dir.glob("*.arrow"))), "size_gb": self._size() / 1024 ** 3}
+
+    def clear(self):
+        """ Remove all cached outputs and reset stats. """
+        for path in self.cache_dir.glob("*.arrow"):
+            path.unlink()
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink()
+        self.hits, self.misses = 0, 0
+
+    @staticmethod
+    def column_hashes(dataf: Union[pd.DataFrame, NumerFrame]) -> dict:
+        """
+        Fingerprint of every column. Numeric columns are hashed from their raw bytes.
+        :param dataf: Input data.
+        :return: Mapping of column name to hash.
+        """
+        column_hashes = {}
+        for col, values in dataf.items():
+            array = values.to_numpy()
+            if array.dtype.kind not in "biufcmM":
+                array = pd.util.hash_pandas_object(values, index=False).to_numpy()
+            column_hashes[col] = hashlib.blake2b(np.ascontiguousarray(array).view(np.uint8), digest_size=16).hexdigest()
+        return column_hashes
+
+    @staticmethod
+    def cache_key(processor: BaseProcessor, dataf: Union[pd.DataFrame, NumerFrame], column_hashes: dict, *args, **kwargs) -> Union[str, None]:
+        """
+        Key from input fingerprint, processor class and parameters.
+        Private attributes (for example lazily loaded lookup tables) are not part of the key.
+        :return: Cache key or None if the processor or data cannot be fingerprinted.
+        """
+        try:
+            index_hash = pd.util.hash_pandas_object(dataf.index).to_numpy()
+            params = {name: value for name, value in vars(processor).items() if name != "cache" and not name.startswith("_")}
+            meta = dict(dataf.meta) if isinstance(dataf, NumerFrame) else None
+            return joblib.hash((type(processor).__module__, type(processor).__qualname__, params, args, kwargs,
+                                index_hash, list(column_hashes.items()), str(dataf.dtypes.to_dict()), meta))
+        except (TypeError, pickle.PicklingError, AttributeError):
+            return None
+
+    def _load(self, key: str, dataf: Union[pd.DataFrame, NumerFrame], processor: BaseProcessor) -> NumerFrame:
+        """ Attach stored columns to input data. """
+        arrow_path, columns_path = self.cache_dir / f"{key}.arrow", self.cache_dir / f"{key}.json"
+        # Touch entry so it is most recently used.
+        os.utime(arrow_path)
+        stored = pd.read_feather(arrow_path)
+        stored.index = dataf.index
+        output_columns = json.loads(columns_path.read_text())
+        kept_columns = [col for col in output_columns if col not in stored.columns]
+        result = pd.concat([dataf[kept_columns], stored], axis=1, copy=False)
+        if result.columns.tolist() != output_columns:
+            result = result[output_columns]
+        rich_print(f":floppy_disk: Loaded step [bold]{type(processor).__name__}[/bold] from cache. Output shape={result.shape}. :floppy_disk:")
+        return NumerFrame(result)
+
+    def _store(self, key: str, result: NumerFrame, input_columns: pd.Index, column_hashes: dict):
+        """ Store columns that were added or changed by the processor and evict old entries. """
+        if not all(isinstance(col, str) for col in result.columns):
+            return
+        # Columns that existed before the step are only stored if their values changed.
+        stored_columns = [col for col in result.columns if col not in input_columns]
+        existing_columns = [col for col in result.columns if col in input_columns]
+        new_hashes = self.column_hashes(result[existing_columns])
+        stored_columns += [col for col in existing_columns if new_hashes[col] != column_hashes.get(col)]
+        result[stored_columns].reset_index(drop=True).to_feather(self.cache_dir / f"{key}.arrow", compression="uncompressed")
+        (self.cache_dir / f"{key}.json").write_text(json.dumps(result.columns.tolist()))
+        self._evict()
+
+    def _size(self) -> int:
+        """ Total size of cached outputs in bytes. """
+        return sum(path.stat().st_size for path in self.cache_dir.glob("*.arrow"))
+
+    def _evict(self):
+        """ Remove least recently used entries until the cache fits in max_size_gb. """
+        paths = sorted(self.cache_dir.glob("*.arrow"), key=lambda path: path.stat().st_mtime)
+        size = self._size()
+        while paths and size > self.max_size_gb * 1024 ** 3:
+            path = paths.pop(0)
+            size -= path.stat().st_size
+            path.unlink()
+            path.with_suffix(".json").unlink(missing_ok=True)
+
+# %% ../nbs/03_preprocessing.ipynb 23
 class CopyPreProcessor(BaseProcessor):
     """Copy DataFrame to avoid manipulation of original DataFrame."""
 
@@ -74,7 +209,7 @@ class CopyPreProcessor(BaseProcessor):
     def transform(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
         return NumerFrame(dataf.copy())
 
-# %% ../nbs/03_preprocessing.ipynb 22
+# %% ../nbs/03_preprocessing.ipynb 26
 class FeatureSelectionPreProcessor(BaseProcessor):
     """
     Keep only features given + all target, predictions and aux columns.
@@ -95,7 +230,7 @@ class FeatureSelectionPreProcessor(BaseProcessor):
         dataf = dataf.loc[:, keep_cols]
         return NumerFrame(dataf)
 
-# %% ../nbs/03_preprocessing.ipynb 26
+# %% ../nbs/03_preprocessing.ipynb 30
 class TargetSelectionPreProcessor(BaseProcessor):
     """
     Keep only features given + all target, predictions and aux columns.
@@ -116,7 +251,7 @@ class TargetSelectionPreProcessor(BaseProcessor):
         dataf = dataf.loc[:, keep_cols]
         return NumerFrame(dataf)
 
-# %% ../nbs/03_preprocessing.ipynb 29
+# %% ../nbs/03_preprocessing.ipynb 33
 class ReduceMemoryProcessor(BaseProcessor):
     """
     Reduce memory usage as much as possible.
@@ -203,7 +338,212 @@ class ReduceMemoryProcessor(BaseProcessor):
         )
         return dataf
 
-# %% ../nbs/03_preprocessing.ipynb 36
+# %% ../nbs/03_preprocessing.ipynb 37
+class EraNormalizationProcessor(BaseProcessor):
+    """
+    Normalize features per era.
+
+    :param method: Normalization method. One of 'rank', 'zscore' or 'gaussrank'. \n
+    :param features: Features to normalize. All features by default. \n
+    :param era_col: Column with eras. Era column of NumerFrame by default. \n
+    :param suffix: Add normalized features as new columns with this suffix. By default, features are overwritten. \n
+    :param num_cores: Number of threads to process eras with. By default, all available cores are used.
+    """
+    def __init__(self, method: str = "rank", features: list = None, era_col: str = None,
+                 suffix: str = None, num_cores: int = None):
+        super().__init__()
+        assert method in ("rank", "zscore", "gaussrank"), f"Method '{method}' is not supported. Choose 'rank', 'zscore' or 'gaussrank'."
+        self.method = method
+        self.features = features
+        self.era_col = era_col
+        self.suffix = suffix
+        self.num_cores = num_cores if num_cores else os.cpu_count()
+
+    @display_processor_info
+    def transform(self, dataf: NumerFrame, *args, **kwargs) -> NumerFrame:
+        features = self.features if self.features else dataf.feature_cols
+        era_col = self.era_col if self.era_col else dataf.meta.era_col
+        era_codes = pd.factorize(dataf[era_col])[0]
+        order = np.argsort(era_codes, kind="stable")
+        sorted_codes = era_codes[order]
+        bounds = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1], True])
+        # Rows without era have code -1 and come first.
+        segments = [(start, end) for start, end in zip(bounds[:-1], bounds[1:]) if sorted_codes[start] >= 0]
+
+        # Column-major layout (one contiguous row per feature) sorted by era.
+        block = dataf[features].to_numpy().T
+        dtype = block.dtype if block.dtype.kind == "f" else np.float64
+        values = np.ascontiguousarray(block[:, order], dtype=dtype)
+        normalized = np.full_like(values, np.nan)
+
+        def normalize_era(segment: tuple):
+            start, end = segment
+            normalized[:, start:end] = self._normalize(values[:, start:end])
+
+        with ThreadPool(self.num_cores) as p:
+            p.map(normalize_era, segments)
+        # Gather rows back to their original order.
+        inverse_order = np.empty_like(order)
+        inverse_order[order] = np.arange(len(order))
+        output = normalized[:, inverse_order]
+        names = features if self.suffix is None else [f"{feature}{self.suffix}" for feature in features]
+        return NumerFrame(dataf).add_columns(output.T, names=names)
+
+    def _normalize(self, values: np.ndarray) -> np.ndarray:
+        """
+        Normalize all features of one era.
+        :param values: Features x rows block for one era.
+        """
+        nans = np.isnan(values)
+        counts = (~nans).sum(axis=1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if self.method == "zscore":
+                mean = np.nanmean(values, axis=1, keepdims=True) if nans.any() else values.mean(axis=1, keepdims=True)
+                centered = values - mean
+                std = np.sqrt(np.nansum(centered ** 2, axis=1, keepdims=True) / (counts - 1))
+                return centered / std
+            ranks = self._average_ranks(values)
+            ranks[nans] = np.nan
+            if self.method == "rank":
+                return ranks / counts
+            return ndtri((ranks - 0.5) / counts)
+
+    @staticmethod
+    def _average_ranks(values: np.ndarray) -> np.ndarray:
+        """
+        Rank values along rows with one argsort. Ties get the average rank.
+        :param values: Features x rows block.
+        :return: Ranks starting at 1.
+        """
+        n_rows = values.shape[1]
+        # Order within ties does not matter since ties get the average rank.
+        idx = np.argsort(values, axis=1)
+        sorted_values = np.take_along_axis(values, idx, axis=1)
+        # Boundaries of groups of equal values in sorted order.
+        new_group = np.ones(sorted_values.shape, dtype=bool)
+        new_group[:, 1:] = sorted_values[:, 1:] != sorted_values[:, :-1]
+        last_in_group = np.ones(sorted_values.shape, dtype=bool)
+        last_in_group[:, :-1] = new_group[:, 1:]
+        positions = np.arange(n_rows)
+        group_starts = np.maximum.accumulate(np.where(new_group, positions, 0), axis=1)
+        group_ends = np.minimum.accumulate(np.where(last_in_group, positions, n_rows - 1)[:, ::-1], axis=1)[:, ::-1]
+        ranks = np.empty(values.shape, dtype=values.dtype)
+        np.put_along_axis(ranks, idx, (group_starts + group_ends) / 2 + 1, axis=1)
+        return ranks
+
+# %% ../nbs/03_preprocessing.ipynb 40
+class CorrelationFeatureSelector(BaseProcessor):
+    """
+    Select features that are not highly correlated with each other.
+
+    :param threshold: Drop features with an absolute correlation of at least threshold with a selected feature. \n
+    :param features: Features to select from. All features by default. \n
+    :param priority: Order in which features are considered for selection. Order of features by default. \n
+    :param per_era: Average per-era correlations instead of pooling all rows. \n
+    :param era_col: Column with eras. Era column of NumerFrame by default. \n
+    :param batch_size: Number of rows per block of the matrix product. \n
+    :param cache_dir: Directory for cached correlation matrices. Set to None to disable caching.
+    """
+    def __init__(self, threshold: float = 0.9, features: list = None, priority: list = None,
+                 per_era: bool = False, era_col: str = None, batch_size: int = 100_000,
+                 cache_dir: str = "~/.numerblox/correlations"):
+        super().__init__()
+        self.threshold = threshold
+        self.features = features
+        self.priority = priority
+        self.per_era = per_era
+        self.era_col = era_col
+        self.batch_size = batch_size
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self.selected_features = None
+
+    @display_processor_info
+    def transform(self, dataf: NumerFrame, *args, **kwargs) -> NumerFrame:
+        selected_features = set(self.select(dataf))
+        # Only correlated candidates are dropped. Features outside of the candidates are kept.
+        dropped_features = set(self._candidate_features(dataf)) - selected_features
+        dataf = dataf.loc[:, [col for col in dataf.columns if col not in dropped_features]]
+        return NumerFrame(dataf)
+
+    def _candidate_features(self, dataf: NumerFrame) -> list:
+        """ Features to select from in order of priority. """
+        return self.priority if self.priority else (self.features if self.features else dataf.feature_cols)
+
+    def select(self, dataf: NumerFrame) -> list:
+        """
+        Greedy selection of features below correlation threshold.
+        :param dataf: Data to compute correlations on.
+        :return: Selected features (also stored in .selected_features).
+        """
+        features = self._candidate_features(dataf)
+        abs_corr = np.abs(self.correlation_matrix(dataf, features=features).to_numpy())
+        dropped = np.zeros(len(features), dtype=bool)
+        selected = []
+        for i in range(len(features)):
+            if dropped[i]:
+                continue
+            selected.append(features[i])
+            # Features later in order that are too correlated with this feature are dropped.
+            dropped[i + 1:] |= abs_corr[i, i + 1:] >= self.threshold
+        self.selected_features = selected
+        return selected
+
+    def correlation_matrix(self, dataf: NumerFrame, features: list = None) -> pd.DataFrame:
+        """
+        Pooled or per-era averaged feature correlation matrix (float32).
+        :param dataf: Data to compute correlations on. \n
+        :param features: Features to compute correlations for. All features by default.
+        """
+        features = features if features else (self.features if self.features else dataf.feature_cols)
+        era_col = self.era_col if self.era_col else dataf.meta.era_col
+        cache_path = None
+        if self.cache_dir is not None:
+            key_cols = features + [era_col] if self.per_era else features
+            column_hashes = ProcessorCache.column_hashes(dataf[key_cols])
+            key = joblib.hash((list(column_hashes.items()), self.per_era))
+            cache_path = self.cache_dir / f"{key}.npy"
+            if cache_path.exists():
+                return pd.DataFrame(np.load(cache_path), index=features, columns=features)
+
+        values = dataf[features].to_numpy()
+        if self.per_era:
+            era_codes, eras = pd.factorize(dataf[era_col])
+            corr = np.zeros((len(features), len(features)))
+            for era_code in range(len(eras)):
+                corr += self._correlations(values[era_codes == era_code])
+            corr = (corr / len(eras)).astype(np.float32)
+        else:
+            corr = self._correlations(values).astype(np.float32)
+
+        if cache_path is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            np.save(cache_path, corr)
+        return pd.DataFrame(corr, index=features, columns=features)
+
+    def _correlations(self, values: np.ndarray) -> np.ndarray:
+        """
+        Correlation matrix from blocks of rows. Blocks are centered and multiplied in float32.
+        NaNs are replaced by the mean of their feature.
+        :param values: Rows x features array (for example int8).
+        """
+        means = np.zeros(values.shape[1])
+        for start in range(0, len(values), self.batch_size):
+            means += np.nansum(values[start:start + self.batch_size], axis=0, dtype=np.float64)
+        counts = len(values) - (np.isnan(values).sum(axis=0) if values.dtype.kind == "f" else 0)
+        means /= counts
+        means32 = means.astype(np.float32)
+
+        cov = np.zeros((values.shape[1], values.shape[1]))
+        for start in range(0, len(values), self.batch_size):
+            block = values[start:start + self.batch_size].astype(np.float32) - means32
+            if values.dtype.kind == "f":
+                block[np.isnan(block)] = 0
+            cov += block.T @ block
+        std = np.sqrt(np.diag(cov))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return cov / np.outer(std, std)
+
+# %% ../nbs/03_preprocessing.ipynb 46
 class BayesianGMMTargetProcessor(BaseProcessor):
     """
     Generate synthetic (fake) target using a Bayesian Gaussian Mixture model. \n
@@ -286,10 +626,10 @@ class BayesianGMMTargetProcessor(BaseProcessor):
         features = sub_df[features].values - 0.5
         return features, target
 
-# %% ../nbs/03_preprocessing.ipynb 39
+# %% ../nbs/03_preprocessing.ipynb 49
 V4_2_FEATURE_GROUP_MAPPING = {"intelligence": ["feature_ethiopic_anhedonic_stob", "feature_pulverized_unified_dupery", "feature_pansophical_agitato_theatricality", "feature_recreational_homiletic_nubian", "feature_received_veiniest_tamarix", "feature_paleolithic_myalgic_lech", "feature_phasmid_accommodating_aftercare", "feature_untinned_dextrogyrate_fining", "feature_unsatisfactory_lovelorn_brainstorm", "feature_terminative_extroverted_interpretation", "feature_pacific_sleeved_devise", "feature_unconstitutional_chiseled_coalport", "feature_superhuman_coenobitical_scotticism", "feature_wendish_synchronal_advertency", "feature_unventilated_sollar_bason", "feature_godliest_consistorian_woodpecker", "feature_weedier_indistinctive_haranguer", "feature_faddiest_clement_repatriation", "feature_monocyclic_galliambic_par", "feature_protonematal_springtime_varioloid", "feature_instructional_desensitized_symmetallism", "feature_disarrayed_rarefactive_trisulphide", "feature_antarthritic_syzygial_wonderland", "feature_guardant_giocoso_natterjack", "feature_ten_male_phoenician", "feature_guardant_irrepealable_onanist", "feature_promised_intramolecular_sora", "feature_bespoke_combining_farrow", "feature_unliquefied_folding_equilibrator", "feature_uncomplying_unprovocative_ochlophobia", "feature_differing_lenticular_gossiping", "feature_ottoman_metaphysical_parathion", "feature_variolate_reducible_sweet", "feature_jumpiest_clattering_pentstemon", "feature_sylphid_maladaptive_franc"], "charisma": ["feature_supercelestial_telic_dyfed", "feature_altimetrical_muddled_symbolism", "feature_unshaken_ahorse_wehrmacht", "feature_gambrel_unblessed_gigantomachy", "feature_obeliscal_bewildered_reviewer", "feature_underdressed_tanagrine_prying", "feature_corniest_undue_scall", "feature_reduplicative_appalling_metastable", "feature_wrathful_prolix_colotomy", "feature_limonitic_issuable_melancholy", "feature_approximal_telautographic_sharkskin", "feature_fribble_gusseted_stickjaw", "feature_spec_subversive_plotter", "feature_unsinkable_dumbstruck_octuplet", "feature_integrative_reviviscent_governed", "feature_tamil_grungy_empathy", "feature_canopic_exigible_schoolgirl", "feature_plumular_constantinian_repositing", "feature_serpentiform_trinary_imponderability", "feature_gyroidal_embowed_pilcher", "feature_unlivable_armenian_wedge", "feature_flawed_demonological_toady", "feature_pruinose_raploch_roubaix", "feature_seediest_ramshackle_reclamation", "feature_hagiological_refer_vitamin", "feature_alcibiadean_lumpier_origan", "feature_encased_unamiable_hasidism", "feature_evocable_woollen_guarder", "feature_hunchbacked_unturning_meditation", "feature_circumnavigable_naughty_retranslation", "feature_testicular_slashed_ventosity", "feature_potential_subsessile_disconnection", "feature_unswaddled_inenarrable_goody", "feature_stellular_paler_centralisation", "feature_angevin_fitful_sultan", "feature_subinfeudatory_brainy_carmel", "feature_simpatico_cadential_pup", "feature_esculent_erotic_epoxy", "feature_milliary_hyperpyretic_medea", "feature_coraciiform_sciurine_reef", "feature_weightiest_protozoic_brawler", "feature_certificated_putrescent_godship", "feature_deckled_exaggerative_algol", "feature_unrecognisable_waxier_paging", "feature_fortyish_neptunian_catechumenate", "feature_tricksiest_pending_voile", "feature_forcipate_laced_greenlet", "feature_scombroid_genoese_kilojoule", "feature_topologic_subcaliber_radiotelephony", "feature_diluted_maxillary_denouement", "feature_flauntier_forethoughtful_festival", "feature_emarginate_enigmatical_yiddish", "feature_planular_naturistic_pinhead", "feature_insipid_unshakable_panne", "feature_abreast_viscoelastic_commander", "feature_uneffaced_unintermitted_spurt", "feature_tenth_contrasting_slice", "feature_geomorphological_uncompanioned_colander", "feature_deflective_demographic_saragossa", "feature_teratogenic_wet_calkin", "feature_graceful_vaunted_accommodator", "feature_perpetuable_stuffed_manxman", "feature_belittled_scenographic_antidisestablishmentarianism", "feature_plausive_skaldic_shoebox", "feature_incognita_cleaned_asphyxiant", "feature_biaxal_forworn_sixty", "feature_dressy_skiable_hypognathism", "feature_maltese_flaggiest_platelayer", "feature_gory_medullated_waverer", "feature_precursory_maltese_wetting", "feature_overexcitable_filmier_queening", "feature_analgesic_ardent_conservatoire", "feature_realisable_defeatist_japer", "feature_adventive_isohyetal_newshawk", "feature_interatomic_doggish_teutonisation", "feature_peeled_singing_smacking", "feature_sophomoric_perseverant_sclaff", "feature_regrettable_liberating_crabber", "feature_polyzoarial_histologic_shallop", "feature_revitalizing_intersectional_dysthymia", "feature_sanctioned_sunny_lily", "feature_chariest_unimplored_towboat", "feature_unchaste_raisable_tetraploidy", "feature_disapproving_behind_dampener", "feature_instinctive_dappled_upholder", "feature_unforeboding_succeeding_wildcatter", "feature_cockiest_ditheistical_pennyworth", "feature_baggier_supernormal_calcedony", "feature_convergent_reborn_autoroute", "feature_choric_illustrated_inch", "feature_uninquiring_unspiritualized_gradualism", "feature_embolic_menial_mariculture", "feature_pectoral_couthie_epiphenomenon", "feature_literal_memoriter_heavy", "feature_fatalistic_cramoisy_locative", "feature_grassier_sizy_chorale", "feature_quaternate_loftier_directorate", "feature_stunning_unladen_ockham", "feature_prototypical_daylong_glop", "feature_leafiest_unrepaired_indemnification", "feature_ecumenical_neuron_equity", "feature_castrated_inculpatory_pea", "feature_unstarched_isogonic_alternation", "feature_unthawed_moved_theft", "feature_depleted_omnidirectional_baluchi", "feature_unsocial_pouring_barbe", "feature_like_inflorescent_sierra", "feature_mauve_supernumerary_hogan", "feature_harmonized_intrinsic_disapproval", "feature_unplumb_prefectorial_gloucester", "feature_towery_eighteenth_enough", "feature_kinematical_absorbable_specialisation", "feature_lamplit_unengaged_mommy", "feature_unmoaned_attritional_crenation", "feature_deltoid_chalkier_connecticut", "feature_disincentive_unchallenged_aerobe", "feature_regurgitate_demolition_downstate", "feature_antenuptial_moonlit_incidence", "feature_disclosed_transcendental_pungency", "feature_certified_sensorial_occiput", "feature_froward_flattering_cretic", "feature_packaged_topological_paradigm", "feature_interfemoral_battered_ghetto", "feature_intrusive_sniffy_gangland", "feature_pedicular_fanfold_beseecher", "feature_effortful_inenarrable_johnsonianism", "feature_tardigrade_intercommunal_propitiatory", "feature_elasmobranch_braving_typhoid", "feature_aweary_fruiting_climb", "feature_unwomanly_pitying_saffian", "feature_aeriform_discomposed_moolvie", "feature_laniary_chelated_rejoicing", "feature_tricksome_unimproved_accidental", "feature_unperched_forgetive_vasoconstrictor", "feature_cislunar_ritardando_gadwall", "feature_odd_desiderative_godet", "feature_natant_wriest_dollop", "feature_tiptoe_decadent_statue", "feature_quaggy_chilliest_inchoative", "feature_explanatory_immature_cautery", "feature_versicular_buoyant_codetta", "feature_septuple_bonapartean_sanbenito", "feature_probationary_readying_roundelay", "feature_manifold_melodramatic_girl", "feature_sardonic_primary_shadwell", "feature_snatchy_xylic_institution", "feature_multiseriate_oak_benzidine", "feature_gobioid_transhuman_interconnection", "feature_reservable_peristomal_emden", "feature_inestimable_unmoral_extraversion", "feature_nubby_sissified_value", "feature_incorporating_abominable_daily", "feature_herbaged_brownish_consubstantialist", "feature_solemn_wordier_needlework", "feature_evangelistic_cruel_dissimilitude", "feature_impetratory_shuttered_chewer", "feature_referenced_biliteral_chiropody", "feature_eleatic_fellow_auctioneer", "feature_malpighian_vaporized_biogen", "feature_expiscatory_wriest_colportage", "feature_yelled_hysteretic_eath", "feature_bitterish_buttocked_turtleneck", "feature_percipient_atelectatic_cinnamon", "feature_gobony_premonitory_twinkler", "feature_twittery_tai_attainment", "feature_crooked_wally_lobation", "feature_crookback_workable_infringement", "feature_brawling_unpeppered_comedian", "feature_glyphographic_reparable_empyrean", "feature_noctilucent_subcortical_proportionality", "feature_guardian_frore_rolling", "feature_denuded_typed_wattmeter", "feature_unreachable_neritic_saracen", "feature_enzymatic_poorest_advocaat", "feature_wariest_vulnerable_unmorality", "feature_guttering_half_spondee", "feature_distressed_bloated_disquietude", "feature_leaky_overloaded_rhodium", "feature_unsapped_anionic_catherine", "feature_kissable_forfeit_egotism", "feature_unsizable_ancestral_collocutor", "feature_healthier_unconnected_clave", "feature_unimproved_courtliest_uncongeniality", "feature_coordinated_astir_vituperation", "feature_coactive_bandoleered_trogon", "feature_bootleg_clement_joe", "feature_thousandth_hierarchal_plight", "feature_unhoped_hex_ventriloquism", "feature_treacly_heuristic_binding", "feature_bulbed_viscose_toy", "feature_patristic_intelligential_crackajack", "feature_lucullian_unshunned_ulex", "feature_unrealistic_inoperable_publishing", "feature_perceptive_unnavigable_elegancy", "feature_recurrent_perversive_injury", "feature_overrank_shavian_epitaxy", "feature_petticoated_unobeyed_mugwort", "feature_stimulant_proximal_moocher", "feature_datival_crucial_chevrotain", "feature_just_flavescent_draff", "feature_cephalopod_arrased_jird", "feature_endogamic_suasible_boasting", "feature_rheumatic_bravest_pantisocracy", "feature_store_comforted_goiter", "feature_goofy_glassed_cetacea", "feature_crushed_gleg_reintroduction", "feature_scald_vanishing_enchainment", "feature_blinded_memorable_wring", "feature_clavate_geriatric_aldebaran", "feature_palimpsest_inoffensive_coiffeuse", "feature_adored_empyreal_revel", "feature_schizomycetic_gooey_mynah", "feature_pourable_multangular_requisition", "feature_resuscitated_taloned_borak", "feature_devoured_disunited_didn't", "feature_undefeated_unworkmanlike_probe", "feature_archaean_unregarded_caravel", "feature_concealed_artful_thaw", "feature_bluff_carbonyl_verbena", "feature_gymnorhinal_unreached_carthusian", "feature_falsifiable_performative_maxixe", "feature_vapourish_ichthyotic_causerie", "feature_craggier_windier_apologia", "feature_elaborate_intimate_bor", "feature_meteorological_tushed_ester", "feature_iffy_pretty_gumming", "feature_numeral_cagey_haulm", "feature_piping_geotactic_cusp", "feature_rutilant_obliterate_potassium", "feature_unhomely_monoclinic_acajou", "feature_adynamic_ramstam_urtica", "feature_khedival_viewable_bloodlust", "feature_petulant_thirty_safety", "feature_manganic_hyetographical_cadastre", "feature_quinoidal_ungrudged_hebraiser", "feature_intersectional_inseminated_undersigned", "feature_idyllic_spectacled_togue", "feature_antiskid_circumlocutional_ogdon", "feature_overdone_raspiest_halcyon", "feature_coagulatory_bathymetrical_pergamum", "feature_paragenetic_traditional_madeline", "feature_collapsable_sinful_cassareep", "feature_preceding_perturbing_radii", "feature_hypogeal_unburied_embraceor", "feature_hobbesian_infrasonic_subjugator", "feature_deliquescent_pelvic_functionary", "feature_maternal_knobbier_dialecticism", "feature_blowzier_sleepiest_verifier", "feature_uncurtailed_sabaean_ode", "feature_crosscut_rompish_osteopathist", "feature_expectative_intimidated_bluffer", "feature_creaking_unsophisticated_clavier", "feature_prissy_counsellable_keg", "feature_unreposing_mellifluent_dindle", "feature_cowled_knottiest_megilp", "feature_yoruban_unapplied_tawse", "feature_electrophysiological_blearier_deconsecration", "feature_nepotic_overreaching_itinerary", "feature_scrawny_wavy_pheon", "feature_incurrent_homeopathic_overcapacity", "feature_viridescent_choking_pinto", "feature_julienne_interludial_noradrenaline", "feature_unexplained_orthorhombic_kenny", "feature_aspheric_cloudy_restorationism", "feature_epistatic_absent_slayer", "feature_won_stalwart_eisenstein", "feature_indulgent_amphibrachic_surrebutter", "feature_hypnagogic_wedded_religionist", "feature_dormant_samariform_elucidator", "feature_geostationary_manky_teutonisation", "feature_unabbreviated_unteamed_krasnoyarsk", "feature_deontological_sidearm_alder", "feature_saprogenic_quadrilateral_chook", "feature_hagiographical_fertile_disestablishment", "feature_moonlit_hundred_conferrer", "feature_immensurable_myrmecological_angler", "feature_telencephalic_assumed_loran", "feature_other_peatier_raymond", "feature_unkingly_protochordate_confluent", "feature_falcate_concurrent_kwa", "feature_snuggest_counterclockwise_desolater", "feature_perspectivist_nondestructive_haemocoel", "feature_demonstrated_wordiest_globulin", "feature_wrinkliest_unmaintainable_usk", "feature_unhurt_centroidal_whimsey", "feature_supratemporal_pharmaceutical_ambassadorship", "feature_unordered_insertional_looter", "feature_geothermal_optional_octagon", "feature_overnight_fluent_trepan", "feature_necrotic_potamic_passionary"], "strength": ["feature_tuberculate_patelliform_paging", "feature_inflammable_numb_anticline", "feature_malignant_campodeid_pluton", "feature_dure_jaspery_mugging", "feature_educational_caustic_mythologisation", "feature_diverted_astral_dunghill", "feature_degenerate_diaphragmatic_literalizer", "feature_laced_scraggly_grimalkin", "feature_wheezier_unjaundiced_game", "feature_unimpressed_uninflected_theophylline", "feature_shiite_overfed_mense", "feature_irritant_reciprocal_pelage", "feature_bricky_runed_bottleful", "feature_phyletic_separate_genuflexion", "feature_peckish_impetrative_kanpur", "feature_unshrinking_semiarid_floccule", "feature_heartier_salverform_nephew", "feature_geostrophic_adaptative_karla", "feature_navigational_enured_condensability", "feature_confusable_pursy_plosion", "feature_clenched_wayward_coelostat", "feature_developed_arbitrary_traditionalist", "feature_unnameable_abysmal_net", "feature_completive_pedantical_sinecurist", "feature_witchy_orange_muley", "feature_misfeatured_sometime_tunneler", "feature_overjoyed_undriven_sauna", "feature_antacid_thermogenic_wilhelm", "feature_gerundival_puristic_gobioid", "feature_ministrative_slurred_parenchyma", "feature_squabbiest_receivable_foreyard", "feature_daytime_arching_expropriator", "feature_underdeveloped_eastern_goner", "feature_noetic_thermometric_pique", "feature_glial_birefringent_popery", "feature_rural_apogean_titbit", "feature_aaronic_unexampled_arguer", "feature_chorial_sapheaded_humberside", "feature_juvenalian_typical_langton", "feature_heterotactic_masculine_liquidity", "feature_piping_unabolished_statocyst", "feature_scroddled_groaning_sanctuary", "feature_overlarge_societal_alternator", "feature_unquestioning_dappled_phenomenalism", "feature_pacifist_unmeaning_haslet", "feature_cantharidian_lightful_cubicle", "feature_supportive_sublime_phenolic", "feature_derogate_bigoted_mnemonic", "feature_balinese_uncomforted_mimicker", "feature_revolutionist_proportionate_headscarf", "feature_anticivic_blistery_knot", "feature_anamnestic_conformable_spaceship", "feature_leprose_corroborant_incapacitation", "feature_sunset_slouchy_alisma", "feature_cased_polycrystalline_groschen", "feature_fremd_cricoid_gibberellin", "feature_knowing_humid_justifiability", "feature_croaking_japhetic_fifer", "feature_prothallium_burst_pledget", "feature_unassimilable_chunky_flattie", "feature_inhibiting_supernatural_runyon", "feature_resentful_eisteddfodic_assyrian", "feature_studded_premonitory_periostracum", "feature_dendritic_phytographic_skydiving", "feature_transpositional_undisciplinable_ancestor", "feature_redeemed_petiolar_lethe", "feature_enveloping_diabolic_serviette", "feature_excaudate_laboured_loquitur", "feature_unsympathetic_classic_abac", "feature_concise_tangy_bentham", "feature_freezing_unrenewed_gillray", "feature_intranational_sepulchral_clacton", "feature_mesarch_disentangled_catalytic", "feature_cauline_herpetic_videocassette", "feature_gravest_insincere_bronwen", "feature_plutocratic_cressy_plasterboard", "feature_massive_demisable_spouse", "feature_ugly_admissible_firm", "feature_reproachable_foliaged_lysozyme", "feature_sunburnt_sympodial_cookhouse", "feature_expended_evitable_darwinian", "feature_unreceipted_latest_lesser", "feature_necked_moresque_lowell", "feature_balaamitical_electropositive_exhaustibility", "feature_unvalued_untangled_keener", "feature_undisturbing_quadrifid_reinhardt", "feature_bucked_costume_malagasy", "feature_joint_unreturning_basalt", "feature_coordinate_shyer_evildoing", "feature_carunculate_discursive_hectare", "feature_cynic_unreckonable_feoffment", "feature_cnidarian_micrologic_sousaphone", "feature_unperceivable_unrumpled_appendant", "feature_dissolvable_chrismal_obtund", "feature_choosier_uncongenial_coachwood", "feature_grimmest_prostate_doctrinaire", "feature_granulative_uncritical_agostini", "feature_convalescence_deuteranopic_lemuroid", "feature_disintegrable_snakier_zion", "feature_thoughtful_accommodable_lack", "feature_basophil_urdy_matzo", "feature_repellant_unwanted_clarinetist", "feature_antimonarchist_ordainable_quarterage", "feature_hardback_saturnalian_cyclometer", "feature_mythic_florentine_psammite", "feature_serpentiform_incomplete_bessarabia", "feature_unappeasable_employed_photoelectron", "feature_unappreciated_humiliated_misapprehension", "feature_turbaned_excentric_rockery", "feature_aymaran_indusial_elodea", "feature_terpsichorean_hatable_glut", "feature_aeolic_downy_forefinger", "feature_undrowned_ascending_pungency", "feature_flagging_undenominational_gauffering", "feature_sworn_satanic_sprechstimme", "feature_atheist_pompeian_fogsignal", "feature_commotional_unhealable_berserk", "feature_grizzled_reformist_soberer", "feature_twiggier_fogged_prosodist", "feature_easterly_subtractive_faroese", "feature_looted_eleven_corpora", "feature_mensal_amusive_phosphorylase", "feature_shellier_dowable_chyme", "feature_daunting_nomenclatorial_facility", "feature_bedfast_primordial_hyponym", "feature_herpetologic_unjoyful_lodgepole", "feature_unlearned_plicate_megabit", "feature_cyclopedic_maestoso_daguerreotypist", "feature_disjunct_hardened_picturing", "feature_congolese_convenable_coolth", "feature_epigraphic_leucocratic_rutherford", "feature_hatched_myriad_biogen", "feature_gnomonic_fixative_vocalise", "feature_commo_flavored_epitomizer", "feature_exoergic_zoomorphic_burin"], "dexterity": ["feature_affettuoso_taxidermic_greg", "feature_lateral_confervoid_belgravia", "feature_geochemical_unsavoury_collection", "feature_guerrilla_arrested_flavine", "feature_undependable_stedfast_donegal", "feature_bijou_penetrant_syringa", "feature_lamarckian_tarnal_egestion", "feature_horticultural_footworn_superscription", "feature_small_cumulative_graywacke", "feature_incertain_catchable_zibet", "feature_woodier_slimmest_supplanter", "feature_conducive_underlying_snood", "feature_anencephalic_unattempted_pschent", "feature_bronchitic_miscible_inwall", "feature_sophistic_translucid_abutment", "feature_fortissimo_undrawn_ratio", "feature_appellant_verbalized_duckbill", "feature_sinister_footworn_tilling", "feature_subglobose_sleekier_calcaneum", "feature_addressable_intransitive_reconnoitrer", "feature_imitable_unnatural_samuel", "feature_wuthering_stinky_bimetallist", "feature_fungible_allotted_deterioration", "feature_saut_shalwar_culpability", "feature_dental_stormier_chape", "feature_irresponsible_unearthly_neat", "feature_alive_romansh_stinging", "feature_thermophile_noisette_swamper", "feature_corporatist_seborrheic_hopi", "feature_undisguised_unenviable_stamen", "feature_acclimatisable_unfeigned_maghreb", "feature_galactopoietic_luckiest_protecting", "feature_unheeded_stylar_planarian", "feature_preceptive_rushed_swedenborgian", "feature_sumerian_descendible_kalpa", "feature_jazziest_spellbinding_philabeg", "feature_dormie_sodden_steed", "feature_directoire_propositional_clydebank", "feature_cragged_sacred_malabo", "feature_idled_unwieldy_improvement", "feature_unmanaged_amative_grog", "feature_intime_impassible_ferrule", "feature_undevout_sonant_westerner", "feature_unlucky_hammered_pard", "feature_eucaryotic_centillionth_bastnaesite", "feature_mancunian_stalky_charmeuse", "feature_mettlesome_concussive_twinkling", "feature_unreduced_massive_hull", "feature_born_valvular_blob", "feature_setose_processed_crevice", "feature_associate_unproper_gridder"], "constitution": ["feature_floatiest_quintuplicate_carpentering", "feature_cuddlesome_undernamed_incidental", "feature_loony_zirconic_hoofer", "feature_indign_tardier_borough", "feature_fair_papal_vinaigrette", "feature_attack_unlit_milling", "feature_midmost_perspiratory_hubert", "feature_laminable_unspecified_gynoecium", "feature_ungenuine_sporophytic_evangelist", "feature_inconsiderate_unbooted_ricer", "feature_inured_conservable_forcer", "feature_glibber_deficient_jakarta", "feature_morbific_irredentist_interregnum", "feature_conjoint_transverse_superstructure", "feature_tingling_large_primordiality", "feature_phyllopod_unconstrainable_blubberer", "feature_deformable_unitary_schistosity", "feature_unprovisioned_aquatic_deuterogamy", "feature_equipped_undoubted_athanasian", "feature_soviet_zibeline_profiler", "feature_maxillary_orphic_despicability", "feature_clasping_fast_menstruation", "feature_babist_moribund_myna", "feature_stellular_paler_centralisation", "feature_cooled_perkiest_electrodeposition", "feature_differing_peptizing_womaniser", "feature_rankine_meaty_port", "feature_southernmost_unhuman_arbiter", "feature_unimpressed_uninflected_theophylline", "feature_subservient_wedged_limping", "feature_urticant_ultracentrifugal_wane", "feature_stoichiometric_unanswerable_leveller", "feature_cyanophyte_emasculated_turpin", "feature_unruly_salian_impetuosity", "feature_ataractic_swept_rubeola", "feature_burning_phrygian_axinomancy", "feature_dietetic_unscholarly_methamphetamine", "feature_vegetable_manlier_macaco", "feature_anthropoid_pithy_newscast", "feature_verifying_imagism_sublease", "feature_songful_intercostal_frightener", "feature_additive_untrustworthy_hierologist", "feature_translative_quantitative_eschewer", "feature_coseismic_surpassable_invariance", "feature_linear_scummiest_insobriety", "feature_ovine_bramblier_leaven", "feature_coalier_hircine_brokerage", "feature_undiverted_analyzed_accidie", "feature_favourable_swankiest_tympanist", "feature_refractory_topped_dependance", "feature_bustled_fieriest_doukhobor", "feature_isobilateral_olden_nephron", "feature_circassian_leathern_impugner", "feature_signed_ringent_sunna", "feature_cornute_potentiometric_tinhorn", "feature_veristic_parklike_halcyon", "feature_unwithered_personate_dilatation", "feature_wrought_muckier_temporality", "feature_rival_undepraved_countermarch", "feature_irrevocable_unlawful_oral", "feature_elohistic_totalitarian_underline", "feature_paraffinoid_flashiest_brotherhood", "feature_depauperate_armipotent_decentralisation", "feature_jamesian_scutiform_ionium", "feature_gambogian_feudalist_diocletian", "feature_moneyed_mesophytic_lester", "feature_purblind_autarkic_pyrenoid", "feature_yeasty_castilian_nicaragua", "feature_peak_interpretive_lahti", "feature_lithotomical_periodontal_systemization", "feature_martinique_tingliest_gynaecocracy", "feature_nymphomaniac_disappointing_greenaway", "feature_discombobulated_fourierism_histopathologist", "feature_granulitic_cordial_infield", "feature_piebald_unresisted_soldo", "feature_blushful_protean_granduncle", "feature_untired_flighty_tungstate", "feature_adjustable_ruffled_lumberjacket", "feature_toadyish_illiterate_famishment", "feature_inaccessible_radioactive_glassine", "feature_augean_contraceptive_subsequence", "feature_unbearded_rustiest_fiddlewood", "feature_contrasty_ablaze_canaster", "feature_uncharmed_rallying_ostracon", "feature_spicate_photolithographic_buckskin", "feature_disliked_undersized_vermiculation", "feature_costliest_heavenly_bovver", "feature_grasping_unmetrical_trollopian", "feature_interruptive_breached_protanomaly", "feature_reviving_mystifying_antwerp", "feature_sanctioned_sunny_lily", "feature_unmethodized_straining_heartburning", "feature_holometabolic_speeding_subinfeudatory", "feature_touring_urnfield_sequestrum", "feature_sunproof_unmurmuring_heliotype", "feature_aaronic_unexampled_arguer", "feature_tutelary_mangier_cryoscopy", "feature_depressant_blinded_yellowstone", "feature_saturated_protozoal_unsociability", "feature_nutant_legatine_fairfax", "feature_suety_mystagogical_islamization", "feature_defeasible_bustiest_trimetrogon", "feature_antitussive_vixenly_sacque", "feature_seminarial_catachrestic_i've", "feature_tangled_dropsical_uprooter", "feature_colourable_lapsable_foliage", "feature_heterotopic_choreographic_argentina", "feature_epithelial_apodictic_constructivism", "feature_resorbent_unmurmuring_humoring", "feature_uneducated_afraid_sip", "feature_spellable_quintic_idiotism", "feature_incredible_glimmering_hoydenism", "feature_scrappier_seen_phalanx", "feature_prostate_kernelly_chromogen", "feature_muggiest_explicit_barnardo", "feature_banal_microanalytical_posset", "feature_constrained_disused_perishable", "feature_apt_trimeter_bucketful", "feature_retardative_telencephalic_heme", "feature_quintuplicate_hortative_merionethshire", "feature_tetraploid_vorticose_mil", "feature_likeliest_exhaled_middlemarch", "feature_rhinological_downier_gamb", "feature_expectative_zonate_stockbroker", "feature_entrepreneurial_glumpiest_longhorn", "feature_recommendatory_prissy_flutter", "feature_blathering_unwell_despiser", "feature_intromittent_surer_pederasty", "feature_undealt_tonal_fictionalization", "feature_undrawn_oldish_deprivation", "feature_twistable_comely_licensee", "feature_overweening_incommunicable_pealing", "feature_phagocytic_humanistic_chappal", "feature_cyanotic_unblissful_aeration", "feature_indefeasible_abject_faucet", "feature_adolescent_anguilliform_staging", "feature_escheatable_miscreative_provence", "feature_coloratura_preclusive_micromillimetre", "feature_agape_untamable_towmond", "feature_underemployed_opiate_aube", "feature_winglike_hydropathic_sedimentology", "feature_conglomerate_amphipod_sewellel", "feature_virtuosic_afflicted_sumatra", "feature_chorionic_coated_undergraduette", "feature_tinkly_driftiest_maurya", "feature_pulsing_ionian_flatterer", "feature_downiest_spenserian_evadne", "feature_logistical_ahistorical_congregation", "feature_sensationalistic_puritan_mirador", "feature_steely_delusory_anesthesiologist", "feature_dissymmetric_stressed_stonewalling", "feature_lathery_uncarpeted_prolactin", "feature_coronate_congeneric_stockhausen", "feature_sane_disqualifying_whimperer", "feature_rifled_mum_ova", "feature_vibratory_prejudicial_quadrillion", "feature_enervated_tearier_septation", "feature_elasmobranch_braving_typhoid", "feature_autumn_prefectural_viscera", "feature_quaint_lyophobic_draper", "feature_nephritic_unrelievable_piperonal", "feature_mesarch_discreditable_calming", "feature_dendritic_phytographic_skydiving", "feature_differential_intercrossed_royalism", "feature_revelational_natty_nephralgia", "feature_subversive_guardable_kago", "feature_vulcanian_brimstony_autobiographer", "feature_unsoaped_waspier_much", "feature_vermillion_platyrrhine_demulsification", "feature_interchangeable_yellow_thinker", "feature_undermanned_transfusible_executive", "feature_jiggish_mechanized_patricide", "feature_tetrabasic_enervated_hemiparasite", "feature_chiseled_dastard_analyst", "feature_speediest_nautical_edge", "feature_fertilised_lakier_offside", "feature_parsonish_rutty_citronella", "feature_cyclone_disappointing_trollopean", "feature_sweatier_orbital_arrhenotoky", "feature_hydrokinetic_idyllic_archetype", "feature_mantuan_cricoid_responder", "feature_undesirable_candied_computist", "feature_tethered_exceptive_altimeter", "feature_mediative_sufferable_serosity", "feature_pinnatiped_unelected_irreverence", "feature_coated_transitory_oersted", "feature_epicontinental_centum_raine", "feature_desensitizing_distributive_bidder", "feature_syncytial_exterior_remora", "feature_sullied_vulval_disappointing", "feature_totipalmate_rightable_occultist", "feature_acanthoid_slimiest_decor", "feature_submontane_schmaltzy_piggyback", "feature_wannish_record_lunette", "feature_smuggled_scarabaeoid_fastball", "feature_sematic_helminthoid_tricentenary", "feature_untamed_contemplative_deism", "feature_municipal_curvier_hegelianism", "feature_pitchiest_dresden_barnard", "feature_korean_bassy_strewing", "feature_homelike_telltale_silvan", "feature_lacerable_backmost_vaseline", "feature_unimaginable_sec_kaka", "feature_goidelic_gobelin_ledge", "feature_incondite_undisappointing_telephotograph", "feature_concoctive_symmetric_abulia", "feature_anglophobic_unformed_maneuverer", "feature_required_bibliological_tonga", "feature_amoroso_wimpish_maturing", "feature_uncompelled_curvy_amerindian", "feature_tottery_unmetalled_codder", "feature_tachygraphical_sedimentological_mesoderm", "feature_adsorbed_blizzardy_burlesque", "feature_wistful_tussive_cycloserine", "feature_superjacent_grubby_axillary", "feature_biological_caprine_cannoneer", "feature_unreversed_fain_jute", "feature_unexalted_rebel_kofta", "feature_doggish_mouthwatering_abelard", "feature_forfeit_contributing_joinder", "feature_crimpier_gude_housedog", "feature_riskier_ended_typo", "feature_smaller_colored_immurement", "feature_conchal_angriest_oophyte", "feature_wariest_vulnerable_unmorality", "feature_cirsoid_buddhism_vespa", "feature_rid_conveyable_cinchonization", "feature_newfangled_huddled_gest", "feature_clandestine_inkiest_silkworm", "feature_cynic_unreckonable_feoffment", "feature_genoese_uncreditable_subregion", "feature_dexter_unstifled_snoring", "feature_orchitic_reported_coloration", "feature_stelliform_curling_trawler", "feature_athenian_pragmatism_isomorphism", "feature_abating_unadaptable_weakfish", "feature_partible_amphibrachic_classicism", "feature_cosy_microtonal_cedar", "feature_heedful_argyle_russianization", "feature_unhonoured_detested_xenocryst", "feature_sicker_spelaean_endplay", "feature_stratocratic_aerodynamic_herero", "feature_uneasy_unaccommodating_immortality", "feature_professional_platonic_marten", "feature_detrital_respected_parlance", "feature_saclike_hyphal_postulator", "feature_recent_shorty_preferment", "feature_scarcest_vaporized_max", "feature_spicier_unstripped_initial", "feature_hooly_chekhovian_phytogeographer", "feature_smouldering_underground_wingspan", "feature_phantasmal_extenuative_britain", "feature_sciurine_stibial_lintwhite", "feature_eucharistic_widowed_misfeasance", "feature_libratory_seizable_orlando", "feature_brackish_obstructed_almighty", "feature_translucid_neuroanatomical_sego", "feature_triangled_rubber_skein", "feature_vendean_thwartwise_resistant", "feature_preoral_tonsorial_souk", "feature_virescent_telugu_neighbour", "feature_undepreciated_partitive_ipomoea", "feature_southerly_assonant_amicability", "feature_cortical_halt_catcher", "feature_hermitical_stark_serfhood", "feature_deformable_productile_piglet", "feature_lentissimo_ducky_quadroon", "feature_happening_tristful_yodeling", "feature_geomedical_imbued_clunk", "feature_unadjusted_dissectible_warley", "feature_demountable_unprejudiced_neighbourhood", "feature_twisted_saronic_necrologist", "feature_celebratory_assayable_carlisle", "feature_cheerful_aphidian_orchestrion", "feature_transisthmian_inculcative_heldentenor", "feature_rampant_barren_sapodilla", "feature_often_undermanned_nudist", "feature_stannic_peevish_idocrase", "feature_biobibliographical_carnal_atomisation", "feature_depletory_cannular_automatism", "feature_collectable_distinguishing_dichroite", "feature_garlicky_allopatric_sarcocarp", "feature_whiskered_unobjectionable_quintet", "feature_enteric_booked_flexography", "feature_inlaid_defensible_gladiator", "feature_natal_scalloped_edwardianism", "feature_sphygmic_young_latium", "feature_infested_feathered_pen", "feature_monosyllabic_homey_omicron", "feature_thrasonical_subaltern_inoculation", "feature_exuberant_helicoidal_baldachin", "feature_vapourish_ichthyotic_causerie", "feature_intromittent_evasive_swordcraft", "feature_augmentable_scriabin_fortnight", "feature_exoergic_unschooled_lipid", "feature_inhospitable_baked_elopement", "feature_grizzled_reformist_soberer", "feature_intracardiac_circumfluent_pepper", "feature_contaminable_exilic_girandole", "feature_lowered_toric_charmeuse", "feature_altruistic_congenital_disinflation", "feature_rowdyish_overcritical_digression", "feature_peccant_zanier_undersigned", "feature_entozoic_adolescent_asci", "feature_antistatic_cabbagy_bluecoat", "feature_uncropped_tipsier_postulator", "feature_diocesan_reinvigorated_ebullience", "feature_axonometric_unkindly_sienna", "feature_ultra_unpolluted_adsorbent", "feature_bespangled_prim_might", "feature_comely_typal_softie", "feature_adherent_judaic_gerry", "feature_unelected_authorized_lucia", "feature_unreproved_cultish_glioma", "feature_ago_hypocritical_codeclination", "feature_proteinic_marcan_anxiety", "feature_endermatic_toasted_donald", "feature_restricting_unghostly_tapir", "feature_coequal_ambient_philopena", "feature_heliotypic_deprivative_behavior", "feature_unpriced_sniffiest_marvel", "feature_diphthongal_unvisored_knothole", "feature_jugoslav_cultured_tinct", "feature_gravettian_groveling_crooning", "feature_admissive_jaggiest_yabby", "feature_millenary_aliquot_hangdog", "feature_benzal_sprucest_taler", "feature_humpbacked_tribrachic_cosmotron", "feature_hated_twiggiest_mash", "feature_impeded_propagandist_darer", "feature_phylogenetic_paramount_caperer", "feature_easterly_predicable_enclosure", "feature_dyspeptic_unobstructive_rewriting", "feature_iridic_vellum_invective", "feature_bearable_sacrificial_sewer"], "wisdom": ["feature_froggier_unlearned_underworkman", "feature_peninsular_pulsatile_vapor", "feature_bally_bathymetrical_isadora", "feature_skim_unmeant_bandsman", "feature_kinky_benzal_holotype", "feature_ruptured_designing_interpolator", "feature_hierologic_expectable_maiolica", "feature_boiling_won_rama", "feature_lovelorn_aided_limiter", "feature_bratty_disrespectable_bookstand", "feature_mightier_chivalric_kana", "feature_overstrung_dysmenorrheal_ingolstadt", "feature_rose_buttoned_dandy", "feature_recipient_perched_dendrochronologist", "feature_spikier_ordinate_taira", "feature_mercian_luddite_aganippe", "feature_faint_consociate_rhytidectomy", "feature_unpressed_mahratta_dah", "feature_gleaming_monosyllabic_scrod", "feature_unyielding_dismal_divertissement", "feature_singhalese_cerographical_ego", "feature_agaze_lancinate_zohar", "feature_wally_unrotted_eccrinology", "feature_unforgivable_airtight_reinsurance", "feature_uninforming_predictable_pepino", "feature_pluviometrical_biannual_saiga", "feature_flawy_caller_superior", "feature_narcotized_collectivist_evzone", "feature_tallish_grimier_tumbrel", "feature_partitive_labyrinthine_sard", "feature_inhospitable_necked_duckbill", "feature_stolid_unhacked_schoolgirl", "feature_frogged_slightest_patmore", "feature_fascial_biserrate_pout", "feature_coercible_fecal_steradian", "feature_inadequate_unisex_internationalisation", "feature_darkened_campanulate_decerebrate", "feature_nephritic_grammatical_lithograph", "feature_lenient_electrothermal_phoenix", "feature_kingly_gemmological_electrodynamometer", "feature_applausive_forgettable_mishanter", "feature_unconfessed_paltry_finn", "feature_botchier_universalistic_nullifier", "feature_excursive_slaggy_confutation", "feature_tearing_inharmonic_employee", "feature_exhilarative_agleam_hebron", "feature_maigre_twinkling_overstand", "feature_handled_crescent_ciselure", "feature_apprehensible_assuring_schappe", "feature_trifling_sleety_amylase", "feature_jammed_stearic_gaper", "feature_biosynthetic_wambly_cullender", "feature_defective_sectional_stenotype", "feature_unworked_tribadic_catalyst", "feature_manufactured_nodal_seeking", "feature_asphyxiated_peaceful_effleurage", "feature_trad_unreduced_banian", "feature_fogyish_cruciate_starter", "feature_unpainted_censual_pinacoid", "feature_isoseismic_rhinocerotic_narceine", "feature_aleatory_phallic_swingtree", "feature_tragical_rainbowy_seafarer", "feature_chaliced_evolutional_street", "feature_legged_spatiotemporal_basalt", "feature_obligate_quadruplication_feathering", "feature_interpenetrative_boustrophedon_proudhon", "feature_pulmonic_bladed_affray", "feature_undisguised_photoelectric_floorboard", "feature_sodding_choosy_eruption", "feature_perverted_unapproving_sawyer", "feature_etched_furry_biriani", "feature_financed_striped_libertarian", "feature_pudendal_unterrifying_hagdon", "feature_standardized_rosiny_suslik", "feature_exploding_delectable_aril", "feature_hemihedral_fumed_marquisette", "feature_disillusive_saltant_placidity", "feature_squirarchal_bioplasmic_delay", "feature_gathered_owlish_judgment", "feature_dichotomic_tenpenny_myotonia", "feature_unapprehensive_thickety_etherification", "feature_unweary_avionic_claudine", "feature_satisfied_aymaran_enterotomy", "feature_indentured_insuperable_spider", "feature_gravimetric_ski_enigma", "feature_balmiest_spinal_roundelay", "feature_exertive_unmodernised_scaup", "feature_rude_booziest_ilium", "feature_footling_unpuckered_lophophore", "feature_thorniest_laughable_hindustani", "feature_hotter_cattish_aridity", "feature_developing_behind_joan", "feature_ectodermal_mandaean_saffian", "feature_inserted_inconvertible_functioning", "feature_drizzling_refrigerative_imperfection", "feature_smutty_prohibited_sullivan", "feature_productile_auriform_fil", "feature_accommodable_crinite_cleft", "feature_clipped_kurdish_grainer", "feature_dustproof_unafraid_stampede", "feature_neutered_postpositive_writ", "feature_twelve_haphazard_pantography", "feature_donsie_folkish_renitency", "feature_agee_sold_microhabitat", "feature_unutterable_softening_roper", "feature_seaboard_adducent_polynesian", "feature_liftable_direful_polyploid", "feature_objective_micro_langton", "feature_strip_honoured_trail", "feature_unsheltered_doughtiest_episiotomy", "feature_prefigurative_downstream_transvaluation", "feature_holy_chic_cali", "feature_huggable_interim_doline", "feature_tinkliest_unstuffy_manhunt", "feature_parturient_liberian_gamal", "feature_circulating_abolition_ethyne", "feature_ideological_trinal_rebuttal", "feature_figurative_uncertificated_indigent", "feature_improbable_pouched_gaitskell", "feature_unhazarded_droning_bellow", "feature_monarchic_blah_cellarman", "feature_walnut_sceptical_crystallization", "feature_quodlibetic_enrapt_miscalculation", "feature_doctrinal_viewier_dentary", "feature_careworn_motivational_requisite", "feature_psycholinguistic_junoesque_central", "feature_revolting_pharmacological_notability", "feature_unheeding_tauromachian_ballup", "feature_octopod_skirting_jurat", "feature_precursory_catching_inertia", "feature_bellicose_lunatic_glorification", "feature_undebauched_cobaltic_guerrilla", "feature_dysgenic_putrefied_nosegay", "feature_occurrent_suggestible_doubter", "feature_dada_draughtiest_cinchonisation", "feature_syndicalistic_epaxial_caldarium", "feature_rubbliest_cinnamic_gioconda", "feature_enervated_porose_microfarad", "feature_unalloyed_carminative_supercargo", "feature_mini_caressive_mantuan"], "agility": ["feature_unrelenting_intravascular_mesenchyme", "feature_scissile_dejected_kainite", "feature_ruthenic_peremptory_truth", "feature_digressive_ratty_supernatant", "feature_multipolar_syncopated_ambrotype", "feature_flamier_confusing_dithering", "feature_reverable_sunk_quiet", "feature_undrilled_wheezier_countermand", "feature_fearsome_merry_bluewing", "feature_entopic_interpreted_subsidiary", "feature_revitalizing_rutilant_swastika", "feature_carbuncled_athanasian_ampul", "feature_unransomed_unhealthier_excuser", "feature_milkier_gassy_pincushion", "feature_comprisable_commensurable_cyrenaic", "feature_antic_telekinetic_centrifuge", "feature_bearish_lesser_bloodstain", "feature_aquaphobic_paradisal_isagoge", "feature_sound_overabundant_agnomen", "feature_unlidded_chattier_usufructuary", "feature_agricultural_uranic_ankerite", "feature_bimanual_godly_witloof", "feature_anxiolytic_placatory_sextile", "feature_unsensing_enterprising_janissary", "feature_diffusive_unaccompanied_clubability", "feature_cistic_predeterminate_blackburn", "feature_pakistan_swirling_dystonia", "feature_bioplasmic_amended_iodism", "feature_defiled_feudalist_stonewaller", "feature_obtuse_waggly_entrancement", "feature_dysuric_permeated_makeweight", "feature_wordiest_babist_stackyard", "feature_foldaway_supernumerary_clubhouse", "feature_endoplasmic_inwrought_percival", "feature_checkered_accoutred_marjoram", "feature_lowery_transcribed_muffin", "feature_profaned_exothermal_orczy", "feature_bursarial_southmost_kaduna", "feature_elaborate_burning_drunkard", "feature_pardonable_ungraceful_bedazzlement", "feature_unholy_residential_anabaptism", "feature_uremic_trussed_grater", "feature_shrinelike_introverted_eagre", "feature_predominant_unmown_concealing", "feature_violated_telic_tuning", "feature_brief_optimistic_consentaneity", "feature_humanlike_urinant_snuffle", "feature_dividual_kufic_militarism", "feature_subminiature_catchable_classic", "feature_compatriotic_billion_revere", "feature_desired_thallophytic_brickfielder", "feature_hydriodic_metallurgic_stauroscope", "feature_stockish_overland_potentiation", "feature_stalagmitic_jacobethan_campanologist", "feature_theocentric_shameful_quintuplet", "feature_wombed_liberatory_malva", "feature_diametral_inflatable_editorialization", "feature_frowsier_productional_exemplification", "feature_acetose_periotic_coronation", "feature_irregular_sotted_biomedicine", "feature_directive_bioplasmic_skua", "feature_disparate_acellular_pictish", "feature_trimestrial_unsuspecting_guadeloupe", "feature_epinastic_sycophantical_satinwood", "feature_gaga_clinched_islamization", "feature_afoul_valvate_faery", "feature_pulsing_patrimonial_wame", "feature_underdeveloped_incomprehensible_traveller", "feature_polyphonic_superordinary_proximation", "feature_subjacent_repressive_biliverdin", "feature_nasofrontal_hornier_sterigma", "feature_apprentice_acheulian_extractability", "feature_gandhian_discretional_cricoid", "feature_nonagenarian_roundish_publication", "feature_togate_unbailable_door", "feature_setose_quodlibetical_stichic", "feature_true_legendary_shote", "feature_normal_urochordal_proffer", "feature_daring_telial_airspeed", "feature_spare_lingulate_withering", "feature_inclined_starchy_praseodymium", "feature_francophone_lattermost_spohr", "feature_uninvested_unwishful_scoria", "feature_pulverable_unpolitical_bathometer", "feature_isochronal_incorrect_desman", "feature_unpoisoned_migratory_uri", "feature_chatty_circumambient_patripassian", "feature_goyish_riparian_recipient", "feature_intramuscular_nummulitic_wildcatter", "feature_diatonic_duplex_bunny", "feature_fewest_held_giving", "feature_hyperthermal_deflationary_fasting", "feature_penned_insufficient_cartel", "feature_permed_steady_adminicle", "feature_prepotent_divorced_taffy", "feature_urodele_miffier_chagall", "feature_lower_legalism_stane", "feature_unpreached_pickiest_lint", "feature_ablest_mauritanian_elding", "feature_sliced_cuneal_anouilh", "feature_bifocal_disposable_clacton", "feature_splashier_conservant_ultramarine", "feature_fourieristic_allied_mugwumpery", "feature_headiest_unguessed_religion", "feature_nonnegotiable_errant_soya", "feature_substantiated_denatured_hadn't", "feature_optical_kempt_aisle", "feature_terroristic_tripersonal_pashm", "feature_herniated_exasperate_victorian", "feature_domanial_shellproof_rationing", "feature_prelingual_impracticable_plagiocephaly", "feature_ironclad_coppery_labour", "feature_tineal_premarital_rya", "feature_antimonial_unsold_hairdo", "feature_guttate_russian_greenhead", "feature_trespassing_unmacadamized_villeneuve", "feature_pulmonate_descendant_epiblast", "feature_imperialist_slovenly_licensor", "feature_illuvial_algebraic_modem", "feature_acquisitive_lengthening_matron", "feature_wetter_unbaffled_loma", "feature_unconjugal_chiropodial_amorosity", "feature_third_discreet_solute", "feature_unbarking_apolitical_hibernian", "feature_encysted_conventionalized_dematerialization", "feature_dominant_unreducible_iota", "feature_improvable_waniest_lesson", "feature_supererogatory_unleisured_kitling", "feature_sellable_supervenient_immobilism", "feature_chasmed_tergal_spencerian", "feature_spectacled_idiosyncratic_macula", "feature_unconstitutional_quadruped_carbine", "feature_displayed_denatured_fosterer", "feature_scalding_assumptive_sentimentalist", "feature_sounded_inescapable_chalybeate", "feature_circumspective_daughterly_brubeck", "feature_mimetic_sprawly_flue", "feature_inductile_umbrian_wallah", "feature_ineloquent_bihari_brougham", "feature_shakespearean_alpha_constituent", "feature_marxian_plated_refrigeration", "feature_amative_irresponsive_flattie", "feature_intermissive_coronal_reinsertion", "feature_dwarfish_isochronal_amateur", "feature_polyphyletic_unplumed_pandiculation"], "serenity": ["feature_honoured_observational_balaamite", "feature_polaroid_vadose_quinze", "feature_untidy_withdrawn_bargeman", "feature_genuine_kyphotic_trehala", "feature_unenthralled_sportful_schoolhouse", "feature_divulsive_explanatory_ideologue", "feature_ichthyotic_roofed_yeshiva", "feature_waggly_outlandish_carbonisation", "feature_floriated_amish_sprite", "feature_iconoclastic_parietal_agonist", "feature_demolished_unfrightened_superpower", "feature_styloid_subdermal_cytotoxin", "feature_ironfisted_nonvintage_chlorpromazine", "feature_drier_worshipping_hetairist", "feature_incredible_plane_sacque", "feature_inducible_home_immovability", "feature_feral_telling_marquessate", "feature_agitato_unlineal_perspicacity", "feature_turanian_satiable_millicent", "feature_girlish_uncoated_shammy", "feature_runniest_unstaying_toom", "feature_smashed_gynaecoid_septa", "feature_humiliating_numerate_goldminer", "feature_steadier_untrenched_bernstein", "feature_battled_premillennial_omelette", "feature_hefty_hesitant_mantissa", "feature_waxing_jaggy_bondswoman", "feature_hidden_blue_bibber", "feature_marginal_irredeemable_neat", "feature_baptist_undelayed_mannerism", "feature_eruciform_scorbutic_overkill", "feature_lentissimo_zymolytic_earwig", "feature_unreprimanded_evocable_briard", "feature_unqualifying_pursuant_antihistamine", "feature_crisscrossed_audible_hafiz", "feature_ugrian_schizocarpic_skulk", "feature_associable_additional_bough", "feature_doggone_seeable_mask", "feature_interconnected_correlatable_exogamy", "feature_blind_concordant_tribalist", "feature_strigose_rugose_interjector", "feature_binding_lanky_rushing", "feature_carolean_tearable_smoothie", "feature_nappiest_unportioned_readjustment", "feature_sarmatia_foldable_eutectic", "feature_plum_anemometrical_guessing", "feature_gubernacular_liguloid_frankie", "feature_castigatory_hundredfold_hearthrug", "feature_pennsylvanian_sibylic_chanoyu", "feature_unreaving_intensive_docudrama", "feature_relinquished_incognizable_batholith", "feature_indusiate_canned_cosh", "feature_teased_pinpoint_grant", "feature_periclean_proportionable_amaranth", "feature_lithuanian_fabianism_pedagogy", "feature_unamenable_prevalent_trilobite", "feature_intermingled_reedier_rookery", "feature_jangly_weedier_bhang", "feature_bubbling_pedestrian_convection", "feature_supportive_explanatory_powder", "feature_ruttier_freakier_perversion", "feature_duskier_wispiest_midwesterner", "feature_martial_hallowed_incorruptibility", "feature_exhaling_awkward_inhabitant", "feature_cristate_desirable_chime", "feature_aguish_commissioned_tessitura", "feature_desecrated_antiseptic_pirog", "feature_juvenile_carlish_betel", "feature_synodal_thornier_zila", "feature_delayed_reluctant_castro", "feature_olden_enchained_leek", "feature_ochlocratical_hemiparasitic_brothel", "feature_syndicalistic_osteal_matriarchy", "feature_objectivist_adaptive_charr", "feature_accoutred_fluviatile_vivification", "feature_exploitative_jetty_oujda", "feature_suppler_faraway_hatchback", "feature_petaline_circumscribable_sartre", "feature_unadaptable_floored_styptic", "feature_hurtling_wizened_cockade", "feature_diarrhoeic_relieved_scutter", "feature_profaned_obsequent_urology", "feature_unrecognisable_ultrabasic_corporeity", "feature_reposeful_apatetic_trudeau", "feature_seismograph_molybdic_requisition", "feature_suppressed_unremovable_telephone", "feature_immovable_apiarian_joke", "feature_exhibitionist_bicuspidate_goalpost", "feature_genic_knobbed_malacologist", "feature_warmish_unspiritualizing_desideratum", "feature_driven_preserving_spectroheliogram", "feature_eighteen_kafka_segno", "feature_insistent_presageful_deist", "feature_cavitied_alleviatory_neuk", "feature_crispy_neighboring_jeffersonian"], "sunshine": ["feature_differing_lenticular_gossiping", "feature_ottoman_metaphysical_parathion", "feature_variolate_reducible_sweet", "feature_jumpiest_clattering_pentstemon", "feature_sylphid_maladaptive_franc", "feature_aguish_commissioned_tessitura", "feature_desecrated_antiseptic_pirog", "feature_juvenile_carlish_betel", "feature_synodal_thornier_zila", "feature_delayed_reluctant_castro", "feature_olden_enchained_leek", "feature_ochlocratical_hemiparasitic_brothel", "feature_syndicalistic_osteal_matriarchy", "feature_objectivist_adaptive_charr", "feature_accoutred_fluviatile_vivification", "feature_exploitative_jetty_oujda", "feature_suppler_faraway_hatchback", "feature_petaline_circumscribable_sartre", "feature_unadaptable_floored_styptic", "feature_hurtling_wizened_cockade", "feature_diarrhoeic_relieved_scutter", "feature_profaned_obsequent_urology", "feature_unrecognisable_ultrabasic_corporeity", "feature_reposeful_apatetic_trudeau", "feature_seismograph_molybdic_requisition", "feature_glandered_steamtight_transform", "feature_peachier_unswallowed_gil", "feature_yoruban_purplish_directoire", "feature_unrhymed_synoptistic_combine", "feature_voyeuristic_ineffable_yelling", "feature_unluckier_zonary_invalidism", "feature_unshockable_diffused_granadilla", "feature_diactinic_distant_populariser", "feature_campodeid_myasthenic_merrymaking", "feature_jilted_epagogic_olivier", "feature_typic_anucleate_caecum", "feature_fumed_pivotal_oscine", "feature_preterite_antediluvian_parasailing", "feature_folkish_mononuclear_granitization", "feature_sixfold_tipsier_roup", "feature_conductive_tribunicial_supertitle", "feature_rhinencephalic_goofier_fulah", "feature_ghastlier_treed_davy", "feature_seventy_bearish_kleptomaniac", "feature_hydrometrical_quadricentennial_medial", "feature_blind_alabaman_brabble", "feature_stockiest_untransmitted_greening", "feature_polypoid_taken_upgrader", "feature_hygroscopic_clithral_leakage", "feature_bolivian_astringent_didapper", "feature_intersectional_inseminated_undersigned", "feature_idyllic_spectacled_togue", "feature_antiskid_circumlocutional_ogdon", "feature_overdone_raspiest_halcyon", "feature_coagulatory_bathymetrical_pergamum", "feature_shorthand_elemental_overall", "feature_retractile_sayable_physic", "feature_calefactive_baculiform_frogfish", "feature_unvaccinated_fretted_phaeacian", "feature_sheen_deteriorating_carnassial", "feature_federate_ungoverned_nitwit", "feature_lachrymatory_welcomed_flying", "feature_authorised_new_macrosporangium", "feature_hymnal_suberic_sulphurator", "feature_unflinching_bustled_pehlevi", "feature_foraminal_structured_corruption", "feature_humdrum_unbusinesslike_corrupter", "feature_unverifiable_girly_lashing", "feature_crackly_ripuarian_parure", "feature_tenebrific_antefixal_explicator", "feature_bejewelled_effaceable_urate", "feature_ventriloquistic_relegable_optometer", "feature_plantable_integumentary_roper", "feature_depilatory_tin_trinity", "feature_unespied_papuan_kaduna", "feature_undermasted_portly_divinity", "feature_patronal_hussite_stroking", "feature_trad_glairiest_advocaat", "feature_octaval_thieving_knosp", "feature_unwrapped_flashier_luggie", "feature_unweathered_inspirative_shoestring", "feature_indiscriminate_cuneatic_soundman", "feature_worrisome_galvanic_cockneydom", "feature_mammonistic_pulsed_welter", "feature_nonagon_quietening_bressummer", "feature_paragenetic_traditional_madeline", "feature_collapsable_sinful_cassareep", "feature_preceding_perturbing_radii", "feature_hypogeal_unburied_embraceor", "feature_hobbesian_infrasonic_subjugator", "feature_phobic_emptied_esteem", "feature_meteorological_ritzier_diffractometer", "feature_bulbed_pinioned_serfdom", "feature_unshockable_lamelliform_paederast", "feature_sly_dumpier_gynomonoecism", "feature_tramontane_malevolent_endoscopy", "feature_fronded_interferential_quadrat", "feature_exocrine_early_consistory", "feature_clad_refusable_trochanter", "feature_coppiced_sign_staysail", "feature_saleable_unreprimanded_sacrosanctity", "feature_tingliest_prefatory_trapshooter", "feature_imperishable_mightiest_emulsoid", "feature_rococo_unexceptional_tropicbird", "feature_couthie_inexplicit_reinfection", "feature_unbiased_judicatory_potentiometer", "feature_tenty_filigree_bengaline", "feature_chasmed_unexhausted_cryptogram", "feature_wealthy_asinine_beduin", "feature_conflictive_cosher_iranian", "feature_ane_unprompted_columbary", "feature_delicate_scant_shore", "feature_gawky_biracial_jephthah", "feature_bucolic_sedative_quivering", "feature_cathodic_unstigmatised_rockford", "feature_deliquescent_pelvic_functionary", "feature_maternal_knobbier_dialecticism", "feature_blowzier_sleepiest_verifier", "feature_uncurtailed_sabaean_ode", "feature_crosscut_rompish_osteopathist", "feature_piquant_israeli_sperm", "feature_statistical_beefier_fluoride", "feature_docked_sufistic_oropharynx", "feature_stubbled_anatolian_pout", "feature_whitish_uncontestable_palermo", "feature_expectative_intimidated_bluffer", "feature_creaking_unsophisticated_clavier", "feature_prissy_counsellable_keg", "feature_unreposing_mellifluent_dindle", "feature_cowled_knottiest_megilp", "feature_scurry_assuasive_internode", "feature_domesticable_embowed_ommatidium", "feature_glycogenetic_meagre_ratite", "feature_valved_streamier_gloucestershire", "feature_neoclassicist_buttressed_preface", "feature_yoruban_unapplied_tawse", "feature_electrophysiological_blearier_deconsecration", "feature_nepotic_overreaching_itinerary", "feature_scrawny_wavy_pheon", "feature_incurrent_homeopathic_overcapacity", "feature_personate_sublunar_eugene", "feature_surmountable_proved_compeer", "feature_pucka_bloomy_mycophagist", "feature_shattering_indented_dolby", "feature_unkept_warier_yucca", "feature_annihilative_yoruban_wile", "feature_kittenish_resigned_sequencer", "feature_unworked_charybdian_managing", "feature_centenary_dismounted_general", "feature_aswarm_vengeful_bilge", "feature_immemorial_lousy_wishbone", "feature_calcaneal_phenological_probing", "feature_swashbuckling_unnative_rouser", "feature_lousiest_neanderthal_hypha", "feature_segregable_blasting_inscription", "feature_viridescent_choking_pinto", "feature_julienne_interludial_noradrenaline", "feature_unexplained_orthorhombic_kenny", "feature_aspheric_cloudy_restorationism", "feature_epistatic_absent_slayer", "feature_geosynclinal_concluding_nookie", "feature_urnfield_linty_strawman", "feature_attractable_lawgiver_mbujimayi", "feature_sematic_underpeopled_dueller", "feature_closing_branchy_kirman", "feature_stuffed_unabashed_biretta", "feature_invocatory_unplumbed_assessorship", "feature_speaking_burdensome_you'd", "feature_azimuthal_disconcerted_bock", "feature_topping_over_anecdotage", "feature_papillose_unprevailing_conductivity", "feature_polluted_extraverted_limey", "feature_anagrammatical_lignitic_morel", "feature_prefatorial_empirical_undertenant", "feature_hussite_frecklier_bransle", "feature_won_stalwart_eisenstein", "feature_indulgent_amphibrachic_surrebutter", "feature_hypnagogic_wedded_religionist", "feature_dormant_samariform_elucidator", "feature_geostationary_manky_teutonisation", "feature_unabbreviated_unteamed_krasnoyarsk", "feature_deontological_sidearm_alder", "feature_saprogenic_quadrilateral_chook", "feature_hagiographical_fertile_disestablishment", "feature_moonlit_hundred_conferrer", "feature_vertebrate_anisotropic_chewer", "feature_chadic_allotropic_delirium", "feature_quartile_athletic_schwarzkopf", "feature_pileate_accusatival_immunogen", "feature_star_roomier_mapping", "feature_deistical_intractable_veadar", "feature_ontological_secondary_analcite", "feature_vaccinated_compellable_schizont", "feature_guarded_rotational_flotow", "feature_monocyclic_unrejoiced_haematoxylon", "feature_retributive_unconformable_hairpin", "feature_annoyed_obsessive_watch", "feature_sallow_jaculatory_galactopoietic", "feature_hyphenic_pudendal_defeasibility", "feature_fibrillar_crural_persimmon", "feature_caudated_consuetudinary_bratislava", "feature_incommensurate_stung_impassibility", "feature_rumbly_unlabelled_insurant", "feature_festive_pewter_peeper", "feature_corned_moderating_inaudibility", "feature_gasteropod_weird_virucide", "feature_venerating_reduplicate_licensee", "feature_unespied_vorticose_valour", "feature_opposing_intracardiac_delimitation", "feature_manlier_dopiest_chiefdom", "feature_clumsiest_doctoral_monk", "feature_unsectarian_unuseful_opiate", "feature_interconnected_greige_mohammedan", "feature_petrogenetic_tapetal_pavior", "feature_surpliced_unachievable_nubecula", "feature_unsubscribed_pyknic_thalweg", "feature_primogenital_paralytic_minx", "feature_alfresco_unresolvable_kashmir", "feature_shoreward_haustellate_acorn", "feature_photic_untunable_father", "feature_immensurable_myrmecological_angler", "feature_telencephalic_assumed_loran", "feature_other_peatier_raymond", "feature_unkingly_protochordate_confluent", "feature_falcate_concurrent_kwa", "feature_leptosporangiate_perceptive_urari", "feature_sophistical_canty_mastersinger", "feature_impetratory_interrogative_sangaree", "feature_selachian_gestic_dapple", "feature_much_bandoliered_refundment", "feature_organic_hellenic_venesection", "feature_swimmable_lumpish_baiting", "feature_gonococcic_ghostliest_excuser", "feature_hundredth_hymnal_negative", "feature_unnoted_frowzier_protest", "feature_delimited_bolted_canner", "feature_offhand_reinforced_bump", "feature_vendible_unprocurable_lignum", "feature_unabbreviated_craftier_conodont", "feature_delineable_microsomal_foeman", "feature_snuggest_counterclockwise_desolater", "feature_perspectivist_nondestructive_haemocoel", "feature_demonstrated_wordiest_globulin", "feature_wrinkliest_unmaintainable_usk", "feature_unhurt_centroidal_whimsey", "feature_select_comprehensible_spanish", "feature_spun_isoclinal_agate", "feature_violated_yonder_skipper", "feature_propagative_unloving_carioca", "feature_metal_bunchier_uranism", "feature_next_fusile_mentum", "feature_lamented_dead_incalculability", "feature_trusted_painful_hetty", "feature_driest_marmoreal_industrialisation", "feature_hirsute_corkier_beldame", "feature_accretive_sorrier_skedaddle", "feature_unmanned_connecting_sadducee", "feature_tiresome_scary_didn't", "feature_uncongenial_developmental_underdevelopment", "feature_unpopular_promissory_liturgiologist", "feature_concentric_gubernatorial_grandeur", "feature_roasted_fortified_transfiguration", "feature_unclean_pediculate_cymbal", "feature_antimonic_conglomerate_demolishing", "feature_juvenile_tergal_pseudomorph", "feature_fine_drouthiest_nekton", "feature_tumbling_false_anagoge", "feature_flabbergasted_evidenced_aire", "feature_instinct_reproved_capitate", "feature_imputable_aymaran_thruway", "feature_overfed_segmented_exedra", "feature_awol_choriambic_hankie", "feature_astatic_foliate_whitsun", "feature_clandestine_persistent_offertory", "feature_sivaistic_acinose_adult", "feature_ritual_torporific_ennui", "feature_unfaltering_peltate_diamorphine", "feature_agravic_incognoscible_gaddafi", "feature_arachnidan_hotter_fudge", "feature_elucidative_transversal_lawmaker", "feature_submersed_detectible_prospector", "feature_nutrimental_floatable_synthetizer", "feature_upstair_polycyclic_footsie", "feature_conceptional_flyaway_suburbanization", "feature_unhampered_attenuate_mot", "feature_supratemporal_pharmaceutical_ambassadorship", "feature_unordered_insertional_looter", "feature_geothermal_optional_octagon", "feature_overnight_fluent_trepan", "feature_necrotic_potamic_passionary", "feature_refutable_predatory_gesture", "feature_fold_straightforward_peacetime", "feature_biotic_harmonical_riser", "feature_highland_regent_dissector", "feature_shrunken_attractive_seigneur", "feature_whiggish_suffering_tonsillectomy", "feature_percurrent_balustraded_armlet", "feature_buccaneerish_cerulean_cetology", "feature_trotskyism_monozygotic_linlithgow", "feature_unreasoning_feudal_retarder", "feature_psychrometrical_inexpensive_opah", "feature_intranational_synovial_bish", "feature_attemptable_demotic_nestorianism", "feature_applicative_cometic_gimp", "feature_weighty_floriated_servomechanism", "feature_befitting_isogeothermic_diffidence", "feature_unmethodical_hipper_bergamo", "feature_kingly_understandable_matabeleland", "feature_feebler_asthmatic_rinse", "feature_stickier_theoretical_innovation", "feature_talkable_juicy_mitochondrion", "feature_emigrational_spryer_vaporosity", "feature_fluted_blightingly_sharpshooter", "feature_vorant_unsullied_sponsorship", "feature_predestinate_draconic_debug", "feature_aged_phylacterical_pusey", "feature_revisional_ablutionary_depression", "feature_yokelish_metapsychological_lunt", "feature_circumlunar_chaliced_seam", "feature_squallier_prototypal_dammar", "feature_cognate_elating_ravine", "feature_ethiopian_carminative_retentivity", "feature_alabamian_outlying_monitoring", "feature_byzantine_festinate_mannose", "feature_sleetier_sea_potamogeton"], "rain": ["feature_bumpier_maidenlike_chordata", "feature_moveable_hairiest_extinguishant", "feature_sallowy_confounding_trumping", "feature_demulcent_reachable_pteridologist", "feature_seventeenth_underfired_grimoire", "feature_extravehicular_hertzian_moo", "feature_frolicsome_candid_interambulacrum", "feature_antennal_intersidereal_sunn", "feature_credent_snuffly_apraxia", "feature_unpolarised_genal_premillenarian", "feature_veddoid_irritable_heidelberg", "feature_surefooted_quakier_constructivism", "feature_fidgety_shuddering_emperorship", "feature_unsandalled_uncertificated_rummy", "feature_anthracoid_unforeseen_arizonan", "feature_ulterior_flabbier_antimasque", "feature_thinkable_pledged_marten", "feature_groutier_inapposite_spindling", "feature_biodynamic_shintoist_tractarian", "feature_measured_fated_dogmatiser", "feature_battled_elephantine_paiute", "feature_spheric_assertive_auslese", "feature_submersed_unreturned_intermodulation", "feature_scorching_thai_subsystem", "feature_intramural_multivariate_bluebell", "feature_volatilized_labouring_raffinate", "feature_bouffant_unremoved_seascape", "feature_amplest_scyphiform_doing", "feature_bullied_hypostatic_bergen", "feature_copepod_ceratoid_jactation", "feature_preachy_unsatisfying_chaeta", "feature_unassailable_translational_rata", "feature_lurching_adjective_weekend", "feature_ovoid_bending_dispensator", "feature_hourlong_profane_hookey", "feature_diastatic_sorer_locative", "feature_auburn_reconstructional_nejd", "feature_resuscitable_romanticist_phellem", "feature_syndromic_rubblier_taxiway", "feature_cirrhotic_miffiest_cleansing", "feature_yorkist_authenticated_lotted", "feature_conjugative_surpliced_communicant", "feature_poikilothermic_ebony_wardenship", "feature_algonquin_performing_teetotalism", "feature_shuttered_knavish_salmonella", "feature_bawdiest_striking_gormand", "feature_eristic_documental_monochromatism", "feature_sensitive_incendiary_heraclid", "feature_conduplicate_levorotatory_sympathomimetic", "feature_digressional_multisulcate_paisley", "feature_scenographical_omnidirectional_selenium", "feature_dissipated_dressiest_bombast", "feature_bantam_matterful_hut", "feature_transhuman_diocesan_aston", "feature_declinatory_unfilmed_lutheranism", "feature_unwatered_dentate_unbelief", "feature_deflationary_hexaplaric_heterology", "feature_frightful_cercal_niccolite", "feature_radioactive_gigantean_oppilation", "feature_protochordate_aglimmer_dormouse", "feature_necessary_dreamy_bedside", "feature_indifferent_fungicidal_prescription", "feature_appassionato_censual_laverock", "feature_condyloid_hydriodic_synonymity", "feature_substitute_tamable_solum", "feature_robust_legatine_desk", "feature_intoed_pedigree_canful", "feature_divalent_centurial_hoya", "feature_guttering_supernatant_vernier", "feature_quadripartite_folded_mariachi", "feature_communicative_asphyxiated_catastrophist", "feature_zoophoric_underglaze_algin", "feature_cachinnatory_spumescent_acclimatization", "feature_minuscule_confusing_flaunter", "feature_metapsychological_inexcusable_manhunt", "feature_established_swift_tenia", "feature_skewbald_woodworking_haoma", "feature_edenic_hunched_megabuck", "feature_impennate_antistrophic_grocer", "feature_frore_mean_conscript", "feature_correspondent_orderly_personalisation", "feature_voluntary_dipteran_munich", "feature_thymic_formidable_misericord", "feature_blastoderm_jaspery_freeloader", "feature_unpalatable_mortifying_taurine", "feature_unanchored_scheming_demonstrator", "feature_brief_aforesaid_engulfment", "feature_insultable_perforate_raffle", "feature_rembrandtish_preclassical_deity", "feature_stoutish_zibeline_rentier", "feature_supersensual_unknown_alecto", "feature_unhesitating_governessy_kirchner", "feature_electroplate_unblenched_communion", "feature_zincky_unseemly_butt", "feature_hypnoid_unsurfaced_nonillion", "feature_cushitic_sequestered_tardigrade", "feature_misshapen_stochastic_tortilla", "feature_coraciiform_foreseeable_tutiorism", "feature_booming_venose_feudatory", "feature_phonematic_overdue_tabor", "feature_fanfold_tartarian_diamondback", "feature_floodlighted_apprentice_comstockery", "feature_instructional_confutative_shaktism", "feature_barish_slouchier_bullroarer", "feature_participating_unrecollected_braiding", "feature_conjugational_unamused_thrace", "feature_throbbing_pinchbeck_sememe", "feature_terrorful_unbaptised_tachogram", "feature_intercommunal_epitomical_geomagnetism", "feature_gala_beneficent_sedilia", "feature_colloid_frizzliest_poddy", "feature_unsurveyed_hymenal_cheapskate", "feature_amitotic_gonadial_submediant", "feature_embolismic_diastyle_raspberry", "feature_unvisored_bedraggled_bushel", "feature_iridescent_abiogenetic_sena", "feature_swanky_cupular_chaplainry", "feature_thumbed_diet_encephalograph", "feature_untarred_chiropodial_contagium", "feature_unimposing_theistic_hancock", "feature_bothered_dinky_eyesight", "feature_oblanceolate_macrobiotic_tightening", "feature_unconcealed_untaxed_oratory", "feature_uncluttered_hercynian_continuum", "feature_unreproving_capsian_decolourization", "feature_lemuroid_unwishful_mannequin", "feature_detectable_fogbound_dicastery", "feature_assuasive_wholesale_semele", "feature_unmellowed_unweakened_bibliopoly", "feature_warring_precise_doge", "feature_obbligato_crackbrained_wolverhampton", "feature_gushier_animistic_bohemian", "feature_uncorrupted_adducting_savin", "feature_left_retroflexed_underclassman", "feature_shelvy_egalitarian_cardialgia", "feature_sailing_viricidal_cowherd", "feature_creepiest_bicorn_gratification", "feature_damask_tabu_cobweb", "feature_radiate_quantifiable_chastity", "feature_detectable_balinese_mine", "feature_unsuiting_enuretic_milometer", "feature_geophytic_penitential_deutzia", "feature_offsetting_soled_desalinization", "feature_widowed_hellish_jaguarondi", "feature_libidinal_guardable_siderite", "feature_demonic_eocene_polygamy", "feature_unsubmerged_scathing_vapidity", "feature_ministrative_unvocalised_truffle", "feature_cirrose_rhaetic_londoner", "feature_protean_rubbery_bigener", "feature_denumerable_unsuccessive_unrealism", "feature_spatiotemporal_carthaginian_capture", "feature_veddoid_sport_psychobiology", "feature_oversimplified_expansionary_jitterbug", "feature_heterotrophic_anechoic_annexationist", "feature_mammoth_judiciary_honeypot", "feature_diversified_adventive_peridinium", "feature_perceptual_pausal_sheikdom", "feature_dizziest_insolvent_ctene", "feature_bathymetric_valiant_bahuvrihi", "feature_pronominal_billowing_semeiology", "feature_promulgated_tangled_nobleman", "feature_financed_sulphuretted_libertinage", "feature_cavicorn_transversal_peasant", "feature_pinnated_grasping_overcall", "feature_albinotic_ugly_remit", "feature_ungratified_filigree_dram", "feature_phrenitic_foldable_trussing", "feature_unashamed_sublimed_moulding", "feature_skim_expugnable_subception", "feature_undescended_crawly_armet", "feature_batholitic_intensional_interviewer", "feature_formidable_unrotted_craniotomy", "feature_enarched_assyrian_giuseppe", "feature_schlock_quaky_york", "feature_unshod_satiated_manioc", "feature_mammonistic_smeared_stigma", "feature_commendable_nicotined_banging", "feature_aloetic_aperiodic_dislocation", "feature_bloodshot_inexperienced_adductor", "feature_pronounceable_nonuple_cruller", "feature_ebracteate_autogenic_trimeter", "feature_crank_center_interweave", "feature_unpassable_wedgy_blossom", "feature_eclamptic_unblissful_dip", "feature_unfertilized_scaldic_partition", "feature_volumetrical_splenic_shoelace", "feature_matchmaking_polyatomic_foreboder", "feature_sacculate_inebriated_tamarack", "feature_thinking_grandfatherly_psychiatry", "feature_plangent_devoured_jarl", "feature_vital_pale_disassociation", "feature_eruciform_novice_thanker", "feature_liberticidal_subaqua_embassador", "feature_suspensory_unrecounted_transcendent", "feature_bamboo_nosier_phil", "feature_asinine_unsatiable_avion", "feature_societal_observational_pekingese", "feature_irresponsive_motherlike_enabler", "feature_pineal_translational_cleptomania", "feature_even_protecting_illuminance", "feature_laryngological_honour_artifice", "feature_smacking_unconsummated_wiggery", "feature_secular_hackneyed_latria", "feature_british_inspectional_presentment", "feature_indicial_caryatidal_kendal", "feature_miasmal_mozartian_gervase", "feature_decagonal_mozarabic_inclemency", "feature_undoubtful_soppiest_trigram", "feature_alert_eddic_semicylinder", "feature_peeved_abbatial_ante", "feature_katabolic_peridotic_ergotism", "feature_torporific_elastomeric_majesty", "feature_moneyed_usufruct_bismuth", "feature_prejudicial_catachrestical_discontinuance", "feature_size_interactive_liquefaction", "feature_paphian_octennially_limey", "feature_interlaced_tricyclic_microlite", "feature_symmetric_transmissive_calyptra", "feature_leukemic_hellenistic_economist", "feature_emphasized_confirming_clandestinity", "feature_russety_multidirectional_macaque", "feature_flagging_gadarene_barrymore", "feature_laggardly_prideful_turban", "feature_southern_investigative_carpology", "feature_shimmering_unsystematical_suzerainty", "feature_bristled_slender_transmutation", "feature_combinable_platiest_karin", "feature_ravaging_coalitional_boyer", "feature_amphitheatric_mineralized_overture", "feature_hellenic_rigid_moharram", "feature_staggering_spondaic_strindberg", "feature_unorthodox_tuneful_antilogy", "feature_grouchier_undoubting_sultana", "feature_unconjugal_deferrable_sheeting", "feature_fine_poky_friary", "feature_unpersuasive_phraseologic_turkmenistan", "feature_inappreciable_unmeriting_litre", "feature_token_east_victor", "feature_chilean_hobbesian_browsing", "feature_greasy_bloodier_subscription", "feature_unfadable_vaunting_soya", "feature_changed_proletarian_theodolite", "feature_cacophonic_sextan_liquescence", "feature_pinto_pesky_compaction", "feature_unimagined_radiographic_spinsterhood", "feature_seven_convertible_lixivium", "feature_unrecommended_acanthocephalan_gallicism", "feature_shotgun_attractive_bombshell", "feature_tumbling_gone_yawper", "feature_kirtled_cockiest_etaerio", "feature_fishable_ascendible_micky", "feature_electronegative_lactogenic_merc", "feature_surrogate_unmalleable_tasset", "feature_grave_prevenient_rheotrope", "feature_obovoid_hipped_vaporing", "feature_supersaturated_scalding_bribery", "feature_desired_eery_cypher", "feature_scalier_gracile_owenist", "feature_rawboned_bloodshot_cousinhood", "feature_lovable_record_phlegm", "feature_diphycercal_wrinklier_jewelfish", "feature_septilateral_parallactic_ngaio", "feature_phrenetic_visitorial_entrenchment", "feature_gloomful_uniaxial_tyrian", "feature_ponderable_faultiest_pfennig", "feature_next_moldered_paganism", "feature_unprohibited_chilliest_incurable", "feature_baric_troglodytic_deducibility", "feature_plentiful_remorseful_capacitor", "feature_virtuoso_gasping_studwork", "feature_rectilineal_stative_carousal", "feature_chastised_antitypical_palooka", "feature_atrial_retroactive_dolin", "feature_quadraphonic_pinnate_kouprey", "feature_gamest_zibeline_oakley", "feature_particulate_pericentral_refuse", "feature_existential_oecumenic_draco", "feature_rearing_midget_friedcake", "feature_surd_commutative_palliasse", "feature_aneurismal_set_hydranth", "feature_shock_exoskeletal_synagogue", "feature_bellied_umbilical_conglobation", "feature_isochimal_saving_combe", "feature_presbyopic_indiscreet_clancy", "feature_undismayed_rallentando_snooker", "feature_boyish_oily_sciurine", "feature_breeziest_religionism_synthetiser", "feature_imbecile_daimonic_endgame", "feature_expedited_yucky_anesthetic", "feature_sea_copyright_parsee", "feature_unnoticeable_clathrate_dairywoman", "feature_spectacular_unlisted_squalene", "feature_cloaked_taillike_usurpation", "feature_incorrigible_contaminate_monorhyme", "feature_alleviatory_sociopathic_photopia", "feature_alleged_weepier_tetanization", "feature_demoniacal_phylacterical_brach", "feature_mesmerized_springing_euchologion", "feature_daimonic_triennial_sweeping", "feature_overeager_pugilistic_diocletian", "feature_periosteal_fibrillose_eponym", "feature_subjective_crescentic_stereograph", "feature_inspective_unsolvable_subtangent", "feature_isodiametric_afraid_verderer", "feature_curvier_echinoid_leyden", "feature_loved_halcyon_rotifer", "feature_sear_bicorn_reorder", "feature_neonatal_undubbed_consigner", "feature_aneroid_cufic_prolonge", "feature_priced_choky_ishmaelite", "feature_returning_isoglossal_transmontane", "feature_mede_fogbound_triphenylmethane", "feature_joltier_mishnic_semiotician", "feature_lunisolar_depopulated_slaying", "feature_approximative_nuclear_readaptation", "feature_determinative_unsound_samizdat", "feature_kin_stellate_dogvane", "feature_agential_present_sclerotomy", "feature_plagal_distortive_pharyngeal", "feature_unperceptive_hypostatic_hibernicism", "feature_furrowed_enameled_mission", "feature_foaled_crutched_habitability", "feature_hempen_insubordinate_sarum", "feature_vixenish_nodose_phocomelia", "feature_discontent_sulfa_applicability", "feature_stylistic_pythagorean_pulley", "feature_poetic_chapped_refocusing", "feature_thermic_spectrographic_bend", "feature_vertebral_arboreal_beryllium", "feature_zincoid_peccant_greywacke", "feature_audible_scurrile_saltpeter", "feature_escharotic_humanistic_placebo", "feature_incorruptible_transpacific_ratine", "feature_careful_valid_picosecond", "feature_unimpeached_anguilliform_cymry", "feature_bibliomania_bodger_ensigncy", "feature_swelled_jugate_haystack", "feature_sonic_blond_redbreast", "feature_uncompanioned_interrelated_brimstone", "feature_unwilled_exhortative_gisarme", "feature_newfangled_irksome_sleigher", "feature_homely_unsmoothed_dubrovnik", "feature_sapphire_lyrate_christianism", "feature_interstadial_georgic_hellene", "feature_gentle_comminatory_pasteboard", "feature_featured_discontinued_personal", "feature_fewer_unbetrayed_drill", "feature_unhallowed_convulsionary_frenchification", "feature_choicest_ophthalmological_middlebrow", "feature_cornered_statutory_anglican", "feature_skint_maternal_carina", "feature_frothiest_sedged_summary", "feature_extended_cosier_smile", "feature_friesian_presentimental_cymbal", "feature_ecclesiological_invaluable_comatulid", "feature_involutional_antiseptic_isomerization", "feature_antipruritic_pourable_mete", "feature_interrogable_inane_erk", "feature_consuetudinary_relivable_monad", "feature_perdu_obligational_waratah", "feature_hebephrenic_furrowed_allottee", "feature_ratite_degree_expansibility", "feature_touristic_contingent_zincography", "feature_valleculate_pluralism_perfumery", "feature_saddening_czarist_quasar", "feature_observant_administrant_note", "feature_furry_flagellatory_febricity", "feature_jangling_showery_sitter", "feature_abducted_euphonic_pipewort", "feature_cercarian_aligning_soda", "feature_metempirical_sprawled_discontinuance", "feature_spoken_fractional_undset", "feature_jaggy_barer_responsum", "feature_cenozoic_bessarabian_kelt", "feature_stripiest_edged_sear", "feature_immunosuppressive_purgative_reformer", "feature_overcareful_infracostal_gallipoli", "feature_excommunicate_disturbed_mutule", "feature_penological_starting_nystatin", "feature_ligular_contemplative_laud", "feature_protochordate_connectible_futilitarian", "feature_contrite_evaporative_preformation", "feature_subtractive_emulsified_approving", "feature_confabulatory_malarian_phenotype", "feature_cliquish_unattached_gulbenkian", "feature_putrefiable_incommutable_citizen", "feature_middle_hunkered_alexandrite", "feature_obtainable_baddish_tuchun", "feature_sprightlier_albitic_justinian", "feature_decked_devilish_balladry", "feature_devolution_canty_suburb", "feature_mint_bilabial_redevelopment", "feature_erethistic_checkered_censurer", "feature_verdant_contrapuntal_urbanization", "feature_unoverthrown_unlined_exterminator", "feature_ultraviolet_sabbatical_galvanizer", "feature_mawkish_podgiest_venation", "feature_thixotropic_janiform_ilan", "feature_intercalary_shameful_carrefour", "feature_smorzando_conceited_dysphagia", "feature_lienteric_tricksy_aston", "feature_persian_expedite_cocky", "feature_pillowy_impelled_razzle", "feature_fourieristic_ecuadorian_pilotage", "feature_frumpiest_contusive_veteran", "feature_jonsonian_analyzable_carbamate", "feature_monastical_zoographical_sere", "feature_mercenary_pinchpenny_scrophularia", "feature_unspecialized_preclusive_lote", "feature_lacier_necrophilic_personage", "feature_neuromuscular_brutelike_ophite", "feature_advance_invalidated_marge", "feature_armed_keratose_slush", "feature_tiddly_divorcive_shoddy", "feature_equipotential_droopiest_molinism", "feature_observing_vigesimal_completion", "feature_cholagogue_reserved_silly", "feature_sensualistic_barbellate_moonstone", "feature_incredible_sipunculid_midriff", "feature_porkiest_waspy_recycling", "feature_oligochaete_grumpiest_cryptograph", "feature_metalloid_renascent_ferronickel", "feature_jehovist_kinglier_foxhole", "feature_cheerful_penicillate_plaza", "feature_saussuritic_unpurchased_provender", "feature_defoliated_called_lucubrator", "feature_lathiest_oblong_newton", "feature_lento_unborne_ethnomusicology", "feature_direct_expropriated_harping", "feature_unaneled_protractile_reviviscence", "feature_gainful_flighty_swampland", "feature_wearable_phoenician_congratulation", "feature_sickish_interlocutory_profligate", "feature_anarchic_ungual_planisphere", "feature_referential_eath_reconciliation", "feature_paradisal_predestinarian_bungler", "feature_xeric_chunkiest_homager", "feature_terminist_precocial_septarium", "feature_imaginative_monarchical_shive", "feature_trimonthly_appressed_siouan", "feature_recuperative_superscript_eunuchoidism", "feature_earthier_adjacent_hydropathy", "feature_immunosuppressive_pulmonate_asynergy", "feature_fortified_gasometrical_soccer", "feature_kookier_northward_disproof", "feature_harnessed_gratulant_nag", "feature_unsaluted_aloof_receiver", "feature_androgenic_monaxial_boarhound", "feature_asclepiadean_tenfold_bartender", "feature_adipose_diverging_analphabetic", "feature_podgy_wannest_protanomaly", "feature_lepidote_malevolent_maori", "feature_ungenteel_phanerozoic_grasmere", "feature_cured_holy_sporogonium", "feature_decillionth_stupefactive_bolshevism", "feature_quadrilingual_repayable_reconcilement", "feature_fake_participating_billionaire", "feature_bleak_clubbable_sodomy", "feature_wolfish_laic_canzone", "feature_loudish_molten_micher", "feature_procedural_approximal_centimeter", "feature_chorographic_laureate_dorsiflexion", "feature_unstitched_unsublimated_indelicacy", "feature_requitable_genuine_rule", "feature_chauvinistic_irksome_colloquy", "feature_unreclaimable_aggregative_meningioma", "feature_dimissory_gynandromorphic_manx", "feature_lackluster_thermic_bovid", "feature_exotic_socinian_stridence", "feature_conductible_indecomposable_athlete", "feature_synonymic_puckery_airhead", "feature_kentish_somnambulism_physiology", "feature_favorable_unincumbered_immortelle", "feature_museful_swinging_contactor", "feature_thriftiest_arriving_carucate", "feature_overloaded_tourist_lizzy", "feature_polyphonic_inconvenient_cointreau", "feature_unvaluable_falsest_vigil", "feature_jurisdictional_fermentative_contadino", "feature_appraising_unpayable_spiculum", "feature_falernian_unashamed_corroboration", "feature_nonconforming_tidal_hug", "feature_covered_mercurial_mariologist", "feature_wheeled_receptive_abstinent", "feature_unlockable_fornicate_lima", "feature_ratite_reverberatory_hooter", "feature_subtractive_randomized_exterritoriality", "feature_mozambican_genty_glimpse", "feature_progressional_sloshy_penology", "feature_lustred_jumbo_saphena", "feature_associable_hypersthenic_celibacy", "feature_astatic_sensitive_munshi", "feature_polar_splattered_analyser", "feature_chosen_grouty_broccoli", "feature_schlock_hypochondriacal_mezereon", "feature_operative_shellier_accompanist", "feature_sunburst_coeval_ceilidh", "feature_inopportune_episcopalian_seismism", "feature_unsoft_indwelling_kinema", "feature_haemolytic_finical_commentary", "feature_prolusory_vitrescible_solitudinarian", "feature_academic_turned_promenade", "feature_lethargic_grammatical_decathlon", "feature_bunchier_worsening_bracer", "feature_maestoso_peloponnesian_venue", "feature_sweeping_unconforming_cedar", "feature_brambly_jauntiest_pernancy", "feature_tardier_hillier_cradling", "feature_trollopy_bannered_vicomtesse", "feature_livable_gnotobiotic_inkblot", "feature_abrogative_hurt_lenition", "feature_exsert_whippy_calypso", "feature_undersexed_hedonic_spew", "feature_naked_cranial_cableway", "feature_monographical_paralytic_maroon", "feature_heartfelt_laddish_cuyp", "feature_uncleanly_circumgyratory_santonin", "feature_nearest_dawdling_nightingale", "feature_particularistic_unimpeached_figurant", "feature_formalized_smuttier_cottage", "feature_invected_dratted_garrick", "feature_abactinal_inventable_luminescence", "feature_taped_apeak_melodramatic", "feature_funky_amused_poppa", "feature_paramount_unheralded_ban", "feature_deposed_toughish_bribery", "feature_pilot_unshifting_cryptogamist", "feature_airy_divaricate_allomorph", "feature_forky_variolitic_impingement", "feature_gawkiest_shipboard_favouritism", "feature_alterable_tinted_kerosine", "feature_venetian_heating_tissot", "feature_maledictive_admired_dissimilation", "feature_caruncular_leafed_somnolency", "feature_overrank_unpanelled_puseyism", "feature_grizzliest_draughtier_shirting", "feature_figuline_sphincterial_palynology", "feature_analog_dozen_swami", "feature_utmost_assessorial_ayr", "feature_unskilled_sporangial_spock", "feature_tagalog_diverticular_soke", "feature_contractive_placental_foxhound", "feature_unpruned_allotriomorphic_finback", "feature_instant_compassionate_frump", "feature_unsocketed_autarkical_griselda", "feature_peptizing_machinable_computation", "feature_undistributed_problematic_agape", "feature_southernmost_necromantic_rental", "feature_paravail_urbanistic_adenosine", "feature_distractible_unreposing_arrowhead", "feature_hippiatric_tinctorial_slowpoke", "feature_dresden_uphill_thaumaturge", "feature_swift_tagalog_lacker", "feature_primary_patricidal_whitethorn", "feature_unhorsed_morphogenetic_affusion", "feature_tricentennial_subarcuate_ascendance", "feature_sycophantic_unrefined_calvinist", "feature_untressed_bicuspid_photograph", "feature_emergency_peckish_coequal", "feature_calorific_seigneurial_dietitian", "feature_isoelectric_comestible_chieftainship", "feature_supernatural_germicidal_detector", "feature_cobwebby_albescent_ophthalmoscope", "feature_peppier_jejune_dasyure", "feature_gamy_wattle_mescaline", "feature_potamic_indented_badalona", "feature_ultraviolet_willful_umbra", "feature_enceinte_directional_leishmania", "feature_eighty_lyric_hydrogen", "feature_vizierial_prevenient_component", "feature_chunky_fallen_erasure", "feature_princely_rabic_houri", "feature_premillennial_furuncular_founding", "feature_impressionable_untunable_macrocephaly", "feature_unscriptural_coconut_trisulphide", "feature_pyromantic_retaliative_internal", "feature_toed_accusatory_zoologist", "feature_sparing_outermost_sand", "feature_baleful_comfy_rubdown", "feature_majorcan_won_nicole", "feature_community_premandibular_fervor", "feature_carinate_mutational_incisor", "feature_winking_phlegmier_intro", "feature_subatomic_raffish_hexagram", "feature_road_coplanar_popsy", "feature_sensitive_inhaling_salting", "feature_climbable_terminative_lackluster", "feature_dulled_ablush_molybdenite", "feature_disaffected_formulism_tabbouleh", "feature_circumscribed_ratty_elma", "feature_jejune_statist_alerting", "feature_clastic_lacertilian_bothy", "feature_trustworthy_shouting_comorin", "feature_square_intrinsic_holi", "feature_archaean_port_respect", "feature_faded_breasted_additament", "feature_noncontroversial_predicted_snaggletooth", "feature_ferroelectric_rose_bootmaker", "feature_uninformative_kacha_wiggler", "feature_prevenient_lordlier_koftgar", "feature_sculpturesque_friended_meteorograph", "feature_aerobiotic_pickwickian_clergyman", "feature_doty_balletic_iona", "feature_unprotested_euphoric_engram", "feature_leachiest_plastery_arrayal", "feature_subtriangular_haughtiest_blunderer", "feature_histie_undeified_applicability", "feature_roadworthy_unbidden_asteroid", "feature_proxy_transcriptive_scaler", "feature_unvaccinated_cancroid_mentality", "feature_standardized_unbetrayed_noon", "feature_mentholated_acerose_academia", "feature_unintegrated_fore_hosteller", "feature_armorial_exclusory_forb", "feature_frisky_transuranic_spire", "feature_epithetic_diametrical_siphonage", "feature_cancelled_mickle_tubule", "feature_tripinnate_appropriate_size", "feature_cytoid_colonialism_brian", "feature_undeliverable_chorioid_ondine", "feature_geomedical_dendroidal_mismanagement", "feature_distal_indented_modernity", "feature_coky_humble_antecessor", "feature_unmade_mythological_orgeat", "feature_coarctate_hypnoid_hirudinean", "feature_ophthalmoscopic_biometric_univalence", "feature_platy_idiotic_vladimir", "feature_frowzy_transvestic_tympanum", "feature_orthopedical_siliculose_forger", "feature_predatory_cirriped_sapropel", "feature_contrate_interfacial_digestion", "feature_helminthoid_catalytical_tattle", "feature_rabbinical_undivorced_charr", "feature_germinant_sung_ketene", "feature_approximal_projectional_wrangler", "feature_sigmate_allergenic_eleven", "feature_toxophilitic_recidivism_bursar", "feature_aesthetic_stereographic_punjab", "feature_thermoluminescent_caboched_dishonor", "feature_haunched_stretchy_chicle", "feature_unpitied_jingoist_pyretology", "feature_austral_intrepid_sonia", "feature_overfull_negro_prurigo", "feature_chiselled_vasodilator_chiefdom", "feature_peritonitic_decadent_board", "feature_fell_unaligned_anesthetization", "feature_laziest_saronic_hornbeam", "feature_unconfinable_snuffly_cupid", "feature_elmier_unidentifiable_broccoli", "feature_liberated_lopsided_sixteenmo", "feature_uncleared_violable_arborvitae", "feature_unviable_anxiolytic_pyrene", "feature_campestral_tigerish_durrie", "feature_undefied_senary_siding", "feature_unfossilized_bankrupt_cannock", "feature_disclosed_mnemonic_ineffaceability", "feature_suspended_intracranial_fischer", "feature_shimmering_coverable_congolese", "feature_biserial_fulfilled_harpoon", "feature_pitiable_authoritative_clangor", "feature_abdominal_subtriplicate_fin", "feature_centenarian_ileac_caschrom", "feature_expected_beatified_coparcenary", "feature_unread_isopodan_ethic", "feature_china_fistular_phenylketonuria"]}
 
-# %% ../nbs/03_preprocessing.ipynb 40
+# %% ../nbs/03_preprocessing.ipynb 50
 class GroupStatsPreProcessor(BaseProcessor):
     """
     WARNING: Only supported for v4.2 (Rain) data. The Rain dataset (re)introduced feature groups. \n
@@ -322,16 +662,15 @@ class GroupStatsPreProcessor(BaseProcessor):
 
     def _add_group_features(self, dataf: pd.DataFrame) -> pd.DataFrame:
         """Mean, standard deviation and skew for each group."""
-        dataf = dataf.copy()
+        group_features = {}
         for group in self.group_names:
             cols = self.feature_group_mapping[group]
-            dataf.loc[:, f"feature_{group}_mean"] = dataf[cols].mean(axis=1)
-            dataf.loc[:, f"feature_{group}_std"] = dataf[cols].std(axis=1)
-            dataf.loc[:, f"feature_{group}_skew"] = dataf[cols].skew(axis=1)
-            
-        return dataf
+            group_features[f"feature_{group}_mean"] = dataf[cols].mean(axis=1)
+            group_features[f"feature_{group}_std"] = dataf[cols].std(axis=1)
+            group_features[f"feature_{group}_skew"] = dataf[cols].skew(axis=1)
+        return NumerFrame(dataf).add_columns(group_features)
 
-# %% ../nbs/03_preprocessing.ipynb 45
+# %% ../nbs/03_preprocessing.ipynb 55
 class KatsuFeatureGenerator(BaseProcessor):
     """
     Effective feature engineering setup based on Katsu's starter notebook.
@@ -379,24 +718,23 @@ class KatsuFeatureGenerator(BaseProcessor):
     def feature_engineering(self, dataf: pd.DataFrame) -> pd.DataFrame:
         """Feature engineering for single ticker."""
         close_series = dataf.loc[:, self.close_col]
+        features = {}
         for x in self.windows:
-            dataf.loc[
-                :, f"feature_{self.close_col}_ROCP_{x}"
-            ] = close_series.pct_change(x)
+            features[f"feature_{self.close_col}_ROCP_{x}"] = close_series.pct_change(x)
 
-            dataf.loc[:, f"feature_{self.close_col}_VOL_{x}"] = (
+            features[f"feature_{self.close_col}_VOL_{x}"] = (
                 np.log1p(close_series).pct_change().rolling(x).std()
             )
 
-            dataf.loc[:, f"feature_{self.close_col}_MA_gap_{x}"] = (
+            features[f"feature_{self.close_col}_MA_gap_{x}"] = (
                 close_series / close_series.rolling(x).mean()
             )
 
-        dataf.loc[:, "feature_RSI"] = self._rsi(close_series)
+        features["feature_RSI"] = self._rsi(close_series)
         macd, macd_signal = self._macd(close_series)
-        dataf.loc[:, "feature_MACD"] = macd
-        dataf.loc[:, "feature_MACD_signal"] = macd_signal
-        return dataf.bfill()
+        features["feature_MACD"] = macd
+        features["feature_MACD_signal"] = macd_signal
+        return NumerFrame(dataf).add_columns(features).bfill()
 
     def _generate_features(self, dataf_list: list) -> pd.DataFrame:
         """Add features for list of ticker DataFrames and concatenate."""
@@ -443,7 +781,7 @@ class KatsuFeatureGenerator(BaseProcessor):
         a = 2 / (span + 1)
         return series.ewm(alpha=a).mean()
 
-# %% ../nbs/03_preprocessing.ipynb 55
+# %% ../nbs/03_preprocessing.ipynb 65
 class EraQuantileProcessor(BaseProcessor):
     """
     Transform features into quantiles on a per-era basis
@@ -513,7 +851,7 @@ class EraQuantileProcessor(BaseProcessor):
             ] = quantiles
             return NumerFrame(dataf)
 
-# %% ../nbs/03_preprocessing.ipynb 59
+# %% ../nbs/03_preprocessing.ipynb 69
 class TickerMapper(BaseProcessor):
     """
     Map ticker from one format to another. \n
@@ -521,39 +859,110 @@ class TickerMapper(BaseProcessor):
     :param target_ticker_format: Format to map tickers to. Must be present in the ticker map. \n
     For default mapper supported ticker formats are: ['ticker', 'bloomberg_ticker', 'yahoo'] \n
     :param mapper_path: Path to CSV file containing at least ticker_col and target_ticker_format columns. \n
-    Can be either a web link of local path. Numerai Signals mapping by default.
+    Can be either a web link of local path. Numerai Signals mapping by default. \n
+    :param cache_dir: Directory in which a parquet copy of the ticker map is stored. \n
+    Set to None to always read directly from mapper_path. \n
+    :param max_cache_age: Number of days after which the cached ticker map is refreshed from mapper_path. \n
+    Set to None to never refresh an existing cache. \n
+    :param refresh: Refresh the cached ticker map from mapper_path on first use, regardless of its age.
     """
 
     def __init__(
         self, ticker_col: str = "ticker", target_ticker_format: str = "bloomberg_ticker",
-        mapper_path: str = "https://numerai-signals-public-data.s3-us-west-2.amazonaws.com/signals_ticker_map_w_bbg.csv"
+        mapper_path: str = "https://numerai-signals-public-data.s3-us-west-2.amazonaws.com/signals_ticker_map_w_bbg.csv",
+        cache_dir: str = "~/.numerblox/ticker_maps",
+        max_cache_age: float = 7,
+        refresh: bool = False,
     ):
         super().__init__()
         self.ticker_col = ticker_col
         self.target_ticker_format = target_ticker_format
 
         self.signals_map_path = mapper_path
-        self.ticker_map = pd.read_csv(self.signals_map_path)
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self.max_cache_age = max_cache_age
+        self.refresh = refresh
+        self._ticker_map = None
+        self._mapping = None
+
+    @property
+    def ticker_map(self) -> pd.DataFrame:
+        """ Full ticker map. Loaded on first use. """
+        if self._ticker_map is None:
+            ticker_map = self._load_ticker_map()
+            assert (
+                self.ticker_col in ticker_map.columns
+            ), f"Ticker column '{self.ticker_col}' is not available in ticker mapping."
+            assert (
+                self.target_ticker_format in ticker_map.columns
+            ), f"Target ticker column '{self.target_ticker_format}' is not available in ticker mapping."
+            self._ticker_map = ticker_map
+        return self._ticker_map
+
+    @property
+    def mapping(self) -> pd.Series:
+        """ Series mapping ticker_col (index) to target_ticker_format (values). """
+        if self._mapping is None:
+            # Last occurrence wins for duplicate tickers (same behaviour as a dict).
+            self._mapping = (
+                self.ticker_map.dropna(subset=[self.ticker_col])
+                .drop_duplicates(subset=self.ticker_col, keep="last")
+                .set_index(self.ticker_col)[self.target_ticker_format]
+            )
+        return self._mapping
 
-        assert (
-            self.ticker_col in self.ticker_map.columns
-        ), f"Ticker column '{self.ticker_col}' is not available in ticker mapping."
-        assert (
-            self.target_ticker_format in self.ticker_map.columns
-        ), f"Target ticker column '{self.target_ticker_format}' is not available in ticker mapping."
-
-        self.mapping = dict(
-            self.ticker_map[[self.ticker_col, self.target_ticker_format]].values
-        )
+    @property
+    def cache_path(self) -> Path:
+        """ Parquet cache location. Unique for every mapper_path. """
+        path_hash = hashlib.md5(str(self.signals_map_path).encode()).hexdigest()[:10]
+        return self.cache_dir / f"{Path(str(self.signals_map_path)).stem}_{path_hash}.parquet"
 
     @display_processor_info
     def transform(
         self, dataf: Union[pd.DataFrame, NumerFrame], *args, **kwargs
     ) -> NumerFrame:
-        dataf[self.target_ticker_format] = dataf[self.ticker_col].map(self.mapping)
+        tickers = dataf[self.ticker_col]
+        if isinstance(tickers.dtype, pd.CategoricalDtype):
+            # Map every category once and gather by category code.
+            codes = tickers.cat.codes.to_numpy()
+            lookup = self.mapping.reindex(tickers.cat.categories).to_numpy(dtype=object)
+        else:
+            # Codes are positions in the ticker map.
+            codes = self.mapping.index.get_indexer(tickers.to_numpy())
+            lookup = self.mapping.to_numpy(dtype=object)
+        # Unknown and missing tickers (code -1) select the trailing NaN.
+        dataf[self.target_ticker_format] = np.append(lookup, np.nan)[codes]
         return NumerFrame(dataf)
 
-# %% ../nbs/03_preprocessing.ipynb 66
+    def _load_ticker_map(self) -> pd.DataFrame:
+        """ Read ticker map from cache if it is still valid. Otherwise read from mapper_path and update cache. """
+        if self.cache_dir is None:
+            return pd.read_csv(self.signals_map_path)
+        cache_path = self.cache_path
+        if cache_path.is_file() and not self.refresh and not self._cache_expired(cache_path):
+            return pd.read_parquet(cache_path)
+        try:
+            ticker_map = pd.read_csv(self.signals_map_path)
+        except OSError as e:
+            if not cache_path.is_file():
+                raise
+            rich_print(f":warning: WARNING: Could not read ticker map from '{self.signals_map_path}' ({e}). Using cached ticker map '{cache_path}'. :warning:")
+            return pd.read_parquet(cache_path)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        ticker_map.to_parquet(cache_path, index=False)
+        return ticker_map
+
+    def _cache_expired(self, cache_path: Path) -> bool:
+        """ Cache is expired if it exceeds max_cache_age or a local mapper_path has been modified since caching. """
+        cache_mtime = cache_path.stat().st_mtime
+        source_path = Path(str(self.signals_map_path))
+        if source_path.is_file() and source_path.stat().st_mtime > cache_mtime:
+            return True
+        if self.max_cache_age is None:
+            return False
+        return (time.time() - cache_mtime) / 86400 > self.max_cache_age
+
+# %% ../nbs/03_preprocessing.ipynb 79
 class SignalsTargetProcessor(BaseProcessor):
     """
     Engineer targets for Numerai Signals. \n
@@ -563,7 +972,8 @@ class SignalsTargetProcessor(BaseProcessor):
     :param price_col: Column from which target will be derived. \n
     :param windows: Timeframes to use for engineering targets. 10 and 20-day by default. \n
     :param bins: Binning used to create group targets. Nomi binning by default. \n
-    :param labels: Scaling for binned target. Must be same length as resulting bins (bins-1). Numerai labels by default.
+    :param labels: Scaling for binned target. Must be same length as resulting bins (bins-1). Numerai labels by default. \n
+    :param ticker_col: Column name for grouping by tickers. Returns are computed separately for every ticker.
     """
 
     def __init__(
@@ -572,34 +982,91 @@ class SignalsTargetProcessor(BaseProcessor):
         windows: list = None,
         bins: list = None,
         labels: list = None,
+        ticker_col: str = "ticker",
     ):
         super().__init__()
         self.price_col = price_col
         self.windows = windows if windows else [10, 20]
         self.bins = bins if bins else [0, 0.05, 0.25, 0.75, 0.95, 1]
         self.labels = labels if labels else [0, 0.25, 0.50, 0.75, 1]
+        self.ticker_col = ticker_col
+        assert len(self.labels) == len(self.bins) - 1, f"Number of labels ({len(self.labels)}) should be equal to number of bins - 1 ({len(self.bins) - 1})."
 
     @display_processor_info
     def transform(self, dataf: NumerFrame) -> NumerFrame:
-        for window in tqdm(self.windows, desc="Signals target engineering windows"):
-            dataf.loc[:, f"target_{window}d_raw"] = (
-                dataf[self.price_col].pct_change(periods=window).shift(-window)
-            )
-            era_groups = dataf.groupby(dataf.meta.era_col)
-
-            dataf.loc[:, f"target_{window}d_rank"] = era_groups[
-                f"target_{window}d_raw"
-            ].rank(pct=True, method="first")
-            dataf.loc[:, f"target_{window}d_group"] = era_groups[
-                f"target_{window}d_rank"
-            ].transform(
-                lambda group: pd.cut(
-                    group, bins=self.bins, labels=self.labels, include_lowest=True
-                )
-            )
-        return NumerFrame(dataf)
+        raw = self._forward_returns(dataf)
+        era_codes = pd.factorize(dataf[dataf.meta.era_col])[0]
+        ranks = self._era_ranks(raw, era_codes)
+        groups = self._bin_ranks(ranks)
+
+        # Order columns as raw, rank and group for every window.
+        targets = np.stack([raw, ranks, groups], axis=2).reshape(len(dataf), -1)
+        target_cols = [f"target_{window}d_{kind}" for window in self.windows for kind in ("raw", "rank", "group")]
+        return NumerFrame(dataf).add_columns(targets, names=target_cols)
+
+    def _forward_returns(self, dataf: pd.DataFrame) -> np.ndarray:
+        """ Forward returns for all windows computed within each ticker. Shape: (rows, windows). """
+        ticker_codes = pd.factorize(dataf[self.ticker_col])[0]
+        # Stable sort keeps the original row order within each ticker.
+        order = np.argsort(ticker_codes, kind="stable")
+        codes = ticker_codes[order]
+        prices = dataf[self.price_col].to_numpy(dtype=np.float64)[order]
+
+        # Forward fill missing prices within each ticker (same as pct_change default).
+        positions = np.arange(len(prices))
+        segment_start = np.r_[True, codes[1:] != codes[:-1]]
+        fill_idx = np.where(~np.isnan(prices) | segment_start, positions, 0)
+        prices = prices[np.maximum.accumulate(fill_idx)]
+
+        sorted_returns = np.full((len(prices), len(self.windows)), np.nan)
+        for i, window in enumerate(self.windows):
+            window_returns = sorted_returns[:-window, i]
+            window_returns[:] = prices[window:] / prices[:-window] - 1
+            # Returns crossing a ticker boundary are invalid.
+            window_returns[codes[window:] != codes[:-window]] = np.nan
+        returns = np.empty_like(sorted_returns)
+        returns[order] = sorted_returns
+        return returns
 
-# %% ../nbs/03_preprocessing.ipynb 70
+    @staticmethod
+    def _era_ranks(values: np.ndarray, era_codes: np.ndarray) -> np.ndarray:
+        """
+        Percentile ranks within each era for all columns at once.
+        Equivalent to groupby(era).rank(pct=True, method="first").
+        """
+        era_order = np.argsort(era_codes, kind="stable")
+        sorted_eras = era_codes[era_order]
+        sorted_values = values[era_order]
+        sorted_ranks = np.full(values.shape, np.nan)
+        bounds = np.flatnonzero(np.r_[True, sorted_eras[1:] != sorted_eras[:-1], True])
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            # Rows without era (code -1) are not ranked.
+            if sorted_eras[start] < 0:
+                continue
+            block = sorted_values[start:end]
+            # Stable sort ranks ties in order of appearance. NaNs are sorted last.
+            block_order = np.argsort(block, axis=0, kind="stable")
+            block_ranks = np.empty(block.shape)
+            np.put_along_axis(block_ranks, block_order, np.arange(1, end - start + 1, dtype=np.float64)[:, None], axis=0)
+            missing = np.isnan(block)
+            block_ranks /= (~missing).sum(axis=0)
+            block_ranks[missing] = np.nan
+            sorted_ranks[start:end] = block_ranks
+        ranks = np.empty_like(sorted_ranks)
+        ranks[era_order] = sorted_ranks
+        return ranks
+
+    def _bin_ranks(self, ranks: np.ndarray) -> np.ndarray:
+        """ Vectorized equivalent of pd.cut(ranks, bins, labels, include_lowest=True). """
+        bins = np.asarray(self.bins, dtype=np.float64)
+        labels = np.asarray(self.labels, dtype=np.float64)
+        # Right-closed intervals. Lowest bin edge is included in the first interval.
+        bin_idx = np.searchsorted(bins, ranks, side="left") - 1
+        bin_idx[ranks == bins[0]] = 0
+        valid = (bin_idx >= 0) & (bin_idx < len(labels))
+        return np.where(valid, labels[np.clip(bin_idx, 0, len(labels) - 1)], np.nan)
+
+# %% ../nbs/03_preprocessing.ipynb 85
 class LagPreProcessor(BaseProcessor):
     """
     Add lag features based on given windows.
@@ -607,7 +1074,11 @@ class LagPreProcessor(BaseProcessor):
     :param windows: All lag windows to process for all features. \n
     [5, 10, 15, 20] by default (4 weeks lookback) \n
     :param ticker_col: Column name for grouping by tickers. \n
-    :param feature_names: All features for which you want to create lags. All features by default.
+    :param feature_names: All features for which you want to create lags. All features by default. \n
+    :param dtype: dtype of lag features (for example np.float32 or np.int8). \n
+    Float features keep their dtype and integer features become float64 by default. \n
+    :param fill_value: Value for lags before the start of a ticker's history. NaN by default. \n
+    Integer dtypes require an integer fill_value and features without NaNs.
     """
 
     def __init__(
@@ -615,24 +1086,48 @@ class LagPreProcessor(BaseProcessor):
         windows: list = None,
         ticker_col: str = "bloomberg_ticker",
         feature_names: list = None,
+        dtype: np.dtype = None,
+        fill_value: float = np.nan,
     ):
         super().__init__()
         self.windows = windows if windows else [5, 10, 15, 20]
         self.ticker_col = ticker_col
         self.feature_names = feature_names
+        self.dtype = dtype
+        self.fill_value = fill_value
+        if self.dtype is not None and np.issubdtype(self.dtype, np.integer):
+            assert not np.isnan(self.fill_value), f"Integer dtype '{np.dtype(self.dtype)}' cannot hold NaN. Set an integer fill_value."
 
     @display_processor_info
     def transform(self, dataf: NumerFrame, *args, **kwargs) -> NumerFrame:
         feature_names = self.feature_names if self.feature_names else dataf.feature_cols
-        ticker_groups = dataf.groupby(self.ticker_col)
-        for feature in tqdm(feature_names, desc="Lag feature generation"):
-            feature_group = ticker_groups[feature]
-            for day in self.windows:
-                shifted = feature_group.shift(day, axis=0)
-                dataf.loc[:, f"{feature}_lag{day}"] = shifted
-        return NumerFrame(dataf)
-
-# %% ../nbs/03_preprocessing.ipynb 76
+        ticker_codes = pd.factorize(dataf[self.ticker_col])[0]
+        # Stable sort keeps the original row order within each ticker.
+        order = np.argsort(ticker_codes, kind="stable")
+        codes = ticker_codes[order]
+        # Work in column-major layout (one contiguous row per feature), which is how pandas stores blocks.
+        features = dataf[feature_names].to_numpy().T
+        dtype = self.dtype if self.dtype is not None else (features.dtype if features.dtype.kind == "f" else np.float64)
+        if np.issubdtype(dtype, np.integer) and features.dtype.kind == "f" and np.isnan(features).any():
+            raise ValueError(f"Features contain NaN, which integer dtype '{np.dtype(dtype)}' cannot hold. Use a float dtype.")
+        features = np.ascontiguousarray(features, dtype=dtype)
+
+        # Lag columns are ordered per feature: {feature}_lag{window} for every window.
+        n_windows = len(self.windows)
+        lags = np.empty((len(feature_names) * n_windows, len(dataf)), dtype=dtype)
+        for i, window in enumerate(self.windows):
+            # Shift the ticker-sorted rows. Lags crossing a ticker boundary or without ticker are invalid.
+            valid = (codes[window:] == codes[:-window]) & (codes[window:] >= 0)
+            source_rows = np.full(len(dataf), -1)
+            source_rows[order[window:][valid]] = order[:-window][valid]
+            lag_block = lags[i::n_windows]
+            np.take(features, source_rows, axis=1, out=lag_block)
+            lag_block[:, source_rows < 0] = self.fill_value
+
+        lag_cols = [f"{feature}_lag{day}" for feature in feature_names for day in self.windows]
+        return NumerFrame(dataf).add_columns(lags.T, names=lag_cols)
+
+# %% ../nbs/03_preprocessing.ipynb 92
 class DifferencePreProcessor(BaseProcessor):
     """
     Add difference features based on given windows. Run LagPreProcessor first.
@@ -659,27 +1154,68 @@ class DifferencePreProcessor(BaseProcessor):
     @display_processor_info
     def transform(self, dataf: NumerFrame, *args, **kwargs) -> NumerFrame:
         feature_names = self.feature_names if self.feature_names else dataf.feature_cols
-        for feature in tqdm(feature_names, desc="Difference feature generation"):
-            lag_columns = dataf.get_pattern_data(f"{feature}_lag").columns
-            if not lag_columns.empty:
-                for day in self.windows:
-                    differenced_values = (
-                        (dataf[feature] / dataf[f"{feature}_lag{day}"]) - 1
-                        if self.pct_diff
-                        else dataf[feature] - dataf[f"{feature}_lag{day}"]
-                    )
-                    dataf[f"{feature}_diff{day}"] = differenced_values
-                    if self.abs_diff:
-                        dataf[f"{feature}_absdiff{day}"] = np.abs(
-                            dataf[f"{feature}_diff{day}"]
-                        )
+        lag_map = self._lag_column_map(dataf, feature_names)
+        features = list(lag_map)
+        if not features:
+            return NumerFrame(dataf)
+
+        # Column-major blocks (one contiguous row per feature), which is how pandas stores blocks.
+        base = dataf[features].to_numpy().T
+        dtype = base.dtype if base.dtype.kind == "f" else np.float64
+        base = np.ascontiguousarray(base, dtype=dtype)
+
+        # Output columns are ordered per feature: {feature}_diff{window} (and {feature}_absdiff{window}) for every window.
+        n_outputs = 2 if self.abs_diff else 1
+        stride = len(self.windows) * n_outputs
+        diffs = np.empty((len(features) * stride, len(dataf)), dtype=dtype)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for i, lag_cols in enumerate(zip(*lag_map.values())):
+                lags = np.ascontiguousarray(dataf[list(lag_cols)].to_numpy().T, dtype=dtype)
+                diff_block = diffs[i * n_outputs::stride]
+                if self.pct_diff:
+                    np.divide(base, lags, out=diff_block)
+                    diff_block -= 1
+                else:
+                    np.subtract(base, lags, out=diff_block)
+                if self.abs_diff:
+                    np.abs(diff_block, out=diffs[i * n_outputs + 1::stride])
+
+        diff_cols = []
+        for feature in features:
+            for day in self.windows:
+                diff_cols.append(f"{feature}_diff{day}")
+                if self.abs_diff:
+                    diff_cols.append(f"{feature}_absdiff{day}")
+        return NumerFrame(dataf).add_columns(diffs.T, names=diff_cols)
+
+    def _lag_column_map(self, dataf: NumerFrame, feature_names: list) -> dict:
+        """
+        Resolve lag columns for all features in one pass over the columns.
+        Features without lag columns are skipped with a warning.
+        :return: Mapping of feature to its lag column for every window.
+        """
+        lag_prefixes = set()
+        for col in dataf.columns:
+            # Every prefix that precedes a '_lag' in the column name.
+            idx = col.find("_lag")
+            while idx != -1:
+                lag_prefixes.add(col[:idx])
+                idx = col.find("_lag", idx + 1)
+        lag_map, skipped = {}, []
+        for feature in feature_names:
+            if feature in lag_prefixes:
+                lag_map[feature] = [f"{feature}_lag{day}" for day in self.windows]
             else:
-                rich_print(
-                    f":warning: WARNING: Skipping {feature}. Lag features for feature: {feature} were not detected. Have you already run LagPreProcessor? :warning:"
-                )
-        return NumerFrame(dataf)
+                skipped.append(feature)
+        if skipped:
+            rich_print(
+                f":warning: WARNING: Skipping {len(skipped)} features: {skipped}. Lag features for these features were not detected. Have you already run LagPreProcessor? :warning:"
+            )
+        missing_cols = set(col for cols in lag_map.values() for col in cols) - set(dataf.columns)
+        assert not missing_cols, f"Lag columns {sorted(missing_cols)} not found. Run LagPreProcessor with windows {self.windows}."
+        return lag_map
 
-# %% ../nbs/03_preprocessing.ipynb 81
+# %% ../nbs/03_preprocessing.ipynb 98
 class PandasTaFeatureGenerator:
     """
     Generate features with pandas-ta.
@@ -692,51 +1228,198 @@ class PandasTaFeatureGenerator:
     :param ticker_col: Column name for grouping by tickers. \n
     :param num_cores: Number of cores to use for multiprocessing. \n
     By default, all available cores are used. \n
+    :param batch_size: Approximate number of rows per batch of tickers sent to a worker. \n
+    By default, rows are split in 4 batches per core. \n
+    :param store_dir: Directory for incremental append mode. Disabled by default. \n
+    In append mode, only rows newer than the last stored date of a ticker are processed. \n
+    Indicators are recomputed over the stored warm-up tail of each ticker and the new rows. \n
+    The new rows with features are returned and appended to the stored feature table (see `load_features`). \n
+    :param date_col: Column (or index) with dates used to detect new rows in append mode. \n
+    :param warmup: Number of trailing rows per ticker kept as warm-up for the next run. \n
+    By default, the longest length in the strategy. \n
+    Smoothed indicators (like RSI) converge closer to a full history run with a longer warm-up. \n
+    :param max_parts: Maximum number of stored feature files in append mode. \n
+    Files are merged into one when an append run exceeds it. \n
     """
     def __init__(self, 
                  strategy: ta.Strategy = None,
                  ticker_col: str = "ticker",
                  num_cores: int = None,
+                 batch_size: int = None,
+                 store_dir: str = None,
+                 date_col: str = "date",
+                 warmup: int = None,
+                 max_parts: int = 32,
     ):
         super().__init__()
         self.ticker_col = ticker_col
         self.num_cores = num_cores if num_cores else os.cpu_count()
+        self.batch_size = batch_size
         standard_strategy = ta.Strategy(name="standard", 
                                         ta=[{"kind": "rsi", "length": 14, "col_names": ("feature_RSI_14")},
                                             {"kind": "rsi", "length": 60, "col_names": ("feature_RSI_60")}])
         self.strategy = strategy if strategy is not None else standard_strategy
+        self.store_dir = Path(store_dir).expanduser() if store_dir else None
+        self.date_col = date_col
+        if warmup is None:
+            lengths = [value for indicator in self.strategy.ta for key, value in indicator.items()
+                       if isinstance(value, int) and not isinstance(value, bool)]
+            assert lengths or not self.store_dir, "No indicator lengths found in strategy. Define warmup for append mode."
+            warmup = max(lengths, default=0)
+        self.warmup = warmup
+        assert max_parts >= 1, f"max_parts should be at least 1. Got '{max_parts}'."
+        self.max_parts = max_parts
 
     @display_processor_info
     def transform(self, dataf: Union[pd.DataFrame, NumerFrame]) -> NumerFrame:
         """
         Main feature generation method. \n 
         :param dataf: DataFrame with columns: [ticker, date, open, high, low, close, volume] \n
-        :return: DataFrame with features added.
+        :return: DataFrame with features added. Only new rows in append mode.
         """
-        dataf_list = [
-            x
-            for _, x in tqdm(
-                dataf.groupby(self.ticker_col), desc="Generating ticker DataFrames"
-            )
-        ]
-        dataf = self._generate_features(dataf_list=dataf_list)
+        if self.store_dir is not None:
+            return NumerFrame(self._append(dataf))
+        dataf, _ = self._add_features(dataf)
         return NumerFrame(dataf)
+
+    def load_features(self) -> NumerFrame:
+        """ Load the full stored feature table of append mode. """
+        assert self.store_dir is not None, "load_features is only available in append mode. Define store_dir."
+        part_paths = sorted((self.store_dir / "features").glob("part-*.parquet"))
+        assert part_paths, f"No stored features found in '{self.store_dir}'."
+        return NumerFrame(pd.concat([pd.read_parquet(path) for path in part_paths]))
+
+    def _add_features(self, dataf: pd.DataFrame) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        Group rows per ticker (in sorted ticker order) and add features.
+        :param dataf: DataFrame with columns: [ticker, date, open, high, low, close, volume] \n
+        :return: DataFrame with features added and the positions of its rows in the input.
+        """
+        ticker_codes, tickers = pd.factorize(dataf[self.ticker_col], sort=True)
+        # Stable sort keeps the row order within each ticker.
+        order = np.argsort(ticker_codes, kind="stable")
+        order = order[ticker_codes[order] >= 0]
+        dataf = dataf.take(order)
+        ticker_bounds = np.searchsorted(ticker_codes[order], np.arange(len(tickers) + 1))
+        feature_dataf = self._generate_features(dataf, ticker_bounds=ticker_bounds)
+        return NumerFrame(dataf).add_columns(feature_dataf), order
+
+    def _append(self, dataf: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add features for rows that are newer than the stored history of their ticker.
+        Indicators are computed over the stored warm-up tail and the new rows only.
+        :param dataf: DataFrame with new rows (earlier rows are skipped).
+        :return: New rows with features added.
+        """
+        tail_path = self.store_dir / "tail.parquet"
+        parts_dir = self.store_dir / "features"
+        parts_dir.mkdir(parents=True, exist_ok=True)
+        tail = pd.read_parquet(tail_path) if tail_path.exists() else dataf.iloc[:0]
+
+        # Rows after the last stored date of their ticker. Unknown tickers are new.
+        last_dates = pd.Series(self._dates(tail)).groupby(tail[self.ticker_col].to_numpy()).max()
+        last_dates = dataf[self.ticker_col].map(last_dates).to_numpy()
+        new_rows = pd.isna(last_dates)
+        new_rows[~new_rows] = self._dates(dataf)[~new_rows] > last_dates[~new_rows]
+        if not new_rows.any():
+            rich_print(f":warning: WARNING: No new rows found compared to store '{self.store_dir}'. :warning:")
+            return dataf.iloc[:0]
+        new_dataf = dataf[new_rows]
+
+        history = pd.concat([tail, new_dataf[tail.columns]]) if len(tail) else new_dataf
+        is_new = np.arange(len(history)) >= len(history) - len(new_dataf)
+        history_features, order = self._add_features(history)
+        new_features = history_features[is_new[order]]
+
+        part_paths = sorted(parts_dir.glob("part-*.parquet"))
+        # Parts are numbered in order of appending. Numbers continue after the last part, also after compaction.
+        part_idx = int(part_paths[-1].stem.split("-")[1]) + 1 if part_paths else 0
+        new_features.to_parquet(parts_dir / f"part-{part_idx:06d}.parquet")
+        if len(part_paths) + 1 > self.max_parts:
+            self._compact_parts(parts_dir)
+        # Keep the last warmup rows of every ticker for the next run.
+        tail = history.groupby(self.ticker_col, sort=False).tail(self.warmup)
+        tail.to_parquet(tail_path.with_suffix(".tmp"))
+        os.replace(tail_path.with_suffix(".tmp"), tail_path)
+        return new_features
+
+    def _compact_parts(self, parts_dir: Path):
+        """
+        Merge all stored feature parts into a single part with the number of the last part.
+        :param parts_dir: Directory with part-*.parquet files.
+        """
+        part_paths = sorted(parts_dir.glob("part-*.parquet"))
+        compacted_path = parts_dir / "compacted.tmp"
+        pd.concat([pd.read_parquet(path) for path in part_paths]).to_parquet(compacted_path)
+        os.replace(compacted_path, part_paths[-1])
+        for path in part_paths[:-1]:
+            path.unlink()
+
+    def _dates(self, dataf: pd.DataFrame) -> np.ndarray:
+        """ Dates from date_col column or index level. """
+        if self.date_col in dataf.columns:
+            return dataf[self.date_col].to_numpy()
+        return dataf.index.get_level_values(self.date_col).to_numpy()
     
-    def _generate_features(self, dataf_list: List[pd.DataFrame]) -> pd.DataFrame:
+    def _generate_features(self, dataf: pd.DataFrame, ticker_bounds: np.ndarray) -> pd.DataFrame:
         """
-        Add features for list of ticker DataFrames and concatenate.
-        :param dataf_list: List of DataFrames for each ticker.
-        :return: Concatenated DataFrame for all full list with features added.
+        Add features for batches of tickers. Numeric input columns are placed in shared memory once.
+        Workers only receive row bounds and return the new indicator columns as arrays.
+        :param dataf: DataFrame with rows grouped by ticker.
+        :param ticker_bounds: Start row of every ticker followed by the total number of rows.
+        :return: DataFrame with all generated features, aligned with dataf.
         """
-        with Pool(self.num_cores) as p:
-            feature_datafs = list(
-                tqdm(
-                    p.imap(self.add_features, dataf_list),
-                    desc="Generating pandas-ta features",
-                    total=len(dataf_list),
-                )
-            )
-        return pd.concat(feature_datafs)
+        if dataf.empty:
+            return pd.DataFrame(index=dataf.index)
+        input_cols = dataf.select_dtypes("number").columns.tolist()
+        values = dataf[input_cols].to_numpy(dtype=np.float64).T
+        shm = SharedMemory(create=True, size=max(values.nbytes, 1))
+        try:
+            shared_values = np.ndarray(values.shape, dtype=np.float64, buffer=shm.buf)
+            shared_values[:] = values
+            del values
+            tasks = [(bounds, dataf.index[bounds[0]:bounds[-1]]) for bounds in self._batch_bounds(ticker_bounds)]
+            if self.num_cores > 1:
+                init_args = (self, input_cols, shm.name, shared_values.shape, _resource_tracker_id())
+                with Pool(self.num_cores, initializer=_init_pandas_ta_worker, initargs=init_args) as p:
+                    results = list(
+                        tqdm(
+                            p.imap_unordered(_pandas_ta_batch, tasks),
+                            desc="Generating pandas-ta features",
+                            total=len(tasks),
+                        )
+                    )
+            else:
+                _PANDAS_TA_WORKER.update(generator=self, input_cols=input_cols, values=shared_values)
+                try:
+                    results = [_pandas_ta_batch(task) for task in tqdm(tasks, desc="Generating pandas-ta features")]
+                finally:
+                    _PANDAS_TA_WORKER.clear()
+            del shared_values
+        finally:
+            shm.close()
+            shm.unlink()
+
+        # Stitch indicator columns in by row position. Column-major so the block is stored without transposing.
+        feature_cols = list(dict.fromkeys(col for _, cols, _ in results for col in cols))
+        col_positions = {col: i for i, col in enumerate(feature_cols)}
+        features = np.full((len(feature_cols), len(dataf)), np.nan)
+        for start, cols, batch_features in results:
+            features[[col_positions[col] for col in cols], start:start + len(batch_features)] = batch_features.T
+        return pd.DataFrame(features.T, columns=feature_cols, index=dataf.index)
+
+    def _batch_bounds(self, ticker_bounds: np.ndarray) -> List[np.ndarray]:
+        """
+        Split tickers into contiguous batches of roughly batch_size rows.
+        :param ticker_bounds: Start row of every ticker followed by the total number of rows.
+        :return: Ticker bounds for every batch.
+        """
+        n_rows = ticker_bounds[-1]
+        batch_size = self.batch_size if self.batch_size else -(-n_rows // (self.num_cores * 4))
+        # Every batch starts at the ticker that contains its first target row.
+        splits = np.unique(np.searchsorted(ticker_bounds, np.arange(0, n_rows, batch_size), side="right") - 1)
+        splits = np.append(splits, len(ticker_bounds) - 1)
+        return [ticker_bounds[start:end + 1] for start, end in zip(splits[:-1], splits[1:])]
 
     def add_features(self, ticker_df: pd.DataFrame) -> pd.DataFrame:
         """ 
@@ -749,7 +1432,172 @@ class PandasTaFeatureGenerator:
         ticker_df.ta.strategy(self.strategy)
         return ticker_df
 
-# %% ../nbs/03_preprocessing.ipynb 90
+
+# State of a pandas-ta worker process, set once by the Pool initializer.
+_PANDAS_TA_WORKER = {}
+
+
+def _resource_tracker_id():
+    """ Identify the resource tracker of this process by its pipe. Processes started by a Pool normally share it. """
+    return os.fstat(resource_tracker.getfd()).st_ino if os.name == "posix" else None
+
+
+def _init_pandas_ta_worker(generator: PandasTaFeatureGenerator, input_cols: list, shm_name: str, shape: tuple,
+                           tracker_id: int = None):
+    """ Set up a pandas-ta worker. Shared input values are attached for every batch. """
+    _PANDAS_TA_WORKER.update(
+        generator=generator, input_cols=input_cols, shm_name=shm_name, shape=shape,
+        own_tracker=_resource_tracker_id() != tracker_id,
+    )
+
+
+def _pandas_ta_batch(task: tuple) -> Tuple[int, list, np.ndarray]:
+    """
+    Run the pandas-ta strategy for every ticker in a batch.
+    :param task: Tuple of ticker bounds and index for the batch rows.
+    :return: Start row of the batch, names of new columns and their values.
+    """
+    if "values" in _PANDAS_TA_WORKER:
+        return _pandas_ta_tickers(task, _PANDAS_TA_WORKER["values"])
+    shm = SharedMemory(name=_PANDAS_TA_WORKER["shm_name"])
+    if _PANDAS_TA_WORKER["own_tracker"]:
+        # The parent process owns the shared memory. Don't let the resource tracker of this worker remove it.
+        resource_tracker.unregister(shm._name, "shared_memory")
+    values = np.ndarray(_PANDAS_TA_WORKER["shape"], dtype=np.float64, buffer=shm.buf)
+    try:
+        return _pandas_ta_tickers(task, values)
+    finally:
+        del values
+        shm.close()
+
+
+def _pandas_ta_tickers(task: tuple, values: np.ndarray) -> Tuple[int, list, np.ndarray]:
+    """
+    Run the pandas-ta strategy for every ticker in a batch.
+    :param task: Tuple of ticker bounds and index for the batch rows.
+    :param values: Input values (columns x rows) of all tickers.
+    :return: Start row of the batch, names of new columns and their values.
+    """
+    ticker_bounds, index = task
+    generator, input_cols = _PANDAS_TA_WORKER["generator"], _PANDAS_TA_WORKER["input_cols"]
+    start = ticker_bounds[0]
+    ticker_features = []
+    for ticker_start, ticker_end in zip(ticker_bounds[:-1], ticker_bounds[1:]):
+        if ticker_end == ticker_start:
+            continue
+        ticker_df = pd.DataFrame(
+            values[:, ticker_start:ticker_end].T.copy(),
+            columns=input_cols,
+            index=index[ticker_start - start:ticker_end - start],
+        )
+        ticker_df = generator.add_features(ticker_df)
+        ticker_features.append(ticker_df.drop(columns=input_cols))
+    batch_features = pd.concat(ticker_features)
+    return start, batch_features.columns.tolist(), batch_features.to_numpy(dtype=np.float64)
+
+# %% ../nbs/03_preprocessing.ipynb 109
+class FridayResamplePreProcessor(BaseProcessor):
+    """
+    Resample daily price data to weekly data with Friday eras.
+
+    :param ticker_col: Column with tickers. \n
+    :param date_col: Column (or index) with dates of daily bars. \n
+    :param aggregations: Mapping of column name to aggregation ('first', 'last', 'max', 'min', 'sum' or 'mean'). \n
+    By default, OHLCV columns that are present are aggregated (open: first, high: max, low: min, close and adjusted_close: last, volume: sum). \n
+    Columns without aggregation are dropped.
+    """
+    DEFAULT_AGGREGATIONS = {"open": "first", "high": "max", "low": "min", "close": "last",
+                            "adjusted_close": "last", "volume": "sum"}
+
+    def __init__(self, ticker_col: str = "ticker", date_col: str = "date", aggregations: dict = None):
+        super().__init__()
+        self.ticker_col = ticker_col
+        self.date_col = date_col
+        self.aggregations = aggregations
+        if aggregations:
+            invalid = set(aggregations.values()) - {"first", "last", "max", "min", "sum", "mean"}
+            assert not invalid, f"Aggregations {invalid} are not supported."
+
+    @display_processor_info
+    def transform(self, dataf: Union[pd.DataFrame, NumerFrame], *args, **kwargs) -> NumerFrame:
+        dates = dataf[self.date_col] if self.date_col in dataf.columns else dataf.index.get_level_values(self.date_col)
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            days = pd.to_datetime(dates).to_numpy().astype("datetime64[D]")
+        else:
+            # Parse every distinct date string once.
+            date_codes, unique_dates = pd.factorize(dates)
+            unique_days = pd.to_datetime(unique_dates).to_numpy().astype("datetime64[D]")
+            days = np.append(unique_days, np.datetime64("NaT", "D"))[date_codes]
+        ticker_codes = pd.factorize(dataf[self.ticker_col])[0]
+        valid = (ticker_codes >= 0) & ~np.isnat(days)
+        days = days.astype(np.int64)
+        # Day 0 (1970-01-01) is a Thursday. Move every day forward to the Friday of its week.
+        fridays = days + (1 - days) % 7
+
+        # Sort bars by ticker and date. Data from EODDownloader is usually sorted already.
+        rows = np.flatnonzero(valid)
+        codes, days, fridays = ticker_codes[rows], days[rows], fridays[rows]
+        sort_key = codes * (days.max(initial=0) - days.min(initial=0) + 1) + (days - days.min(initial=0))
+        if not np.all(sort_key[1:] >= sort_key[:-1]):
+            order = np.argsort(sort_key, kind="stable")
+            rows, codes, days, fridays = rows[order], codes[order], days[order], fridays[order]
+        # Every ticker-week is a contiguous segment. No segments without valid rows.
+        starts = np.flatnonzero(np.r_[len(rows) > 0, (codes[1:] != codes[:-1]) | (fridays[1:] != fridays[:-1])])
+        ends = np.r_[starts[1:], len(rows)]
+
+        aggregations = self.aggregations if self.aggregations else {col: agg for col, agg in self.DEFAULT_AGGREGATIONS.items()
+                                                                    if col in dataf.columns}
+        columns = {self.ticker_col: dataf[self.ticker_col].to_numpy()[rows[starts]],
+                   "friday_date": self._yyyymmdd(fridays[starts]),
+                   self.date_col: days[ends - 1].astype("datetime64[D]")}
+        for col, agg in aggregations.items():
+            values = dataf[col].to_numpy(dtype=np.float64)[rows]
+            columns[col] = self._segment_reduce(values, agg, starts, ends)
+        return NumerFrame(pd.DataFrame(columns))
+
+    @staticmethod
+    def _segment_reduce(values: np.ndarray, agg: str, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Reduce contiguous segments of values. NaNs are ignored.
+        :param values: Sorted values.
+        :param agg: Aggregation ('first', 'last', 'max', 'min', 'sum' or 'mean').
+        :param starts: Start positions of segments.
+        :param ends: End positions (exclusive) of segments.
+        :return: Aggregated value for every segment.
+        """
+        if not len(starts):
+            return np.empty(0)
+        valid = ~np.isnan(values)
+        if agg in ("first", "last"):
+            # Position of first or last valid value in each segment.
+            positions = np.arange(len(values))
+            if agg == "first":
+                idx = np.minimum.reduceat(np.where(valid, positions, len(values)), starts)
+                found = idx < ends
+            else:
+                idx = np.maximum.reduceat(np.where(valid, positions, -1), starts)
+                found = idx >= starts
+            return np.where(found, values[np.where(found, idx, 0)], np.nan)
+        if agg == "max":
+            return np.fmax.reduceat(values, starts)
+        if agg == "min":
+            return np.fmin.reduceat(values, starts)
+        sums = np.add.reduceat(np.where(valid, values, 0.), starts)
+        if agg == "sum":
+            return sums
+        with np.errstate(invalid="ignore"):
+            return sums / np.add.reduceat(valid, starts)
+
+    @staticmethod
+    def _yyyymmdd(days: np.ndarray) -> np.ndarray:
+        """ Convert days since epoch to YYYYMMDD integers. """
+        dates = days.astype("datetime64[D]")
+        months = dates.astype("datetime64[M]")
+        years = months.astype("datetime64[Y]")
+        return ((years.astype(np.int64) + 1970) * 10000 + (months.astype(np.int64) % 12 + 1) * 100
+                + (dates - months).astype(np.int64) + 1)
+
+# %% ../nbs/03_preprocessing.ipynb 113
 class AwesomePreProcessor(BaseProcessor):
     """ TEMPLATE - Do some awesome preprocessing. """
     def __init__(self):